@@ -0,0 +1,188 @@
+"""
+Innovation Socratic MCP - Classifier Keyword Matching Benchmark
+키워드 검색 방식 비교: 이전 방식(키워드마다 부분 문자열 검색) vs KeywordIndex
+(공백 단위 단어마다 캐시 조회 한 번, 처음 보는 단어만 KeywordMatcher로 검색)
+
+KeywordIndex는 두 번 잽니다:
+- warm: 같은 텍스트 반복 (단어가 모두 캐시에 있음)
+- cold: 호출마다 캐시를 비움 (모든 단어를 처음 봄 - 처음 보는 문제의 최악 경우)
+
+그리고 classify() 반복 호출과 classify_many() 배치 분류의 처리량 비교
+(classify_many는 단어 캐시를 비운 뒤 잼)
+
+사용법:
+    python scripts/bench_classifier.py
+    python scripts/bench_classifier.py --repeat 2000 --batch 200000
+    python scripts/bench_classifier.py --corpus-dir knowledge  # 실제 문서 문장으로 배치 측정
+
+측정 예 (CPU 1개 VM, 100,000개, 여러 번 실행한 범위):
+    기본 코퍼스 (키워드 위주, 서로 다른 단어 약 110개)
+        classify() 반복 21-33k/s, classify_many() 110-165k/s (부분 문자열 엔진 약 120k/s)
+    --corpus-dir knowledge (5-20단어 문장, 서로 다른 단어 약 47,000개)
+        classify() 반복 26-33k/s, classify_many() 91-106k/s
+    서로 다른 단어가 많을수록 처음 보는 단어 검색 비용이 커집니다.
+
+KeywordIndex는 단어 경계를 지키므로 부분 문자열 검색과 결과가 다를 수 있습니다
+(--diff로 샘플별 차이 출력). classify_many()는 classify()와 같은지 확인합니다.
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.classifier import NUMPY_AVAILABLE, ProblemClassifier
+
+SAMPLES = {
+    "short-ko": (
+        "우리 팀은 신제품 출시를 앞두고 미래 시장 전략과 투자 결정을 고민하고 있습니다. "
+        "왜 실패할까요? 왜?"
+    ),
+    "short-en": (
+        "Why does our product keep losing customers? Why now? "
+        "We need a decision on the investment."
+    ),
+    "sparse": (
+        "긴 설명이 이어집니다. 많은 문장이 있지만 관련 단어는 드뭅니다. "
+        "the quick brown fox jumps over the lazy dog. "
+    ),
+    "false-hits": (
+        "팀원들과 스팀 게임을 했고, abuser 계정과 users 목록을 정리했습니다. "
+        "이유식도 샀어요."
+    ),
+}
+
+
+def legacy_count(classifier: ProblemClassifier, text: str) -> Dict[str, int]:
+    """변경 전 방식 (키워드마다 in/count 부분 문자열 검색)"""
+    text_lower = text.lower()
+    return {
+        keyword: text_lower.count(keyword)
+        for keyword in classifier._index.keywords
+        if keyword in text_lower
+    }
+
+
+def timeit(fn: Callable[[], object], repeat: int, rounds: int = 5) -> float:
+    """호출당 평균 마이크로초 (rounds번 측정 중 최솟값 - 다른 프로세스 영향 줄이기)"""
+    fn()
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            fn()
+        best = min(best, time.perf_counter() - start)
+    return best / repeat * 1e6
+
+
+def make_corpus(keywords: Tuple[str, ...], count: int, seed: int = 7) -> List[str]:
+    """키워드와 일반 단어를 섞은 짧은 문제 문장들"""
+    rng = random.Random(seed)
+    words = list(keywords) + [
+        "우리", "그리고", "있습니다", "the", "our", "we", "Team", "WHY", "Product",
+        "팀은", "고객들이", "users", "decisions",
+    ]
+    return [" ".join(rng.choice(words) for _ in range(rng.randint(3, 15))) for _ in range(count)]
+
+
+def sample_corpus(directory: str, count: int, seed: int = 3) -> List[str]:
+    """디렉토리의 .md/.txt 문서에서 뽑은 5-20단어 문장들"""
+    words: List[str] = []
+    for path in sorted(Path(directory).rglob("*")):
+        if path.suffix in (".md", ".txt") and path.is_file():
+            words.extend(path.read_text(encoding="utf-8", errors="ignore").split())
+    if len(words) < 20:
+        raise SystemExit(f"not enough text in {directory}")
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(count):
+        start = rng.randrange(len(words) - 20)
+        corpus.append(" ".join(words[start:start + rng.randint(5, 20)]))
+    return corpus
+
+
+def bench_batch(classifier: ProblemClassifier, corpus: List[str]) -> int:
+    """classify() 반복 vs classify_many() 처리량, 결과 일치 확인"""
+    count = len(corpus)
+    sample = corpus[:min(count, 20_000)]
+
+    # 단어 캐시가 빈 상태에서 배치 분류 (classify() 반복이 캐시를 채우기 전)
+    classifier._index.clear_cache()
+    start = time.perf_counter()
+    batch = classifier.classify_many(corpus)
+    batch_rate = count / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    expected = [classifier.classify(problem) for problem in sample]
+    loop_rate = len(sample) / (time.perf_counter() - start)
+
+    mismatches = sum(
+        1 for i, result in enumerate(expected)
+        if batch[i]["category"] != result["category"]
+        or abs(batch[i]["confidence"] - result["confidence"]) > 1e-9
+        or batch[i]["recommended_method_ids"] != [m["id"] for m in result["recommended_methods"]]
+    )
+    distinct = len(set(" ".join(corpus).lower().split()))
+    print(f"\nBatch of {count} problems ({distinct} distinct words):")
+    print(f"  classify() loop   {loop_rate:>12,.0f} problems/s")
+    print(f"  classify_many()   {batch_rate:>12,.0f} problems/s")
+    if mismatches:
+        print(f"❌ {mismatches} of {len(sample)} batch results differ from classify()")
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare classifier keyword matching strategies')
+    parser.add_argument('--repeat', type=int, default=1000, help='Calls per measurement')
+    parser.add_argument(
+        '--pages', type=int, default=50, help='Copies of each sample for the long text'
+    )
+    parser.add_argument(
+        '--batch', type=int, default=100_000, help='Problems for classify_many (0 = skip)'
+    )
+    parser.add_argument(
+        '--corpus-dir', help='Sample batch problems from .md/.txt files in this directory'
+    )
+    parser.add_argument('--diff', action='store_true', help='Show keywords only one strategy finds')
+    args = parser.parse_args()
+
+    classifier = ProblemClassifier()
+    index = classifier._index
+
+    texts = dict(SAMPLES)
+    for name, text in SAMPLES.items():
+        texts[f"{name} x{args.pages}"] = (text + " ") * args.pages
+
+    print(f"{len(index.keywords)} keywords, {args.repeat} calls per measurement (us/call)\n")
+    header = f"{'text':<18}{'chars':>8}{'substring':>12}{'index warm':>12}{'index cold':>12}"
+    print(header)
+    print("-" * len(header))
+
+    for name, text in texts.items():
+        repeat = max(args.repeat // max(len(text) // 1000, 1), 20)
+        legacy = timeit(lambda: legacy_count(classifier, text), repeat)
+        warm = timeit(lambda: index.count(text), repeat)
+        cold = timeit(lambda: (index.clear_cache(), index.count(text)), repeat)
+        print(f"{name:<18}{len(text):>8}{legacy:>12.1f}{warm:>12.1f}{cold:>12.1f}")
+        if args.diff and name in SAMPLES:
+            substring_only = sorted(set(legacy_count(classifier, text)) - set(index.count(text)))
+            index_only = sorted(set(index.count(text)) - set(legacy_count(classifier, text)))
+            print(f"    substring only: {substring_only}  index only: {index_only}")
+
+    if args.batch > 0:
+        if not NUMPY_AVAILABLE:
+            print("numpy not installed - skipping classify_many")
+        elif bench_batch(classifier, (
+            sample_corpus(args.corpus_dir, args.batch) if args.corpus_dir
+            else make_corpus(index.keywords, args.batch)
+        )):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+"""
+Innovation Socratic MCP - Session Memory Benchmark
+활성 세션 N개를 메모리에 올렸을 때 세션당 바이트 비교 (이전 dataclass vs 현재 SessionState)
+
+사용법:
+    python scripts/bench_session_memory.py --sessions 100000
+
+세션은 저장소에서 로드한 것처럼 JSON 디코딩한 딕셔너리로 생성합니다
+(방법론 이름/카테고리 문자열이 세션마다 따로 할당되는 실제 상황).
+"""
+
+import gc
+import json
+import random
+import sys
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.session import SessionState
+
+
+@dataclass
+class LegacySessionState:
+    """변경 전 SessionState (비교용)"""
+    session_id: str
+    user_id: str
+    problem: str
+    category: str
+    method_id: str
+    method_name: str
+    current_step: int
+    total_steps: int
+    answers: List[str]
+    created_at: str
+    updated_at: str
+    is_completed: bool = False
+
+
+METHODS = [
+    ("scamper", "SCAMPER", "creative"),
+    ("six_hats", "Six Thinking Hats", "creative"),
+    ("five_whys", "5 Whys", "analytical"),
+    ("first_principles", "First Principles", "analytical"),
+    ("swot", "SWOT Analysis", "strategic"),
+    ("design_thinking", "Design Thinking", "systems"),
+]
+
+
+def make_records(count: int, seed: int = 42) -> List[str]:
+    """저장 형식(JSON) 세션 레코드 생성"""
+    rng = random.Random(seed)
+    base = datetime(2025, 1, 1)
+    records = []
+    for i in range(count):
+        method_id, method_name, category = rng.choice(METHODS)
+        total = rng.randint(5, 10)
+        step = rng.randint(0, total)
+        created = base + timedelta(
+            seconds=rng.randint(0, 86400 * 30), microseconds=rng.randint(0, 999999)
+        )
+        records.append(json.dumps({
+            "session_id": f"{i:016x}",
+            "user_id": f"user-{rng.randint(0, count // 20)}",
+            "problem": "신규 고객을 늘리기 위한 서비스 개선 아이디어가 필요합니다",
+            "category": category,
+            "method_id": method_id,
+            "method_name": method_name,
+            "current_step": step,
+            "total_steps": total,
+            "answers": [f"답변 {n}" for n in range(step)],
+            "created_at": created.isoformat(),
+            "updated_at": (created + timedelta(minutes=step)).isoformat(),
+            "is_completed": step == total,
+        }, ensure_ascii=False))
+    return records
+
+
+def measure(build: Callable[[Dict[str, Any]], Any], records: List[str]) -> float:
+    """세션 하나당 할당 바이트 (레코드 문자열 자체는 제외)"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    sessions = [build(json.loads(record)) for record in records]
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    per_session = (after - before) / len(sessions)
+    del sessions
+    return per_session
+
+
+def measure_serialize(sessions: List[Any], to_dict: Callable[[Any], Dict[str, Any]]) -> float:
+    """to_dict 1회 평균 시간 (마이크로초)"""
+    import time
+    start = time.perf_counter()
+    for session in sessions:
+        to_dict(session)
+    return (time.perf_counter() - start) / len(sessions) * 1_000_000
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description='Compare SessionState memory footprint')
+    parser.add_argument('--sessions', type=int, default=100_000, help='Number of sessions')
+    args = parser.parse_args()
+
+    records = make_records(args.sessions)
+    legacy = measure(lambda d: LegacySessionState(**d), records)
+    compact = measure(SessionState.from_dict, records)
+
+    sample = [json.loads(r) for r in records[:10_000]]
+    legacy_ser = measure_serialize([LegacySessionState(**d) for d in sample], asdict)
+    compact_ser = measure_serialize(
+        [SessionState.from_dict(d) for d in sample], SessionState.to_dict
+    )
+
+    print(f"sessions: {args.sessions}")
+    print(f"before: {legacy:8.0f} bytes/session, to_dict {legacy_ser:5.2f}us")
+    print(f"after:  {compact:8.0f} bytes/session, to_dict {compact_ser:5.2f}us")
+    print(f"saved:  {legacy - compact:8.0f} bytes/session ({(1 - compact / legacy) * 100:.0f}%)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""
+Innovation Socratic MCP - Method Vector Builder
+방법론 벡터 행렬을 미리 만들어 저장하고 추천 지연 시간을 측정
+
+사용법:
+    python scripts/build_method_vectors.py
+    python scripts/build_method_vectors.py --embedder sentence-transformers \
+        --dir data/method_vectors
+
+서버는 INNOVATION_SOCRATIC_RECOMMENDER=embedding일 때 이 파일들을 메모리 매핑으로
+읽습니다 (없거나 카탈로그가 바뀌었으면 처음 사용할 때 자동으로 만듭니다).
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.recommender import NUMPY_AVAILABLE, MethodRecommender, create_embedder
+
+SAMPLES = [
+    "이직을 해야 할지 고민입니다. 나중에 후회할까봐 두렵습니다.",
+    "왜 고객들이 계속 이탈하는지 근본 원인을 찾고 싶어요.",
+    "We need a breakthrough product idea for a crowded market.",
+    "팀원들과 갈등이 생겼는데 어떻게 대화해야 할까요?",
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Prebuild the method vector matrix')
+    parser.add_argument('--embedder', choices=('hashing', 'sentence-transformers'), default=None,
+                        help='Embedder (default: INNOVATION_SOCRATIC_RECOMMENDER_EMBEDDER '
+                             'or hashing)')
+    parser.add_argument('--dir', default=None,
+                        help='Vector directory (default: data/method_vectors)')
+    parser.add_argument('--repeat', type=int, default=200,
+                        help='Queries for the latency measurement')
+    parser.add_argument('--top', type=int, default=3, help='Methods shown per sample problem')
+    args = parser.parse_args()
+
+    if not NUMPY_AVAILABLE:
+        print("numpy is required: pip install numpy")
+        return 1
+    if args.embedder:
+        os.environ["INNOVATION_SOCRATIC_RECOMMENDER_EMBEDDER"] = args.embedder
+
+    recommender = MethodRecommender(args.dir, create_embedder())
+    method_ids, texts, digest = recommender._catalog()
+    start = time.perf_counter()
+    recommender.build(method_ids, texts, digest)
+    build_seconds = time.perf_counter() - start
+
+    recommender.load()
+    matrix_file = recommender._paths()[0]
+    print(
+        f"Built {len(method_ids)} x {recommender.matrix.shape[1]} {recommender.matrix.dtype} "
+        f"({recommender.embedder.name}) in {build_seconds:.2f}s -> {matrix_file} "
+        f"({matrix_file.stat().st_size / 1024:.0f} KiB)"
+    )
+
+    recommender.recommend(SAMPLES[0])
+    start = time.perf_counter()
+    for i in range(args.repeat):
+        recommender.recommend(SAMPLES[i % len(SAMPLES)])
+    elapsed = (time.perf_counter() - start) / args.repeat * 1000
+    print(f"recommend(): {elapsed:.2f} ms/query over {args.repeat} queries\n")
+
+    for problem in SAMPLES:
+        ranked = ", ".join(f"{m} {s:.2f}" for m, s in recommender.recommend(problem, args.top))
+        print(f"  {problem}\n    -> {ranked}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""
+Innovation Socratic MCP - Startup Budget Check
+`python -m src` 프로세스가 initialize 요청에 응답하기까지 걸린 시간 측정
+
+사용법:
+    python scripts/check_startup.py --budget-ms 1500 --runs 5
+
+중앙값이 예산(ms)을 넘으면 종료 코드 1을 반환합니다 (CI용).
+예산 기본값은 INNOVATION_SOCRATIC_STARTUP_BUDGET_MS 환경변수 또는 2000ms.
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+INITIALIZE_REQUEST = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2024-11-05",
+        "capabilities": {},
+        "clientInfo": {"name": "startup-check", "version": "1.0.0"}
+    }
+}
+
+
+def get_project_root():
+    return Path(__file__).parent.parent
+
+
+def measure_once(timeout: float) -> float:
+    """서버 1회 기동 후 initialize 응답까지 걸린 시간 (ms)"""
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "src"],
+        cwd=get_project_root(),
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL
+    )
+    response = {}
+
+    def read_response():
+        line = proc.stdout.readline()
+        if line:
+            response.update(json.loads(line))
+
+    try:
+        proc.stdin.write((json.dumps(INITIALIZE_REQUEST) + "\n").encode("utf-8"))
+        proc.stdin.flush()
+        reader = threading.Thread(target=read_response, daemon=True)
+        reader.start()
+        reader.join(timeout)
+        elapsed = (time.perf_counter() - start) * 1000
+        if "result" not in response:
+            raise RuntimeError(f"No initialize response within {timeout:.0f}s: {response}")
+        return elapsed
+    finally:
+        proc.kill()
+        proc.wait()
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description='Check server cold start time')
+    parser.add_argument(
+        '--budget-ms',
+        type=float,
+        default=float(os.environ.get("INNOVATION_SOCRATIC_STARTUP_BUDGET_MS", "2000")),
+        help='Maximum median time to answer initialize'
+    )
+    parser.add_argument('--runs', type=int, default=3, help='Number of cold starts')
+    parser.add_argument('--timeout', type=float, default=30.0, help='Per-run timeout (s)')
+    args = parser.parse_args()
+
+    timings = [measure_once(args.timeout) for _ in range(args.runs)]
+    median = statistics.median(timings)
+    print(
+        f"initialize: median {median:.0f}ms, min {min(timings):.0f}ms, "
+        f"max {max(timings):.0f}ms (budget {args.budget_ms:.0f}ms)"
+    )
+
+    if median > args.budget_ms:
+        print("Startup budget exceeded")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
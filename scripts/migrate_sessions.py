@@ -0,0 +1,104 @@
+"""
+Innovation Socratic MCP - Session Migration Script
+JSON 세션 파일을 SQLite 세션 저장소로 가져오기
+
+사용법:
+    python scripts/migrate_sessions.py
+    python scripts/migrate_sessions.py --source data/user_sessions \
+        --db data/user_sessions/sessions.db
+    python scripts/migrate_sessions.py --upgrade-only
+
+저널(<id>.journal.jsonl)에 남은 답변도 함께 반영됩니다.
+이미 있는 세션은 덮어쓰므로 여러 번 실행해도 안전합니다.
+
+--upgrade-only는 가져오기 없이 기존 저장소만 갱신합니다:
+    - 파일 저장소의 사용자 인덱스(users/) 재생성
+    - SQLite의 이전 인덱스 삭제 (idx_sessions_user_id → idx_sessions_user_updated)
+"""
+
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.storage import FileSessionStore, SQLiteSessionStore
+
+# (user_id, updated_at) 인덱스로 대체된 이전 인덱스
+LEGACY_SQLITE_INDEXES = ("idx_sessions_user_id",)
+
+
+def get_project_root():
+    return Path(__file__).parent.parent
+
+
+def upgrade_sqlite(db_path: str) -> int:
+    """이전 스키마의 인덱스 삭제 (삭제한 수)"""
+    conn = sqlite3.connect(db_path, timeout=30)
+    try:
+        dropped = 0
+        for name in LEGACY_SQLITE_INDEXES:
+            exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?", (name,)
+            ).fetchone()
+            if exists:
+                conn.execute(f"DROP INDEX {name}")
+                dropped += 1
+        conn.commit()
+        return dropped
+    finally:
+        conn.close()
+
+
+def main():
+    import argparse
+    root = get_project_root()
+    parser = argparse.ArgumentParser(description='Import JSON session files into SQLite')
+    parser.add_argument(
+        '--source',
+        default=str(root / "data" / "user_sessions"),
+        help='Directory with <id>.json session files'
+    )
+    parser.add_argument('--db', default=None, help='SQLite file (default: <source>/sessions.db)')
+    parser.add_argument('--batch-size', type=int, default=500, help='Sessions per transaction')
+    parser.add_argument(
+        '--upgrade-only',
+        action='store_true',
+        help='Rebuild the file user index and drop legacy SQLite indexes without importing'
+    )
+    args = parser.parse_args()
+
+    source = Path(args.source)
+    if not source.is_dir():
+        print(f"Source directory not found: {source}")
+        return 1
+
+    db_path = args.db or str(source / "sessions.db")
+    start = time.perf_counter()
+    source_store = FileSessionStore(str(source))
+
+    if args.upgrade_only:
+        indexed = source_store.rebuild_user_index()
+        print(f"Rebuilt user index for {indexed} sessions in {source / 'users'}")
+        if Path(db_path).exists():
+            dropped = upgrade_sqlite(db_path)
+            print(f"Dropped {dropped} legacy indexes from {db_path}")
+        print(f"Done in {time.perf_counter() - start:.1f}s")
+        return 0
+
+    target_store = SQLiteSessionStore(db_path)
+    try:
+        imported = target_store.save_many(source_store.iter_sessions(), batch_size=args.batch_size)
+    finally:
+        target_store.close()
+    upgrade_sqlite(db_path)
+
+    elapsed = time.perf_counter() - start
+    print(f"Imported {imported} sessions into {db_path} in {elapsed:.1f}s")
+    print("Set INNOVATION_SOCRATIC_SESSION_BACKEND=sqlite to use it.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""
+Innovation Socratic MCP - Session Analytics
+저장된 세션의 방법론/카테고리별 완료율, 평균 답변 수, 이탈 단계, 완료 시간 집계
+
+사용법:
+    python scripts/session_analytics.py
+    python scripts/session_analytics.py --by category --format csv --output category.csv
+    python scripts/session_analytics.py --backend sqlite --since 2025-01-01 --until 2025-02-01
+
+저장소 설정은 서버와 같은 환경변수(INNOVATION_SOCRATIC_SESSION_BACKEND 등)를 따릅니다.
+NumPy가 설치되어 있으면 열 단위로 집계합니다 (pip install 'innovation-socratic-mcp[analytics]').
+"""
+
+import json
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.analytics import DIMENSIONS, NUMPY_AVAILABLE, analyze_store
+from src.storage import create_store
+
+
+def get_project_root():
+    return Path(__file__).parent.parent
+
+
+def parse_date(value: str) -> datetime:
+    """YYYY-MM-DD 또는 ISO 시각 (시간대 없으면 UTC)"""
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description='Aggregate stored session metrics')
+    parser.add_argument(
+        '--storage-dir',
+        default=str(get_project_root() / "data" / "user_sessions"),
+        help='Session storage directory'
+    )
+    parser.add_argument(
+        '--backend', choices=['file', 'sqlite'], default=None, help='Session backend'
+    )
+    parser.add_argument('--by', choices=list(DIMENSIONS) + ['all'], default='all', help='Group by')
+    parser.add_argument('--format', choices=['json', 'csv'], default='json', help='Output format')
+    parser.add_argument('--output', default=None, help='Output file (default: stdout)')
+    parser.add_argument('--since', type=parse_date, default=None, help='Created at or after')
+    parser.add_argument('--until', type=parse_date, default=None, help='Created before')
+    parser.add_argument('--no-numpy', action='store_true', help='Use the pure Python aggregator')
+    args = parser.parse_args()
+
+    store = create_store(args.storage_dir, backend=args.backend)
+    try:
+        report = analyze_store(
+            store,
+            since=args.since,
+            until=args.until,
+            use_numpy=False if args.no_numpy else None
+        )
+    finally:
+        store.close()
+
+    dimensions = DIMENSIONS if args.by == 'all' else (args.by,)
+    if args.format == 'csv':
+        output = "\n".join(report.to_csv(dimension) for dimension in dimensions)
+    else:
+        data = report.to_dict()
+        if args.by != 'all':
+            data = {"scanned": data["scanned"], f"by_{args.by}": data[f"by_{args.by}"]}
+        output = json.dumps(data, ensure_ascii=False, indent=2)
+
+    if args.output:
+        Path(args.output).write_text(output, encoding="utf-8")
+    else:
+        print(output)
+
+    rate = report.scanned / report.elapsed if report.elapsed else 0
+    print(
+        f"Scanned {report.scanned} sessions in {report.elapsed:.1f}s "
+        f"({rate:,.0f}/s, {'numpy' if NUMPY_AVAILABLE and not args.no_numpy else 'python'})",
+        file=sys.stderr
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+"""
+Innovation Socratic MCP - Multi-process Session Stress Test
+여러 프로세스가 같은 저장소의 같은 세션에 동시에 답변을 기록해도
+답변이 유실/중복/손상되지 않는지 확인
+
+사용법:
+    python scripts/stress_sessions.py --processes 8 --sessions 4 --answers 200
+    python scripts/stress_sessions.py --backend sqlite
+
+각 프로세스는 매번 저장소에서 세션을 새로 읽어 답변을 추가합니다 (캐시 사용 안 함).
+충돌(StaleSessionError)이 나면 다시 읽어 재시도하고, 끝나면 모든 프로세스가
+성공했다고 보고한 답변과 저장된 답변이 정확히 일치하는지 검사합니다.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.session import SessionManager
+from src.session_cache import SessionCache
+from src.storage import StaleSessionError, create_store
+
+TOTAL_STEPS = 1_000_000  # 테스트 중 완료되지 않도록
+
+
+def _manager(storage_dir: str, backend: str) -> SessionManager:
+    return SessionManager(
+        storage_dir,
+        store=create_store(storage_dir, backend),
+        flush_policy="always",
+        cache=SessionCache(max_size=0)
+    )
+
+
+def worker(
+    index: int,
+    storage_dir: str,
+    backend: str,
+    session_ids: List[str],
+    answers: int,
+    verbose: bool
+) -> Tuple[Dict[str, List[str]], int]:
+    """
+    답변 answers개를 세션들에 번갈아 기록
+
+    Returns:
+        (세션별 기록에 성공한 답변 목록, 충돌 횟수)
+    """
+    if not verbose:
+        sys.stderr = open(os.devnull, 'w')
+    manager = _manager(storage_dir, backend)
+    written: Dict[str, List[str]] = {session_id: [] for session_id in session_ids}
+    conflicts = 0
+    try:
+        for i in range(answers):
+            session_id = session_ids[(index + i) % len(session_ids)]
+            answer = f"p{index}-a{i}"
+            while True:
+                session = manager.load_session(session_id)
+                try:
+                    if manager.add_answer(answer, session):
+                        written[session_id].append(answer)
+                    break
+                except StaleSessionError:
+                    conflicts += 1
+    finally:
+        manager.close()
+    return written, conflicts
+
+
+def verify(storage_dir: str, backend: str, expected: Dict[str, List[List[str]]]) -> List[str]:
+    """저장된 세션과 프로세스별 성공 기록 비교 (문제 목록 반환)"""
+    problems = []
+
+    # 파일 저장소: 모든 스냅샷/저널 줄이 온전한 JSON인지
+    if backend == "file":
+        for path in Path(storage_dir).rglob("*.json"):
+            if "conflicts" in path.parts:
+                continue
+            try:
+                json.loads(path.read_text(encoding="utf-8"))
+            except ValueError as e:
+                problems.append(f"{path.name}: 손상된 스냅샷 ({e})")
+        for path in Path(storage_dir).rglob("*.journal.jsonl"):
+            for number, line in enumerate(path.read_text(encoding="utf-8").splitlines(), 1):
+                try:
+                    json.loads(line)
+                except ValueError:
+                    problems.append(f"{path.name}:{number}: 손상된 저널 줄")
+
+    store = create_store(storage_dir, backend)
+    try:
+        for session_id, per_process in expected.items():
+            data = store.load(session_id)
+            if data is None:
+                problems.append(f"{session_id}: 세션 없음")
+                continue
+            stored = data["answers"]
+            reported = [answer for answers in per_process for answer in answers]
+            if Counter(stored) != Counter(reported):
+                missing = len(Counter(reported) - Counter(stored))
+                extra = len(Counter(stored) - Counter(reported))
+                problems.append(f"{session_id}: 답변 불일치 (유실 {missing}, 중복/초과 {extra})")
+            if data["current_step"] != len(stored):
+                problems.append(
+                    f"{session_id}: current_step {data['current_step']} != 답변 {len(stored)}"
+                )
+            # 프로세스별 기록 순서 유지
+            for answers in per_process:
+                positions = [stored.index(answer) for answer in answers if answer in stored]
+                if positions != sorted(positions):
+                    problems.append(f"{session_id}: 프로세스 내 답변 순서 뒤바뀜")
+                    break
+    finally:
+        store.close()
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Hammer shared sessions from several processes')
+    parser.add_argument('--processes', type=int, default=8, help='Writer processes')
+    parser.add_argument('--sessions', type=int, default=4, help='Shared sessions')
+    parser.add_argument('--answers', type=int, default=200, help='Answers per process')
+    parser.add_argument('--backend', choices=('file', 'sqlite'), default='file')
+    parser.add_argument('--dir', default=None, help='Storage directory (default: temporary)')
+    parser.add_argument('--verbose', action='store_true', help='Show conflict logs from workers')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="socratic-stress-") as tmp:
+        storage_dir = args.dir or tmp
+        manager = _manager(storage_dir, args.backend)
+        session_ids = [
+            manager.create_session(
+                user_id="stress",
+                problem=f"stress session {i}",
+                category="analytical",
+                method_id="stress",
+                method_name="Stress",
+                total_steps=TOTAL_STEPS
+            ).session_id
+            for i in range(args.sessions)
+        ]
+        manager.close()
+
+        print(
+            f"{args.processes} processes x {args.answers} answers -> "
+            f"{args.sessions} sessions ({args.backend} backend, {storage_dir})"
+        )
+        start = time.perf_counter()
+        with multiprocessing.Pool(args.processes) as pool:
+            results = pool.starmap(worker, [
+                (index, storage_dir, args.backend, session_ids, args.answers, args.verbose)
+                for index in range(args.processes)
+            ])
+        elapsed = time.perf_counter() - start
+
+        expected = {
+            session_id: [written[session_id] for written, _ in results]
+            for session_id in session_ids
+        }
+        total = sum(len(a) for per_process in expected.values() for a in per_process)
+        conflicts = sum(c for _, c in results)
+        print(
+            f"Wrote {total} answers in {elapsed:.2f}s ({total / elapsed:,.0f}/s), "
+            f"{conflicts} conflicts retried"
+        )
+
+        problems = verify(storage_dir, args.backend, expected)
+        if problems:
+            for problem in problems[:20]:
+                print(f"❌ {problem}")
+            print(f"FAILED: {len(problems)} problems")
+            return 1
+        print("OK: no lost, duplicated or corrupted answers")
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
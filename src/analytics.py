@@ -0,0 +1,273 @@
+"""
+Session Analytics
+저장된 세션을 스트리밍으로 읽어 방법론/카테고리별 지표 집계
+
+- 세션 요약을 CHUNK_SIZE개씩 열 배열로 모은 뒤 bincount로 집계 (메모리는 청크 크기에 비례)
+- 지표: 세션 수, 완료율, 평균 답변 수, 이탈 단계(미완료 세션이 가장 많이 멈춘 단계),
+  완료까지 걸린 시간 (평균, 중앙값)
+- 중앙값은 로그 간격 고정 구간 히스토그램으로 근사 (구간당 상대 오차 ~5%)
+- NumPy가 없으면 같은 집계를 순수 Python으로 수행 (느림)
+
+사용법:
+    from src.analytics import analyze_store
+    report = analyze_store(session_manager.store)
+    report.to_csv("method_id"), report.to_json()
+"""
+
+import csv
+import importlib.util
+import io
+import json
+import math
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
+
+CHUNK_SIZE = 65_536
+MAX_STEP = 64  # 이탈 단계 히스토그램 상한 (넘는 단계는 마지막 칸)
+
+# 완료 시간 히스토그램: 1초 ~ 약 1년, 로그 간격
+DURATION_BINS_PER_DOUBLING = 8
+DURATION_BINS = DURATION_BINS_PER_DOUBLING * 25 + 1
+
+DIMENSIONS = ("method_id", "category")
+
+
+def _duration_bin(seconds: float) -> int:
+    if seconds < 1:
+        return 0
+    return min(int(math.log2(seconds) * DURATION_BINS_PER_DOUBLING) + 1, DURATION_BINS - 1)
+
+
+def _bin_upper_seconds(index: int) -> float:
+    """구간의 상한 (초)"""
+    if index == 0:
+        return 1.0
+    return 2 ** (index / DURATION_BINS_PER_DOUBLING)
+
+
+class _GroupTotals:
+    """한 차원(method_id 또는 category)의 그룹별 누적값 (그룹은 정수 코드)"""
+
+    def __init__(self):
+        self.codes: Dict[str, int] = {}
+        self.sessions: List[int] = []
+        self.completed: List[int] = []
+        self.answers: List[int] = []
+        self.duration_sum: List[float] = []
+        self.dropoff: List[List[int]] = []
+        self.durations: List[List[int]] = []
+
+    def code(self, key: str) -> int:
+        code = self.codes.get(key)
+        if code is None:
+            code = self.codes[key] = len(self.codes)
+            self.sessions.append(0)
+            self.completed.append(0)
+            self.answers.append(0)
+            self.duration_sum.append(0.0)
+            self.dropoff.append([0] * (MAX_STEP + 1))
+            self.durations.append([0] * DURATION_BINS)
+        return code
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """그룹별 지표 (세션 수 내림차순)"""
+        rows = []
+        for key, code in self.codes.items():
+            sessions = self.sessions[code]
+            completed = self.completed[code]
+            dropoff = self.dropoff[code]
+            abandoned = sessions - completed
+            dropoff_step = max(range(len(dropoff)), key=dropoff.__getitem__) if abandoned else None
+            rows.append({
+                "key": key,
+                "sessions": sessions,
+                "completed": completed,
+                "completion_rate": round(completed / sessions, 4) if sessions else 0.0,
+                "avg_answers": round(self.answers[code] / sessions, 2) if sessions else 0.0,
+                "dropoff_step": dropoff_step,
+                "dropoff_sessions": dropoff[dropoff_step] if dropoff_step is not None else 0,
+                "avg_time_to_complete_s": (
+                    round(self.duration_sum[code] / completed, 1) if completed else None
+                ),
+                "p50_time_to_complete_s": (
+                    round(self._median_duration(code), 1) if completed else None
+                ),
+            })
+        rows.sort(key=lambda r: (-r["sessions"], r["key"]))
+        return rows
+
+    def _median_duration(self, code: int) -> float:
+        histogram = self.durations[code]
+        target = (sum(histogram) + 1) // 2
+        seen = 0
+        for index, count in enumerate(histogram):
+            seen += count
+            if seen >= target:
+                return _bin_upper_seconds(index)
+        return _bin_upper_seconds(len(histogram) - 1)
+
+
+class AnalyticsReport:
+    """집계 결과"""
+
+    def __init__(self, totals: Dict[str, _GroupTotals], scanned: int, elapsed: float):
+        self.totals = totals
+        self.scanned = scanned
+        self.elapsed = elapsed
+
+    def rows(self, dimension: str) -> List[Dict[str, Any]]:
+        return self.totals[dimension].rows()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "scanned": self.scanned,
+            "elapsed_s": round(self.elapsed, 3),
+            **{f"by_{dimension}": self.rows(dimension) for dimension in self.totals},
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
+
+    def to_csv(self, dimension: str) -> str:
+        rows = self.rows(dimension)
+        out = io.StringIO()
+        fieldnames = [dimension] + [k for k in (rows[0] if rows else {}) if k != "key"]
+        writer = csv.DictWriter(out, fieldnames=fieldnames or [dimension])
+        writer.writeheader()
+        for row in rows:
+            row = dict(row)
+            writer.writerow({dimension: row.pop("key"), **row})
+        return out.getvalue()
+
+
+class SessionAnalytics:
+    """세션 요약 스트림을 청크 단위로 집계"""
+
+    def __init__(self, chunk_size: int = CHUNK_SIZE, use_numpy: Optional[bool] = None):
+        self.chunk_size = chunk_size
+        self.use_numpy = NUMPY_AVAILABLE if use_numpy is None else use_numpy and NUMPY_AVAILABLE
+        self.totals = {dimension: _GroupTotals() for dimension in DIMENSIONS}
+        self.scanned = 0
+
+    def consume(self, summaries: Iterable[Dict[str, Any]]):
+        """요약 스트림 집계 (store.iter_summaries 형식)"""
+        for chunk in self._chunks(summaries):
+            if self.use_numpy:
+                self._add_chunk_numpy(chunk)
+            else:
+                self._add_chunk_python(chunk)
+            self.scanned += len(chunk["completed"])
+
+    def _chunks(self, summaries: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, list]]:
+        """행 스트림 → 열 리스트 청크 (그룹 키는 정수 코드로 변환)"""
+        columns: Dict[str, list] = self._empty_columns()
+        methods = self.totals["method_id"]
+        categories = self.totals["category"]
+        for data in summaries:
+            columns["method_id"].append(methods.code(data["method_id"]))
+            columns["category"].append(categories.code(data["category"]))
+            columns["completed"].append(data["is_completed"])
+            columns["answers"].append(data["answer_count"])
+            columns["step"].append(data["current_step"])
+            columns["created_at"].append(data["created_at"])
+            columns["updated_at"].append(data["updated_at"])
+            if len(columns["completed"]) >= self.chunk_size:
+                yield columns
+                columns = self._empty_columns()
+        if columns["completed"]:
+            yield columns
+
+    @staticmethod
+    def _empty_columns() -> Dict[str, list]:
+        return {
+            name: []
+            for name in (
+                "method_id", "category", "completed", "answers", "step", "created_at", "updated_at"
+            )
+        }
+
+    def _add_chunk_numpy(self, chunk: Dict[str, list]):
+        import numpy as np
+
+        completed = np.array(chunk["completed"], dtype=bool)
+        answers = np.array(chunk["answers"], dtype=np.int64)
+        steps = np.minimum(np.array(chunk["step"], dtype=np.int64), MAX_STEP)
+        created = np.array(chunk["created_at"], dtype="datetime64[us]")
+        updated = np.array(chunk["updated_at"], dtype="datetime64[us]")
+        seconds = (updated - created).astype(np.float64) / 1e6
+        seconds = np.where(completed, np.maximum(seconds, 0.0), 0.0)
+        bins = np.zeros(len(seconds), dtype=np.int64)
+        positive = seconds >= 1
+        bins[positive] = np.minimum(
+            (np.log2(seconds[positive]) * DURATION_BINS_PER_DOUBLING).astype(np.int64) + 1,
+            DURATION_BINS - 1
+        )
+
+        for dimension in DIMENSIONS:
+            totals = self.totals[dimension]
+            groups = len(totals.codes)
+            codes = np.array(chunk[dimension], dtype=np.int64)
+            sessions = np.bincount(codes, minlength=groups)
+            done = np.bincount(codes[completed], minlength=groups)
+            answer_sum = np.bincount(codes, weights=answers, minlength=groups)
+            duration_sum = np.bincount(codes, weights=seconds, minlength=groups)
+            dropoff = np.bincount(
+                codes[~completed] * (MAX_STEP + 1) + steps[~completed],
+                minlength=groups * (MAX_STEP + 1)
+            ).reshape(groups, MAX_STEP + 1)
+            durations = np.bincount(
+                codes[completed] * DURATION_BINS + bins[completed],
+                minlength=groups * DURATION_BINS
+            ).reshape(groups, DURATION_BINS)
+
+            for code in np.flatnonzero(sessions):
+                totals.sessions[code] += int(sessions[code])
+                totals.completed[code] += int(done[code])
+                totals.answers[code] += int(answer_sum[code])
+                totals.duration_sum[code] += float(duration_sum[code])
+                row = totals.dropoff[code]
+                for step in np.flatnonzero(dropoff[code]):
+                    row[step] += int(dropoff[code, step])
+                row = totals.durations[code]
+                for index in np.flatnonzero(durations[code]):
+                    row[index] += int(durations[code, index])
+
+    def _add_chunk_python(self, chunk: Dict[str, list]):
+        for i, completed in enumerate(chunk["completed"]):
+            seconds = 0.0
+            if completed:
+                created = datetime.fromisoformat(chunk["created_at"][i])
+                updated = datetime.fromisoformat(chunk["updated_at"][i])
+                seconds = max((updated - created).total_seconds(), 0.0)
+            step = min(chunk["step"][i], MAX_STEP)
+            for dimension in DIMENSIONS:
+                totals = self.totals[dimension]
+                code = chunk[dimension][i]
+                totals.sessions[code] += 1
+                totals.answers[code] += chunk["answers"][i]
+                if completed:
+                    totals.completed[code] += 1
+                    totals.duration_sum[code] += seconds
+                    totals.durations[code][_duration_bin(seconds)] += 1
+                else:
+                    totals.dropoff[code][step] += 1
+
+    def report(self, elapsed: float = 0.0) -> AnalyticsReport:
+        return AnalyticsReport(self.totals, self.scanned, elapsed)
+
+
+def analyze_store(
+    store: Any,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    chunk_size: int = CHUNK_SIZE,
+    use_numpy: Optional[bool] = None
+) -> AnalyticsReport:
+    """세션 저장소 전체(또는 기간)를 스트리밍 집계"""
+    start = time.perf_counter()
+    analytics = SessionAnalytics(chunk_size=chunk_size, use_numpy=use_numpy)
+    analytics.consume(store.iter_summaries(since, until))
+    return analytics.report(time.perf_counter() - start)
@@ -0,0 +1,220 @@
+"""
+Session Archive
+완료된 오래된 세션을 압축 세그먼트 파일로 모아 보관
+
+파일 형식 (파티션 = 세션 생성 날짜 또는 "legacy"):
+    <archive_dir>/<partition>.seg  [길이 4바이트 big-endian][zlib 압축 JSON] 레코드의 연속
+    <archive_dir>/<partition>.idx  "<session_id>\\t<offset>\\t<length>" 줄의 연속
+
+- 두 파일 모두 추가 전용 (세그먼트 기록 → fsync → 인덱스 기록 순)
+- 추가는 <partition>.lock 배타 잠금 안에서 (여러 프로세스가 같은 파티션에 보관해도
+  레코드가 섞이지 않고 오프셋은 잠금을 잡은 뒤의 파일 끝 기준)
+- 인덱스는 파티션별로 처음 조회할 때 메모리에 올리며, 이후 조회는 seek 한 번
+  (없는 ID는 인덱스 파일이 커졌으면 다시 읽음 - 다른 프로세스가 보관한 세션)
+- 같은 ID가 여러 번 보관되면 마지막 레코드가 유효
+- 레코드는 세션 JSON 키로 만든 zlib 사전(ZDICT)으로 압축 (작은 레코드의 압축률 개선)
+"""
+
+import json
+import os
+import struct
+import sys
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .locks import locked_file
+
+# 압축 사전 - 바꾸면 기존 세그먼트를 읽을 수 없음
+ZDICT = (
+    b'{"session_id": "", "user_id": "", "problem": "", "category": "", '
+    b'"method_id": "", "method_name": "", "current_step": , "total_steps": , '
+    b'"answers": [], "created_at": "T", "updated_at": "T", "is_completed": true}'
+)
+_LENGTH = struct.Struct(">I")
+
+
+def _compress(raw: bytes) -> bytes:
+    compressor = zlib.compressobj(level=9, zdict=ZDICT)
+    return compressor.compress(raw) + compressor.flush()
+
+
+def _decompress(payload: bytes) -> Dict[str, Any]:
+    decompressor = zlib.decompressobj(zdict=ZDICT)
+    return json.loads(decompressor.decompress(payload) + decompressor.flush())
+
+
+class SessionArchive:
+    """파티션별 압축 세그먼트 + 오프셋 인덱스"""
+
+    def __init__(self, archive_dir: str):
+        self.archive_dir = Path(archive_dir)
+        # 파티션 → {session_id: (offset, length)}, 읽은 인덱스 파일 크기
+        self._indexes: Dict[str, Dict[str, Tuple[int, int]]] = {}
+        self._index_sizes: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._archived = 0
+        self._bytes_in = 0
+        self._bytes_out = 0
+
+    def _segment_path(self, partition: str) -> Path:
+        return self.archive_dir / f"{partition}.seg"
+
+    def _index_path(self, partition: str) -> Path:
+        return self.archive_dir / f"{partition}.idx"
+
+    def _lock_path(self, partition: str) -> Path:
+        return self.archive_dir / f"{partition}.lock"
+
+    def _locked(self, partition: str):
+        """파티션 추가 잠금 (프로세스 간 배타)"""
+        return locked_file(self._lock_path(partition))
+
+    def _index(self, partition: str, refresh: bool = False) -> Dict[str, Tuple[int, int]]:
+        """
+        파티션 인덱스 (없으면 파일에서 로드)
+
+        refresh=True면 마지막으로 읽은 뒤 인덱스 파일이 커졌을 때 다시 읽음
+        """
+        index = self._indexes.get(partition)
+        index_file = self._index_path(partition)
+        if index is not None:
+            if not refresh:
+                return index
+            try:
+                size = index_file.stat().st_size
+            except FileNotFoundError:
+                size = 0
+            if size == self._index_sizes.get(partition, 0):
+                return index
+
+        index = {}
+        size = 0
+        if index_file.exists():
+            with open(index_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    # 기록 중인(줄바꿈 전) 마지막 줄은 무시
+                    if not line.endswith("\n"):
+                        break
+                    size += len(line.encode("utf-8"))
+                    parts = line.rstrip("\n").split("\t")
+                    if len(parts) != 3:
+                        continue
+                    index[parts[0]] = (int(parts[1]), int(parts[2]))
+        self._indexes[partition] = index
+        self._index_sizes[partition] = size
+        return index
+
+    def append(self, partition: str, sessions: Iterable[Dict[str, Any]]) -> List[str]:
+        """
+        세션들을 파티션 세그먼트에 추가
+
+        Returns:
+            보관된 세션 ID 목록 (세그먼트/인덱스가 디스크에 기록된 뒤 반환)
+        """
+        records = []
+        for data in sessions:
+            raw = json.dumps(data, ensure_ascii=False).encode("utf-8")
+            records.append((data["session_id"], _compress(raw), len(raw)))
+        if not records:
+            return []
+
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        with self._lock, self._locked(partition):
+            # 다른 프로세스가 추가한 항목까지 반영한 뒤 이어서 기록
+            index = self._index(partition, refresh=True)
+            entries = []
+            with open(self._segment_path(partition), 'ab') as seg:
+                seg.seek(0, os.SEEK_END)
+                offset = seg.tell()
+                for session_id, payload, _ in records:
+                    seg.write(_LENGTH.pack(len(payload)))
+                    seg.write(payload)
+                    entries.append((session_id, offset + _LENGTH.size, len(payload)))
+                    offset += _LENGTH.size + len(payload)
+                seg.flush()
+                os.fsync(seg.fileno())
+
+            lines = "".join(f"{sid}\t{off}\t{length}\n" for sid, off, length in entries)
+            with open(self._index_path(partition), 'a', encoding='utf-8') as idx:
+                idx.write(lines)
+                idx.flush()
+                os.fsync(idx.fileno())
+
+            for session_id, off, length in entries:
+                index[session_id] = (off, length)
+            self._index_sizes[partition] = (
+                self._index_sizes.get(partition, 0) + len(lines.encode("utf-8"))
+            )
+            self._archived += len(records)
+            self._bytes_in += sum(raw for _, _, raw in records)
+            self._bytes_out += sum(_LENGTH.size + len(p) for _, p, _ in records)
+
+        return [session_id for session_id, _, _ in records]
+
+    def lookup(self, partition: str, session_id: str) -> Optional[Dict[str, Any]]:
+        """ID로 세션 조회 (인덱스 → seek 한 번)"""
+        with self._lock:
+            location = self._index(partition).get(session_id)
+            if location is None:
+                # 다른 프로세스가 그 사이 보관했을 수 있음
+                location = self._index(partition, refresh=True).get(session_id)
+        if location is None:
+            return None
+
+        offset, length = location
+        with open(self._segment_path(partition), 'rb') as seg:
+            seg.seek(offset)
+            return _decompress(seg.read(length))
+
+    def partitions(self) -> List[str]:
+        """보관된 파티션 목록 (오래된 순)"""
+        if not self.archive_dir.exists():
+            return []
+        return sorted(p.stem for p in self.archive_dir.glob("*.seg"))
+
+    def iter_partition(self, partition: str) -> Iterator[Dict[str, Any]]:
+        """파티션의 유효한 레코드 순회 (ID순)"""
+        with self._lock:
+            locations = sorted(self._index(partition, refresh=True).items())
+        if not locations:
+            return
+        with open(self._segment_path(partition), 'rb') as seg:
+            for _, (offset, length) in locations:
+                seg.seek(offset)
+                try:
+                    yield _decompress(seg.read(length))
+                except (zlib.error, ValueError) as e:
+                    print(f"보관 레코드 읽기 실패 ({partition}@{offset}): {e}", file=sys.stderr)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """통계"""
+        with self._lock:
+            return {
+                "archived": self._archived,
+                "bytes_in": self._bytes_in,
+                "bytes_out": self._bytes_out,
+                "partitions_loaded": len(self._indexes),
+            }
+
+
+def start_archiver(store: Any, after_days: float, interval: float) -> Optional[threading.Thread]:
+    """백그라운드 스레드로 완료된 세션을 주기적으로 보관 (store.archive_completed 사용)"""
+    if after_days <= 0 or interval <= 0:
+        return None
+
+    def loop():
+        while True:
+            try:
+                archived = store.archive_completed(after_days)
+                if archived:
+                    print(f"Archived {archived} completed sessions", file=sys.stderr)
+            except Exception as e:
+                print(f"Session archive error: {e}", file=sys.stderr)
+            time.sleep(interval)
+
+    thread = threading.Thread(target=loop, name="socratic-archiver", daemon=True)
+    thread.start()
+    return thread
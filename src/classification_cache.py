@@ -0,0 +1,136 @@
+"""
+Classification Cache
+ProblemClassifier.classify 앞단의 LRU 메모리 캐시 (서버 프로세스)
+
+- 재시도/재연결로 같은(또는 거의 같은) 문제가 다시 오면 분류를 건너뜀
+- 키는 정규화한 문제 텍스트의 blake2b 해시
+  (소문자, 공백 정리, "/think"·"/help" 같은 트리거 제거)
+- 캐시에 없으면 분류도 정규화한 텍스트로 함 → 같은 키는 항상 같은 결과
+  (임베딩 추천기도 키와 같은 텍스트를 봄)
+- "/창의적"·"/문제해결"처럼 분류 키워드가 들어 있는 트리거는 지우지 않음
+  (분류에 쓰이는 단서)
+- 결과는 깊은 불변 객체 (dict → MappingProxyType, list → tuple)
+  → 호출자가 캐시 항목을 바꿀 수 없음
+
+환경변수:
+    INNOVATION_SOCRATIC_CLASSIFY_CACHE_SIZE: 최대 항목 수 (기본 1024, 0 = 사용 안 함)
+"""
+
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+
+from .classifier import classifier
+from .trigger import TriggerDetector
+
+_WHITESPACE = re.compile(r"\s+")
+# 활성화/명령 트리거 (긴 것 우선), "/method:<id>"는 인자까지
+# 단어 경계로 고정 ("/questions"는 "/question" 트리거가 아님)
+_TRIGGERS = re.compile(r"(?<![\w/])(?:" + "|".join(
+    [r"/method:\w*"] + [
+        re.escape(trigger.lower()) for trigger in sorted(
+            TriggerDetector.ACTIVATION_TRIGGERS + [
+                TriggerDetector.AUTO_TRIGGER,
+                TriggerDetector.RAG_TRIGGER,
+                TriggerDetector.DONE_TRIGGER,
+                TriggerDetector.HELP_TRIGGER,
+            ],
+            key=len,
+            reverse=True
+        )
+    ]
+) + r")(?!\w)")
+
+
+def _strip_trigger(match: "re.Match[str]") -> str:
+    """분류 키워드가 없는 트리거만 지움 (있으면 분류에 쓰이므로 그대로)"""
+    trigger = match.group()
+    return trigger if classifier.keyword_hits(trigger) else " "
+
+
+def normalize_problem(problem: str) -> str:
+    """캐시 키이자 분류에 쓰는 문제 텍스트 (소문자, 트리거 제거, 공백 하나로)"""
+    text = _WHITESPACE.sub(" ", problem.lower())
+    return _WHITESPACE.sub(" ", _TRIGGERS.sub(_strip_trigger, text)).strip()
+
+
+def freeze(value: Any) -> Any:
+    """dict/list를 재귀적으로 읽기 전용 객체로 변환"""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+class ClassificationCache:
+    """정규화한 문제 텍스트 → 분류 결과 LRU 캐시"""
+
+    def __init__(self, max_size: Optional[int] = None):
+        self.max_size = max_size if max_size is not None else int(
+            os.environ.get("INNOVATION_SOCRATIC_CLASSIFY_CACHE_SIZE", "1024")
+        )
+        self._entries: "OrderedDict[bytes, Mapping[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def key(normalized: str) -> bytes:
+        """정규화한 텍스트의 해시 키"""
+        return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).digest()
+
+    def get(self, key: bytes) -> Optional[Mapping[str, Any]]:
+        """캐시 조회 (읽기 전용 분류 결과)"""
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return result
+
+    def put(self, key: bytes, result: Dict[str, Any]) -> Mapping[str, Any]:
+        """분류 결과를 읽기 전용으로 바꿔 저장 (용량 초과 시 가장 오래된 항목 제거)"""
+        frozen = freeze(result)
+        if self.max_size <= 0:
+            return frozen
+        with self._lock:
+            self._entries[key] = frozen
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return frozen
+
+    def clear(self):
+        """모든 항목 제거 (분류 규칙을 바꿨을 때)"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """통계"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "evictions": self._evictions,
+            }
+
+
+# 싱글톤 인스턴스
+classification_cache = ClassificationCache()
@@ -1,10 +1,68 @@
 """
 Problem Classifier
 문제 유형 분석 및 방법론 추천 - Question Storming 항상 첫 번째
+
+카테고리 키워드와 추가 방법론 트리거 키워드를 KeywordIndex 하나로 색인해
+문제 텍스트를 단어 경계를 지키며 한 번에 검색합니다 (대소문자 무시, 한글 조사/영문 복수형 처리).
+카테고리 점수는 등장한 키워드의 TF-IDF 가중치 합입니다.
+
+classify_many()는 여러 문제의 서로 다른 단어만 한 번씩 조회해 문서 × 키워드 희소 행렬을 만들고
+NumPy 행렬 연산으로 분류합니다 (KEYWORD_RULES 조정을 위한 오프라인 평가용).
+
+INNOVATION_SOCRATIC_RECOMMENDER=embedding이면 classify()의 추천에 방법론 임베딩
+유사도(recommender 모듈)를 우선 반영합니다.
 """
 
-from typing import List, Dict, Any
-from .methods.templates import ALL_METHODS, CATEGORY_MAP
+import importlib.util
+import sys
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+
+from .keyword_index import KeywordIndex
+from .recommender import MethodRecommender, create_recommender
+
+NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
+
+
+class BatchClassification:
+    """
+    classify_many 결과 (열 배열)
+
+    - category: 문서별 카테고리 번호 (categories의 인덱스)
+    - confidence: 문서별 신뢰도
+    - recommended: 문서별 추천 방법론 번호 (method_ids의 인덱스, 3열, 부족하면 -1)
+    """
+
+    def __init__(
+        self,
+        categories: Tuple[str, ...],
+        category: Any,
+        confidence: Any,
+        method_ids: Tuple[str, ...],
+        recommended: Any
+    ):
+        self.categories = categories
+        self.category = category
+        self.confidence = confidence
+        self.method_ids = method_ids
+        self.recommended = recommended
+
+    def __len__(self) -> int:
+        return len(self.category)
+
+    def category_names(self) -> Any:
+        """문서별 카테고리 이름 배열"""
+        import numpy as np
+        return np.array(self.categories, dtype=object)[self.category]
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        """한 문서의 결과 (classify와 같은 키, 방법론은 ID만)"""
+        return {
+            "category": self.categories[self.category[index]],
+            "confidence": float(self.confidence[index]),
+            "recommended_method_ids": [
+                self.method_ids[code] for code in self.recommended[index] if code >= 0
+            ],
+        }
 
 
 class ProblemClassifier:
@@ -44,14 +102,48 @@ class ProblemClassifier:
         ]
     }
 
+    # 키워드가 min_count번 이상 나오면 추가로 추천할 방법론 (method_id, 키워드, min_count)
+    ADDITIONAL_RULES: Tuple[Tuple[str, Tuple[str, ...], int], ...] = (
+        ("five_whys", ("왜", "why"), 2),
+        ("scamper", ("제품", "product"), 1),
+        ("scenario_planning", ("미래", "future"), 1),
+        ("six_hats", ("팀", "조직"), 1),
+        ("decision_tree", ("결정", "decision"), 1),
+        ("swot", ("swot",), 1),
+        ("fishbone", ("원인", "cause"), 1),
+        ("cost_benefit", ("투자", "investment"), 1),
+        ("pre_mortem", ("리스크", "risk"), 1),
+        ("regret_minimization", ("후회", "regret"), 1),
+    )
+
+    def __init__(self, recommender: Optional[MethodRecommender] = None):
+        # 임베딩 추천기 (기본은 환경변수 설정, 없으면 키워드 규칙만 사용)
+        self.recommender = recommender if recommender is not None else create_recommender()
+        self._additional_rules = tuple(
+            (method_id, tuple(k.lower() for k in keywords), min_count)
+            for method_id, keywords, min_count in self.ADDITIONAL_RULES
+        )
+        self._index = KeywordIndex(
+            self.KEYWORD_RULES,
+            [k for _, keywords, _ in self._additional_rules for k in keywords]
+        )
+        # classify_many용 행렬 (처음 호출할 때 생성)
+        self._batch_tables: Optional[Dict[str, Any]] = None
+
+    def keyword_hits(self, text: str) -> Dict[str, int]:
+        """텍스트에 등장한 분류 키워드별 횟수 (classify가 보는 그대로)"""
+        # 단어마다 캐시 조회 한 번
+        return self._index.count(text)
+
     def classify(self, problem_description: str) -> Dict[str, Any]:
-        category_scores = self._score_categories(problem_description)
+        hits = self.keyword_hits(problem_description)
+        category_scores = self._index.score(hits)
         best_category = max(category_scores, key=category_scores.get)
         confidence = category_scores[best_category] / sum(category_scores.values()) \
             if sum(category_scores.values()) > 0 else 0.0
 
         recommended_methods = self._get_recommended_methods(
-            best_category, problem_description
+            best_category, hits, self._similar_methods(problem_description)
         )
 
         return {
@@ -61,76 +153,164 @@ class ProblemClassifier:
             "reasoning": self._generate_reasoning(best_category, problem_description, confidence)
         }
 
-    def _score_categories(self, text: str) -> Dict[str, float]:
-        text_lower = text.lower()
-        scores = {category: 0.0 for category in self.KEYWORD_RULES}
-        for category, keywords in self.KEYWORD_RULES.items():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    scores[category] += 1.0
-        return scores
+    def classify_many(self, problems: Sequence[str]) -> BatchClassification:
+        """
+        여러 문제를 한 번에 분류 (classify와 같은 카테고리/신뢰도/추천, reasoning 제외)
+
+        키워드 규칙만 평가합니다 (임베딩 추천기는 반영하지 않음).
+
+        1. 전체 문제의 서로 다른 단어만 색인 조회해 (문서, 키워드 번호) 배열
+        2. (문서, 키워드, 횟수) 희소 행렬
+        3. 키워드 × 카테고리 가중치 행렬로 점수, 규칙별 임계값 비교로 추가 방법론 비트마스크
+        4. 추천 목록은 (추가 방법론 조합, 카테고리) 조합마다 한 번만 계산
+        """
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError(
+                "classify_many requires numpy: pip install 'innovation-socratic-mcp[analytics]'"
+            )
+        import numpy as np
+
+        tables = self._get_batch_tables()
+        categories = tables["categories"]
+        n = len(problems)
+        keyword_count = len(self._index.keywords)
+
+        docs, found = self._index.batch_ids(problems)
+
+        # 문서 × 키워드 등장 횟수 (좌표 형식, 문서 순 → 키워드 번호 순 정렬)
+        if len(found):
+            keys, counts = np.unique(docs * keyword_count + found, return_counts=True)
+            docs, keywords = np.divmod(keys, keyword_count)
+        else:
+            docs = keywords = counts = np.zeros(0, dtype=np.int64)
+
+        # 카테고리 점수 = 등장한 서로 다른 키워드의 TF-IDF 가중치 합 (classify와 같은 합산 순서)
+        weights = tables["weights"]
+        scores = np.zeros((n, len(categories)))
+        for column in range(len(categories)):
+            scores[:, column] = np.bincount(
+                docs, weights=weights[keywords, column], minlength=n
+            )
+        category = scores.argmax(axis=1)
+        totals = scores.sum(axis=1)
+        best = scores[np.arange(n), category]
+        confidence = np.divide(best, totals, out=np.zeros(n), where=totals > 0)
+
+        # 추가 방법론 규칙 (등장 횟수 >= 임계값인 키워드가 하나라도 있으면 비트 설정)
+        fired = counts[:, None] >= tables["thresholds"][:, keywords].T
+        hit_bits = fired.astype(np.int64) @ tables["rule_bits"]
+        rule_mask = np.zeros(n, dtype=np.int64)
+        if len(docs):
+            first = np.flatnonzero(np.r_[True, docs[1:] != docs[:-1]])
+            rule_mask[docs[first]] = np.bitwise_or.reduceat(hit_bits, first)
+
+        # 추천 목록은 조합별로 한 번만 계산
+        combos, inverse = np.unique(rule_mask * len(categories) + category, return_inverse=True)
+        method_codes = tables["method_codes"]
+        table = np.full((len(combos), 3), -1, dtype=np.int16)
+        for row, combo in enumerate(combos.tolist()):
+            mask, code = divmod(combo, len(categories))
+            additional = [
+                method_id for bit, (method_id, _, _) in enumerate(self._additional_rules)
+                if mask >> bit & 1
+            ]
+            for column, method_id in enumerate(
+                self._recommended_method_ids(categories[code], additional)[:3]
+            ):
+                table[row, column] = method_codes[method_id]
+
+        return BatchClassification(
+            categories=categories,
+            category=category,
+            confidence=confidence,
+            method_ids=tables["method_ids"],
+            recommended=table[inverse.reshape(-1)]
+        )
+
+    def _get_batch_tables(self) -> Dict[str, Any]:
+        """키워드 × 카테고리 가중치 행렬, 규칙 × 키워드 임계값 행렬, 방법론 번호표"""
+        if self._batch_tables is not None:
+            return self._batch_tables
+
+        import numpy as np
+
+        from .methods.templates import ALL_METHODS
+
+        keyword_index = {keyword: i for i, keyword in enumerate(self._index.keywords)}
+
+        if len(self._additional_rules) > 62:
+            raise ValueError("ADDITIONAL_RULES supports at most 62 rules in classify_many")
+        # 규칙에 없는 키워드는 넘을 수 없는 임계값
+        thresholds = np.full(
+            (len(self._additional_rules), len(keyword_index)), np.iinfo(np.int64).max
+        )
+        for row, (_, keywords, min_count) in enumerate(self._additional_rules):
+            thresholds[row, [keyword_index[k] for k in keywords]] = min_count
+
+        method_ids = tuple(ALL_METHODS)
+        self._batch_tables = {
+            "categories": self._index.categories,
+            "weights": self._index.weight_matrix(),
+            "thresholds": thresholds,
+            "rule_bits": np.left_shift(1, np.arange(len(self._additional_rules), dtype=np.int64)),
+            "method_ids": method_ids,
+            "method_codes": {method_id: i for i, method_id in enumerate(method_ids)},
+        }
+        return self._batch_tables
+
+    def _similar_methods(self, problem_description: str) -> List[str]:
+        """임베딩 유사도 상위 방법론 (추천기가 없거나 실패하면 빈 목록)"""
+        if self.recommender is None:
+            return []
+        try:
+            return self.recommender.recommend_ids(problem_description, k=4)
+        except Exception as e:
+            print(f"임베딩 추천 실패 (키워드 추천 사용): {e}", file=sys.stderr)
+            self.recommender = None
+            return []
 
     def _get_recommended_methods(
-        self, category: str, problem_description: str
+        self, category: str, hits: Dict[str, int], similar: Sequence[str] = ()
     ) -> List[Dict[str, Any]]:
         """카테고리에 맞는 방법론 추천 - Question Storming 항상 첫 번째"""
-        recommendations = []
+        from .methods.templates import ALL_METHODS
 
-        # PRIMARY: Question Storming 항상 첫 번째
-        if "question_storming" in ALL_METHODS:
-            qs = ALL_METHODS["question_storming"]
+        recommendations = []
+        additional = list(similar) + self._get_additional_methods(hits)
+        for method_id in self._recommended_method_ids(category, additional):
+            method = ALL_METHODS[method_id]
             recommendations.append({
-                "id": "question_storming",
-                "name": qs["name"],
-                "category": qs["category"],
-                "best_for": qs["best_for"],
-                "steps": qs["steps"]
+                "id": method_id,
+                "name": method["name"],
+                "category": method["category"],
+                "best_for": method["best_for"],
+                "steps": method["steps"]
             })
+        return recommendations
 
-        method_ids = CATEGORY_MAP.get(category, [])
-        additional_methods = self._get_additional_methods(problem_description)
-        all_method_ids = [m for m in list(set(method_ids + additional_methods))
-                         if m != "question_storming"]
-
-        for method_id in all_method_ids[:4]:
-            if method_id in ALL_METHODS:
-                method = ALL_METHODS[method_id]
-                recommendations.append({
-                    "id": method_id,
-                    "name": method["name"],
-                    "category": method["category"],
-                    "best_for": method["best_for"],
-                    "steps": method["steps"]
-                })
+    def _recommended_method_ids(self, category: str, additional: List[str]) -> List[str]:
+        """
+        추천 방법론 ID 목록
 
-        return recommendations
+        Question Storming 다음에 문제 텍스트가 가리키는 방법론(additional - 임베딩 유사도,
+        키워드 규칙 순), 카테고리 기본 방법론 순 (중복 제거, 최대 4개 중 카탈로그에 있는 것만)
+        """
+        from .methods.templates import ALL_METHODS, CATEGORY_MAP
 
-    def _get_additional_methods(self, text: str) -> List[str]:
-        text_lower = text.lower()
-        additional = []
-
-        if text_lower.count("왜") >= 2 or text_lower.count("why") >= 2:
-            additional.append("five_whys")
-        if "제품" in text_lower or "product" in text_lower:
-            additional.append("scamper")
-        if "미래" in text_lower or "future" in text_lower:
-            additional.append("scenario_planning")
-        if "팀" in text_lower or "조직" in text_lower:
-            additional.append("six_hats")
-        if "결정" in text_lower or "decision" in text_lower:
-            additional.append("decision_tree")
-        if "swot" in text_lower:
-            additional.append("swot")
-        if "원인" in text_lower or "cause" in text_lower:
-            additional.append("fishbone")
-        if "투자" in text_lower or "investment" in text_lower:
-            additional.append("cost_benefit")
-        if "리스크" in text_lower or "risk" in text_lower:
-            additional.append("pre_mortem")
-        if "후회" in text_lower or "regret" in text_lower:
-            additional.append("regret_minimization")
-
-        return additional
+        method_ids = ["question_storming"] if "question_storming" in ALL_METHODS else []
+        candidates = [
+            m for m in dict.fromkeys(additional + CATEGORY_MAP.get(category, []))
+            if m != "question_storming"
+        ]
+        method_ids.extend(m for m in candidates[:4] if m in ALL_METHODS)
+        return method_ids
+
+    def _get_additional_methods(self, hits: Dict[str, int]) -> List[str]:
+        return [
+            method_id
+            for method_id, keywords, min_count in self._additional_rules
+            if any(hits.get(keyword, 0) >= min_count for keyword in keywords)
+        ]
 
     def _generate_reasoning(self, category: str, problem: str, confidence: float) -> str:
         category_names = {
@@ -161,3 +341,13 @@ class ProblemClassifier:
 
 
 classifier = ProblemClassifier()
+
+
+def classify_problem(problem_description: str) -> Dict[str, Any]:
+    """
+    모듈 싱글톤으로 분류 (프로세스 풀에 넘기는 함수)
+
+    바운드 메서드 대신 이 함수를 넘기면 분류기 객체를 피클하지 않고,
+    작업자 프로세스는 자기 프로세스에서 만든 싱글톤(단어 캐시 포함)을 재사용합니다.
+    """
+    return classifier.classify(problem_description)
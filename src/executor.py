@@ -0,0 +1,235 @@
+"""
+Blocking Work Executor
+이벤트 루프를 막는 동기 작업(파일 I/O, 임베딩, 벡터 검색)을 별도 풀에서 실행
+
+환경변수:
+    INNOVATION_SOCRATIC_EXECUTOR_THREADS: 스레드 풀 크기 (기본 8)
+    INNOVATION_SOCRATIC_EXECUTOR_PROCESSES: 프로세스 풀 크기 (기본 0 = 사용 안 함)
+    INNOVATION_SOCRATIC_EXECUTOR_QUEUE: 대기 가능한 최대 작업 수 (기본 256)
+    INNOVATION_SOCRATIC_EXECUTOR_TIMEOUT: 기본 호출 타임아웃 초 (기본 30, 0 = 무제한)
+"""
+
+import asyncio
+import functools
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+
+class ExecutorSaturated(RuntimeError):
+    """대기열이 가득 차서 작업을 받을 수 없음"""
+
+
+class ExecutorTimeout(TimeoutError):
+    """작업이 타임아웃 내에 끝나지 않음"""
+
+
+def _noop() -> None:
+    return None
+
+
+def _process_context():
+    """워밍업된 메모리를 공유하도록 가능하면 fork 사용"""
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+class BlockingExecutor:
+    """
+    스레드/프로세스 풀 디스패치 계층
+
+    - run(): 스레드 풀 (파일 I/O, 세션 저장 등)
+    - run(..., pool="process"): 프로세스 풀 (CPU 작업, 피클 가능한 함수만)
+    - 호출별 타임아웃, 요청 취소 시 아직 시작하지 않은 작업 취소
+      (이미 시작한 스레드 작업은 멈출 수 없으므로 상태를 바꾸는 작업은 run_mutation 사용)
+    - 대기열 길이/실행 중 작업 수 통계
+    """
+
+    def __init__(
+        self,
+        threads: Optional[int] = None,
+        processes: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        default_timeout: Optional[float] = None
+    ):
+        self.threads = threads or _env_int("INNOVATION_SOCRATIC_EXECUTOR_THREADS", 8)
+        self.processes = processes if processes is not None else \
+            _env_int("INNOVATION_SOCRATIC_EXECUTOR_PROCESSES", 0)
+        self.max_queue = max_queue or _env_int("INNOVATION_SOCRATIC_EXECUTOR_QUEUE", 256)
+        timeout = default_timeout if default_timeout is not None else \
+            _env_float("INNOVATION_SOCRATIC_EXECUTOR_TIMEOUT", 30.0)
+        self.default_timeout = timeout if timeout > 0 else None
+
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._pending = 0
+        self._max_pending = 0
+        self._completed = 0
+        self._failed = 0
+        self._timeouts = 0
+        self._cancelled = 0
+        self._rejected = 0
+
+    def _get_pool(self, pool: str) -> Executor:
+        """풀 지연 생성"""
+        with self._pool_lock:
+            if pool == "process" and self.processes > 0:
+                if self._process_pool is None:
+                    self._process_pool = ProcessPoolExecutor(
+                        max_workers=self.processes,
+                        mp_context=_process_context()
+                    )
+                return self._process_pool
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPoolExecutor(
+                    max_workers=self.threads,
+                    thread_name_prefix="socratic-worker"
+                )
+            return self._thread_pool
+
+    async def run(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        timeout: Optional[float] = None,
+        pool: str = "thread",
+        **kwargs: Any
+    ) -> Any:
+        """동기 함수를 풀에서 실행하고 결과를 기다림 (timeout=0이면 무제한)"""
+        with self._lock:
+            if self._pending >= self.max_queue:
+                self._rejected += 1
+                raise ExecutorSaturated(
+                    f"작업 대기열이 가득 찼습니다 ({self._pending}/{self.max_queue})"
+                )
+            self._pending += 1
+            self._queued += 1
+            self._max_pending = max(self._max_pending, self._pending)
+
+        executor = self._get_pool(pool)
+        try:
+            if isinstance(executor, ProcessPoolExecutor):
+                # 프로세스 풀은 시작 시점을 알 수 없으므로 제출 즉시 실행 중으로 계산
+                future = executor.submit(fn, *args, **kwargs)
+                self._mark_started()
+                future.add_done_callback(functools.partial(self._on_done, True))
+            else:
+                future = executor.submit(self._call, fn, args, kwargs)
+                future.add_done_callback(functools.partial(self._on_done, False))
+        except RuntimeError:
+            # 종료된 풀에 제출한 경우
+            with self._lock:
+                self._pending -= 1
+                self._queued -= 1
+                self._rejected += 1
+            raise
+
+        limit = self.default_timeout if timeout is None else timeout or None
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), limit)
+        except asyncio.TimeoutError:
+            future.cancel()
+            with self._lock:
+                self._timeouts += 1
+            name = getattr(fn, "__qualname__", repr(fn))
+            raise ExecutorTimeout(f"{name} 작업이 {limit}초 안에 끝나지 않았습니다") from None
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+
+    async def run_mutation(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        상태를 바꾸는 작업 실행 (세션 생성/답변 저장 등, 스레드 풀, 타임아웃 없음)
+
+        시작한 작업은 취소할 수 없어 타임아웃 오류 후에도 저장될 수 있으므로
+        (클라이언트가 재시도하면 답변이 두 번 기록됨) 끝날 때까지 기다립니다.
+        """
+        return await self.run(fn, *args, timeout=0, **kwargs)
+
+    def _call(self, fn: Callable[..., Any], args: tuple, kwargs: Dict[str, Any]) -> Any:
+        self._mark_started()
+        return fn(*args, **kwargs)
+
+    def _mark_started(self):
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+
+    def _on_done(self, counted_running: bool, future: Future):
+        with self._lock:
+            self._pending -= 1
+            if future.cancelled():
+                # 시작 전에 취소된 작업
+                if counted_running:
+                    self._running -= 1
+                else:
+                    self._queued -= 1
+                self._cancelled += 1
+                return
+            self._running -= 1
+            if future.exception() is not None:
+                self._failed += 1
+            else:
+                self._completed += 1
+
+    def prestart(self, pool: str = "thread"):
+        """첫 요청 전에 워커를 미리 띄움 (프로세스 풀은 현재 메모리 상태로 fork)"""
+        executor = self._get_pool(pool)
+        workers = self.processes if isinstance(executor, ProcessPoolExecutor) else self.threads
+        futures = [executor.submit(_noop) for _ in range(workers)]
+        for future in futures:
+            future.result()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """통계 (풀 크기 조정용)"""
+        with self._lock:
+            return {
+                "threads": self.threads,
+                "processes": self.processes,
+                "max_queue": self.max_queue,
+                "queued": self._queued,
+                "running": self._running,
+                "pending": self._pending,
+                "max_pending": self._max_pending,
+                "completed": self._completed,
+                "failed": self._failed,
+                "timeouts": self._timeouts,
+                "cancelled": self._cancelled,
+                "rejected": self._rejected,
+            }
+
+    def shutdown(self, wait: bool = True):
+        """풀 종료"""
+        with self._pool_lock:
+            if self._thread_pool is not None:
+                self._thread_pool.shutdown(wait=wait, cancel_futures=not wait)
+                self._thread_pool = None
+            if self._process_pool is not None:
+                self._process_pool.shutdown(wait=wait, cancel_futures=not wait)
+                self._process_pool = None
+
+
+# 싱글톤 인스턴스
+executor = BlockingExecutor()
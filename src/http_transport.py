@@ -0,0 +1,92 @@
+"""
+Streamable HTTP Transport
+하나의 장기 실행 프로세스에서 여러 MCP 클라이언트를 HTTP/SSE로 처리
+
+stdio 모드는 클라이언트마다 프로세스를 새로 띄우지만,
+HTTP 모드는 방법론 카탈로그와 RAG 인덱스를 한 번만 로드한 뒤
+모든 연결이 공유합니다. CPU 작업은 워밍업 이후 fork된 워커 프로세스
+풀에서 실행되어 같은 메모리 페이지(copy-on-write)를 공유합니다.
+"""
+
+import contextlib
+import sys
+from typing import AsyncIterator
+
+try:
+    import uvicorn
+    from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+    from starlette.applications import Starlette
+    from starlette.routing import Mount
+    HTTP_AVAILABLE = True
+except ImportError:
+    HTTP_AVAILABLE = False
+
+from mcp.server import Server
+
+from .executor import executor
+
+
+def warm_shared_state(warm_rag: bool = False):
+    """fork 전에 공유할 상태(방법론 카탈로그, 분류기, RAG 인덱스) 로드"""
+    from .classifier import classifier
+    from .methods.templates import ALL_METHODS
+
+    classifier.classify("warmup")
+    if warm_rag:
+        from .rag import rag_engine
+        rag_engine.warmup()
+    return len(ALL_METHODS)
+
+
+def build_app(server: Server, json_response: bool = False) -> "Starlette":
+    """MCP 서버를 /mcp 경로에 마운트한 ASGI 앱 생성"""
+    session_manager = StreamableHTTPSessionManager(
+        app=server,
+        json_response=json_response,
+        stateless=False
+    )
+
+    async def handle_mcp(scope, receive, send):
+        await session_manager.handle_request(scope, receive, send)
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app) -> AsyncIterator[None]:
+        async with session_manager.run():
+            yield
+
+    return Starlette(routes=[Mount("/mcp", app=handle_mcp)], lifespan=lifespan)
+
+
+async def serve_http(
+    server: Server,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    workers: int = 0,
+    json_response: bool = False,
+    warm_rag: bool = False
+):
+    """HTTP 서버 실행 (workers > 0이면 CPU 작업용 프로세스 풀 사용)"""
+    if not HTTP_AVAILABLE:
+        raise RuntimeError(
+            "HTTP transport requires uvicorn and starlette: "
+            "pip install 'innovation-socratic-mcp[http]'"
+        )
+
+    methods = warm_shared_state(warm_rag=warm_rag)
+    if workers > 0:
+        executor.processes = workers
+        executor.prestart(pool="process")
+
+    print(
+        f"Innovation Socratic MCP listening on http://{host}:{port}/mcp "
+        f"({methods} methods, {workers} worker processes)",
+        file=sys.stderr
+    )
+
+    config = uvicorn.Config(
+        build_app(server, json_response=json_response),
+        host=host,
+        port=port,
+        log_level="warning"
+    )
+    await uvicorn.Server(config).serve()
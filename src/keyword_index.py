@@ -0,0 +1,378 @@
+"""
+Keyword Index
+단어 경계를 확인하는 분류용 키워드 검색 - 공백 단위 단어 캐시 + KeywordMatcher
+
+- 텍스트를 공백으로 나눠 같은 단어를 묶고(C 수준 split/Counter) 단어마다 캐시 조회 한 번
+- 처음 보는 단어만 KeywordMatcher(키워드, 영문은 활용형의 공통 어간을 컴파일)로 훑고
+  찾은 위치마다 앞뒤 글자로 단어 경계를 확인한 결과를 캐시
+- 공백이 들어간 구문 키워드("market analysis")는 텍스트 전체에서 따로 확인
+- 영문: 앞 글자가 영문/숫자가 아니고, 뒤에 이어지는 글자가 활용 어미
+  (-s, -es, -ies, -ed, -ing 등)뿐이어야 함
+  → "user"는 "users"와 매치되지만 "abuser", "username"과는 매치되지 않음
+- 한글: 어절 안에서 키워드 뒤에 남은 부분이 조사/어미("은", "들과", "하고", "적인" 등)여야 함
+  - 두 음절 이상 키워드는 복합어 뒤쪽에 있어도 되고 ("신제품"),
+    뒤에 파생 접미사("개발자", "효율성")나 다른 키워드가 이어져도 됨 ("제품개발에")
+    → "이유식"은 "이유"와 매치되지 않음
+  - 한 음절 키워드("팀", "왜")는 어절 첫 글자여야 하고 뒤에는 조사/어미만
+    → "팀은"은 매치, "스팀", "팀원"은 매치 안 됨
+- 겹치는 키워드는 각각 확인 ("시장분석"은 "시장분석"과 "분석" 모두)
+- 카테고리별 가중치는 TF-IDF: 카테고리 키워드 목록을 문서로 보고
+  여러 카테고리에 나오는 키워드("제품", "product")일수록 낮은 가중치
+
+사용법:
+    index = KeywordIndex({"organizational": ["팀", "team"]})
+    index.count("우리 팀은 Teams를 씁니다")  # {"팀": 1, "team": 1}
+"""
+
+import math
+import re
+from collections import Counter
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+from .matcher import KeywordMatcher
+
+_WORD_CHARS = frozenset("0123456789abcdefghijklmnopqrstuvwxyz")
+_WORD_REST = re.compile(r"[0-9a-z]*")
+_HANGUL_REST = re.compile(r"[가-힣]*")
+
+# 명사 뒤에 붙는 조사/서술격 조사
+_JOSA = frozenset("""
+은 는 이 가 을 를 의 에 에서 에게 에게서 께 께서 와 과 도 만 로 으로 로서 으로서 로써 으로써
+까지 부터 보다 처럼 같이 마다 이나 나 이든 든 이랑 랑 하고 한테 요 이요 인 일 임 이다 입니다
+이에요 예요 이고 이며 이라 라 이라는 라는 이란 란 에는 에도 에서는 에서도 으로는 로는 과의 와의
+""".split())
+
+# 첫 음절이 이 중 하나면 서술어 어미로 봄 (성장하고, 결정해야, 개선된, 전략적인)
+_PREDICATE_HEADS = frozenset("하해할한했합함되된될됐돼시적")
+
+# 두 음절 이상 키워드 뒤에 붙어도 같은 뜻으로 보는 파생 접미사 (개발자, 효율성, 경쟁력, 고객별)
+_NOUN_SUFFIXES = frozenset("자성력화별용형")
+
+# 단어/꼬리 캐시 상한 (넘으면 비움)
+_WORD_CACHE_SIZE = 65536
+
+# 이보다 단어가 많으면 같은 단어를 묶어서 조회
+_COUNTER_MIN_WORDS = 32
+
+# batch_ids에서 텍스트 사이에 넣는 구분 단어 (공백으로 둘러싸 단어 하나로 나뉨)
+_BATCH_SEPARATOR_WORD = "\x00"
+_BATCH_SEPARATOR = f" {_BATCH_SEPARATOR_WORD} "
+
+
+def _is_hangul(char: str) -> bool:
+    return "가" <= char <= "힣"
+
+
+def _is_ending(ending: str) -> bool:
+    """조사/어미만 남았는지 (빈 문자열 포함)"""
+    if ending.startswith("들"):
+        ending = ending[1:]
+    return not ending or ending in _JOSA or ending[0] in _PREDICATE_HEADS
+
+
+def _english_forms(keyword: str) -> List[str]:
+    """영문 키워드와 활용형 (단순 접미사 규칙, 마지막 단어 기준)"""
+    forms = [keyword, keyword + "s", keyword + "es", keyword + "ed", keyword + "ing"]
+    last = keyword[-1]
+    if last == "e":
+        forms += [keyword + "d", keyword[:-1] + "ing"]  # improved, improving
+    elif last == "y" and len(keyword) > 1 and keyword[-2] not in "aeiou":
+        forms += [keyword[:-1] + "ies", keyword[:-1] + "ied"]  # strategies
+    elif last.isalpha() and last not in "aeiouwxy":
+        forms += [keyword + last + "ed", keyword + last + "ing"]  # planned, planning
+    return forms
+
+
+class KeywordIndex:
+    """키워드 검색기와 카테고리별 TF-IDF 가중치 (생성 시 한 번 구성, 이후 읽기 전용)"""
+
+    def __init__(self, categories: Dict[str, Sequence[str]], extra_keywords: Iterable[str] = ()):
+        """
+        Args:
+            categories: 카테고리 → 키워드 목록 (가중치 계산 대상)
+            extra_keywords: 가중치 없이 등장 횟수만 셀 키워드 (추가 방법론 규칙용)
+        """
+        self.categories = tuple(categories)
+        category_keywords = {
+            category: tuple(dict.fromkeys(k.lower() for k in keywords if k))
+            for category, keywords in categories.items()
+        }
+        self.keywords: Tuple[str, ...] = tuple(dict.fromkeys(
+            [k for keywords in category_keywords.values() for k in keywords]
+            + [k.lower() for k in extra_keywords if k]
+        ))
+        self._ids = {keyword: i for i, keyword in enumerate(self.keywords)}
+
+        # TF-IDF (카테고리 = 문서, 카테고리 안 TF = 1, 스무딩한 IDF)
+        document_frequency = [0] * len(self.keywords)
+        for keywords in category_keywords.values():
+            for keyword in keywords:
+                document_frequency[self._ids[keyword]] += 1
+        n = len(self.categories)
+        idf = [math.log((1 + n) / (1 + df)) + 1.0 for df in document_frequency]
+        self.weights: Tuple[Dict[str, float], ...] = tuple(
+            {} for _ in self.keywords
+        )
+        for category, keywords in category_keywords.items():
+            for keyword in keywords:
+                self.weights[self._ids[keyword]][category] = idf[self._ids[keyword]]
+
+        # 검색 패턴 → (키워드 번호, 종류, 허용 꼬리) 목록
+        # 종류: "latin" (허용 꼬리 = 활용 어미), "hangul" (두 음절 이상), "syllable" (한 음절)
+        candidates: Dict[str, List[Tuple[int, str, frozenset]]] = {}
+        for index, keyword in enumerate(self.keywords):
+            if _is_hangul(keyword[-1]):
+                kind = "syllable" if len(keyword) == 1 else "hangul"
+                candidates.setdefault(keyword, []).append((index, kind, frozenset()))
+                continue
+            forms = _english_forms(keyword) if keyword[-1].isalpha() else [keyword]
+            stem = keyword
+            while not all(form.startswith(stem) for form in forms):
+                stem = stem[:-1]
+            suffixes = frozenset(form[len(stem):] for form in forms)
+            candidates.setdefault(stem, []).append((index, "latin", suffixes))
+        # 공백이 들어간 구문("market analysis")은 단어 단위 검색과 따로 텍스트 전체에서 확인
+        self._phrases = tuple(
+            (pattern, self._compile(pattern, entries))
+            for pattern, entries in candidates.items() if " " in pattern
+        )
+        self._matcher = KeywordMatcher(pattern for pattern in candidates if " " not in pattern)
+        self._candidates = tuple(
+            self._compile(pattern, candidates[pattern]) for pattern in self._matcher.keywords
+        )
+
+        # 복합어 꼬리에서 찾을 두 음절 이상 한글 키워드
+        self._compounds = frozenset(
+            keyword for keyword in self.keywords if len(keyword) >= 2 and _is_hangul(keyword[0])
+        )
+        self._compound_lengths = sorted({len(k) for k in self._compounds}, reverse=True)
+        # 단어 → 키워드 번호 캐시 (일반 dict - 프로세스 풀로 보낼 때 pickle 가능)
+        self._words: Dict[str, Tuple[int, ...]] = {}
+        self._tails: Dict[str, bool] = {}
+
+    @staticmethod
+    def _compile(
+        pattern: str,
+        entries: List[Tuple[int, str, frozenset]]
+    ) -> Tuple[Tuple[int, str, int, frozenset], ...]:
+        """(키워드 번호, 종류, 패턴 길이, 허용 꼬리) 튜플로 변환"""
+        return tuple((index, kind, len(pattern), suffixes) for index, kind, suffixes in entries)
+
+    def _tail_ok(self, tail: str) -> bool:
+        """두 음절 이상 키워드 뒤 한글 꼬리가 같은 단어로 볼 수 있는지 (결과 캐시)"""
+        ok = self._tails.get(tail)
+        if ok is None:
+            ok = (
+                _is_ending(tail)
+                or tail[0] in _NOUN_SUFFIXES and _is_ending(tail[1:])
+                or any(
+                    tail[:length] in self._compounds and self._tail_ok(tail[length:])
+                    for length in self._compound_lengths
+                )
+            )
+            if len(self._tails) >= _WORD_CACHE_SIZE:
+                self._tails.clear()
+            self._tails[tail] = ok
+        return ok
+
+    def _accept(self, text: str, end: int, kind: str, length: int, suffixes: frozenset) -> bool:
+        """text[end - length:end]의 등장이 단어 경계를 지키는지"""
+        start = end - length
+        if kind == "latin":
+            if start and text[start - 1] in _WORD_CHARS:
+                return False
+            if end < len(text) and text[end] in _WORD_CHARS:
+                return text[end:_WORD_REST.match(text, end).end()] in suffixes
+            return "" in suffixes
+
+        if kind == "syllable" and start and _is_hangul(text[start - 1]):
+            return False
+        if end < len(text) and _is_hangul(text[end]):
+            tail = text[end:_HANGUL_REST.match(text, end).end()]
+            return _is_ending(tail) if kind == "syllable" else self._tail_ok(tail)
+        return True
+
+    def _resolve_words(self, words: Iterable[str]) -> Dict[str, Tuple[int, ...]]:
+        """
+        처음 보는 단어들의 키워드 번호 (등장마다 하나씩)
+
+        단어들을 공백으로 이어 붙여 KeywordMatcher로 한 번만 훑고 결과를 캐시에 저장합니다.
+        """
+        # 키워드가 없는 단어(대부분)는 빈 튜플
+        resolved: Dict[str, Tuple[int, ...]] = dict.fromkeys(words, ())
+        # 공백은 영문/한글 글자가 아니므로 이어 붙인 텍스트에서 확인해도 단어 안에서와 같음
+        joined = " ".join(resolved)
+        found: Dict[str, List[int]] = {}
+        for last, pattern in self._matcher.occurrences(joined):
+            for index, kind, length, suffixes in self._candidates[pattern]:
+                if self._accept(joined, last + 1, kind, length, suffixes):
+                    end = joined.find(" ", last)
+                    word = joined[joined.rfind(" ", 0, last) + 1:end if end != -1 else len(joined)]
+                    found.setdefault(word, []).append(index)
+
+        for word, ids in found.items():
+            resolved[word] = tuple(ids)
+        if len(resolved) <= _WORD_CACHE_SIZE:
+            if len(self._words) + len(resolved) > _WORD_CACHE_SIZE:
+                self._words.clear()
+            self._words.update(resolved)
+        return resolved
+
+    def _phrase_hits(self, text: str) -> List[Tuple[int, int]]:
+        """텍스트에 들어 있는 구문 키워드 (시작 위치, 키워드 번호)"""
+        hits = []
+        for pattern, entries in self._phrases:
+            start = text.find(pattern)
+            while start != -1:
+                end = start + len(pattern)
+                hits.extend(
+                    (start, index) for index, kind, length, suffixes in entries
+                    if self._accept(text, end, kind, length, suffixes)
+                )
+                start = text.find(pattern, start + 1)
+        return hits
+
+    def count(self, text: str) -> Dict[str, int]:
+        """키워드별 등장 횟수 (등장한 키워드만, 키워드 번호 순)"""
+        text = text.lower()
+        split = text.split()
+        counts: Dict[int, int] = {}
+        words = self._words
+        pending: List[Tuple[str, int]] = []
+        if len(split) > _COUNTER_MIN_WORDS:
+            # 긴 텍스트는 같은 단어를 묶어 한 번만 조회
+            for word, n in Counter(split).items():
+                ids = words.get(word)
+                if ids is None:
+                    pending.append((word, n))
+                    continue
+                for index in ids:
+                    counts[index] = counts.get(index, 0) + n
+        else:
+            # 짧은 텍스트는 Counter 생성 비용이 조회보다 큼
+            for word in split:
+                ids = words.get(word)
+                if ids is None:
+                    pending.append((word, 1))
+                    continue
+                for index in ids:
+                    counts[index] = counts.get(index, 0) + 1
+        if pending:
+            resolved = self._resolve_words([word for word, _ in pending])
+            for word, n in pending:
+                for index in resolved[word]:
+                    counts[index] = counts.get(index, 0) + n
+        if self._phrases:
+            # 구문은 공백을 하나로 맞춘 텍스트에서 찾음 (줄바꿈/연속 공백이 있어도 같은 결과)
+            spaced = " ".join(split)
+            for pattern, _ in self._phrases:
+                if pattern in spaced:
+                    for _, index in self._phrase_hits(spaced):
+                        counts[index] = counts.get(index, 0) + 1
+                    break
+        return {self.keywords[index]: counts[index] for index in sorted(counts)}
+
+    def batch_ids(self, texts: Sequence[str]) -> Tuple[Any, Any]:
+        """
+        여러 텍스트의 키워드 등장 (NumPy, 배치 분류용)
+
+        텍스트를 구분 단어로 이어 붙여 소문자 변환/split을 한 번에 하고,
+        서로 다른 단어만 조회한 뒤 C 수준 map/repeat로 펼칩니다.
+
+        Returns:
+            (텍스트 번호 배열, 키워드 번호 배열) - 등장마다 한 쌍
+        """
+        import numpy as np
+
+        words = _BATCH_SEPARATOR.join(texts).lower().split()
+        separators = max(len(texts) - 1, 0)
+
+        # 서로 다른 단어만 조회 → 단어 번호, 단어별 키워드 번호 (CSR: 시작 위치 + 개수)
+        cached = self._words
+        unique = list(set(words))
+        table = {word: cached[word] for word in unique if word in cached}
+        table.update(self._resolve_words([word for word in unique if word not in table]))
+        codes = {word: code for code, word in enumerate(unique)}
+        unique_ids = [table[word] for word in unique]
+        unique_counts = np.fromiter(map(len, unique_ids), dtype=np.int64, count=len(unique))
+        unique_starts = np.cumsum(unique_counts) - unique_counts
+        flat_ids = np.fromiter(
+            chain.from_iterable(unique_ids), dtype=np.int64, count=int(unique_counts.sum())
+        )
+
+        word_codes = np.fromiter(map(codes.__getitem__, words), dtype=np.int64, count=len(words))
+        is_separator = word_codes == codes.get(_BATCH_SEPARATOR_WORD, -1)
+        if int(is_separator.sum()) != separators:
+            # 텍스트 안에 구분 단어가 있는 경우 (드묾)
+            return self._batch_ids_each(texts)
+        word_docs = np.cumsum(is_separator)
+
+        # 키워드가 있는 단어만 등장 수만큼 펼침
+        hit_words = np.flatnonzero(unique_counts[word_codes])
+        counts = unique_counts[word_codes[hit_words]]
+        docs = np.repeat(word_docs[hit_words], counts)
+        offsets = np.arange(int(counts.sum())) - np.repeat(np.cumsum(counts) - counts, counts)
+        ids = flat_ids[np.repeat(unique_starts[word_codes[hit_words]], counts) + offsets]
+
+        # 구문은 count와 같이 공백을 하나로 맞춘 텍스트에서 찾고, 위치 → 단어 → 텍스트 번호
+        spaced = " ".join(words)
+        phrase_hits = self._phrase_hits(spaced) if any(
+            pattern in spaced for pattern, _ in self._phrases
+        ) else []
+        if phrase_hits:
+            word_lengths = np.fromiter(map(len, words), dtype=np.int64, count=len(words)) + 1
+            word_starts = np.cumsum(word_lengths) - word_lengths
+            positions, found = zip(*phrase_hits)
+            hit_words = np.searchsorted(word_starts, positions, side="right") - 1
+            docs = np.concatenate([docs, word_docs[hit_words]])
+            ids = np.concatenate([ids, np.array(found, dtype=np.int64)])
+        return docs, ids
+
+    def _batch_ids_each(self, texts: Sequence[str]) -> Tuple[Any, Any]:
+        """batch_ids를 텍스트마다 count로 계산"""
+        import numpy as np
+
+        docs: List[int] = []
+        ids: List[int] = []
+        for doc, text in enumerate(texts):
+            for keyword, count in self.count(text).items():
+                docs.extend([doc] * count)
+                ids.extend([self._ids[keyword]] * count)
+        return np.array(docs, dtype=np.int64), np.array(ids, dtype=np.int64)
+
+    def score(self, hits: Dict[str, int]) -> Dict[str, float]:
+        """카테고리별 점수 = 등장한 서로 다른 키워드의 TF-IDF 가중치 합 (키워드 번호 순으로 합산)"""
+        scores = {category: 0.0 for category in self.categories}
+        for keyword in hits:
+            for category, weight in self.weights[self._ids[keyword]].items():
+                scores[category] += weight
+        return scores
+
+    def weight_matrix(self) -> Any:
+        """키워드 × 카테고리 가중치 행렬 (NumPy, 배치 분류용)"""
+        import numpy as np
+
+        matrix = np.zeros((len(self.keywords), len(self.categories)))
+        columns = {category: i for i, category in enumerate(self.categories)}
+        for row, weights in enumerate(self.weights):
+            for category, weight in weights.items():
+                matrix[row, columns[category]] = weight
+        return matrix
+
+    def clear_cache(self):
+        """단어/꼬리 캐시 비우기"""
+        self._words.clear()
+        self._tails.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """통계"""
+        return {
+            "keywords": len(self.keywords),
+            "patterns": len(self._candidates),
+            "phrases": len(self._phrases),
+            "engine": self._matcher.get_stats()["engine"],
+            "word_cache_size": len(self._words),
+            "tail_cache_size": len(self._tails),
+        }
+
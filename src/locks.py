@@ -0,0 +1,55 @@
+"""
+File Locks
+여러 서버 프로세스가 같은 저장소를 쓸 때의 권고 파일 잠금
+
+- POSIX는 flock (공유/배타)
+- Windows는 msvcrt.locking (공유 잠금이 없어 항상 배타)
+- 잠금 파일은 지우지 않음 (지우면 다른 프로세스가 다른 inode를 잠글 수 있음)
+"""
+
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+def lock_fd(fd: int, shared: bool = False):
+    """권고 잠금 (POSIX flock, Windows는 공유 잠금이 없어 항상 배타)"""
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        return
+    os.lseek(fd, 0, os.SEEK_SET)
+    while True:
+        try:
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)  # 10초 재시도 후 OSError
+            return
+        except OSError:
+            continue
+
+
+def unlock_fd(fd: int):
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def locked_file(path: Union[str, Path], shared: bool = False) -> Iterator[None]:
+    """잠금 파일을 열어 잠근 채로 실행 (없으면 생성)"""
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        lock_fd(fd, shared)
+        try:
+            yield
+        finally:
+            unlock_fd(fd)
+    finally:
+        os.close(fd)
@@ -0,0 +1,222 @@
+"""
+Latency Metrics
+도구 호출/하위 단계별 지연 시간 히스토그램, 오류 수, 동시 실행 수
+
+- HDR 스타일 로그-선형 버킷 (2의 거듭제곱마다 16개 하위 버킷, 상대 오차 ~6%)
+- MCP 리소스(JSON/Prometheus)와 Prometheus textfile 형식으로 노출
+
+환경변수:
+    INNOVATION_SOCRATIC_METRICS_FILE: Prometheus textfile 경로 (없으면 기록 안 함)
+    INNOVATION_SOCRATIC_METRICS_INTERVAL: textfile 기록 주기 초 (기본 15)
+"""
+
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+class LatencyHistogram:
+    """HDR 스타일 지연 시간 히스토그램 (마이크로초 단위 기록)"""
+
+    SUB_BUCKET_BITS = 4
+    SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+
+    def __init__(self):
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def _index(cls, micros: int) -> int:
+        if micros < cls.SUB_BUCKETS:
+            return micros
+        shift = micros.bit_length() - cls.SUB_BUCKET_BITS - 1
+        return ((shift + 1) << cls.SUB_BUCKET_BITS) | ((micros >> shift) & (cls.SUB_BUCKETS - 1))
+
+    @classmethod
+    def _upper_bound(cls, index: int) -> int:
+        """버킷이 담는 최댓값 (마이크로초)"""
+        if index < cls.SUB_BUCKETS:
+            return index
+        shift = (index >> cls.SUB_BUCKET_BITS) - 1
+        mantissa = (index & (cls.SUB_BUCKETS - 1)) | cls.SUB_BUCKETS
+        return ((mantissa + 1) << shift) - 1
+
+    def record(self, seconds: float):
+        """지연 시간 기록"""
+        index = self._index(int(seconds * 1_000_000))
+        with self._lock:
+            self.counts[index] = self.counts.get(index, 0) + 1
+            self.count += 1
+            self.total += seconds
+            if seconds > self.max:
+                self.max = seconds
+
+    def percentile(self, q: float) -> float:
+        """백분위수 (초)"""
+        with self._lock:
+            if not self.count:
+                return 0.0
+            target = max(1, int(q / 100.0 * self.count + 0.5))
+            seen = 0
+            for index in sorted(self.counts):
+                seen += self.counts[index]
+                if seen >= target:
+                    return min(self._upper_bound(index) / 1_000_000, self.max)
+            return self.max
+
+    def summary(self) -> Dict[str, float]:
+        """p50/p95/p99 요약"""
+        return {
+            "count": self.count,
+            "sum": round(self.total, 6),
+            "max": round(self.max, 6),
+            "p50": round(self.percentile(50), 6),
+            "p95": round(self.percentile(95), 6),
+            "p99": round(self.percentile(99), 6),
+        }
+
+
+class Metrics:
+    """단계별 지연 시간/오류/동시 실행 수 수집기"""
+
+    QUANTILES: Tuple[Tuple[str, float], ...] = (("0.5", 50), ("0.95", 95), ("0.99", 99))
+
+    def __init__(self, prefix: str = "innovation_socratic"):
+        self.prefix = prefix
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._errors: Dict[str, int] = {}
+        self._in_flight: Dict[str, int] = {}
+        self._collectors: Dict[str, Callable[[], Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self._writer: Optional[threading.Thread] = None
+
+    def _histogram(self, stage: str) -> LatencyHistogram:
+        histogram = self._histograms.get(stage)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(stage, LatencyHistogram())
+        return histogram
+
+    @contextmanager
+    def track(self, stage: str) -> Iterator[None]:
+        """블록 실행 시간 측정 (예외 발생 시 오류로 집계)"""
+        histogram = self._histogram(stage)
+        with self._lock:
+            self._in_flight[stage] = self._in_flight.get(stage, 0) + 1
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException:
+            with self._lock:
+                self._errors[stage] = self._errors.get(stage, 0) + 1
+            raise
+        finally:
+            histogram.record(time.perf_counter() - start)
+            with self._lock:
+                self._in_flight[stage] -= 1
+
+    def register_collector(self, name: str, collect: Callable[[], Dict[str, Any]]):
+        """외부 통계(get_stats 형식)를 게이지로 함께 노출"""
+        self._collectors[name] = collect
+
+    def in_flight(self, stage: Optional[str] = None) -> int:
+        """진행 중인 호출 수"""
+        with self._lock:
+            if stage is not None:
+                return self._in_flight.get(stage, 0)
+            return sum(self._in_flight.values())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """JSON 스냅샷"""
+        with self._lock:
+            stages = sorted(self._histograms)
+            errors = dict(self._errors)
+            in_flight = dict(self._in_flight)
+
+        stats: Dict[str, Any] = {"stages": {}}
+        for stage in stages:
+            stage_stats = self._histograms[stage].summary()
+            stage_stats["errors"] = errors.get(stage, 0)
+            stage_stats["in_flight"] = in_flight.get(stage, 0)
+            stats["stages"][stage] = stage_stats
+
+        for name, collect in self._collectors.items():
+            try:
+                stats[name] = collect()
+            except Exception as e:
+                stats[name] = {"error": str(e)}
+        return stats
+
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 형식"""
+        stats = self.get_stats()
+        latency = f"{self.prefix}_stage_latency_seconds"
+        errors = f"{self.prefix}_stage_errors_total"
+        in_flight = f"{self.prefix}_stage_in_flight"
+
+        lines: List[str] = [
+            f"# HELP {latency} Stage latency in seconds.",
+            f"# TYPE {latency} summary",
+        ]
+        for stage, s in stats["stages"].items():
+            for label, q in self.QUANTILES:
+                lines.append(f'{latency}{{stage="{stage}",quantile="{label}"}} {s[f"p{q}"]:.6f}')
+            lines.append(f'{latency}_sum{{stage="{stage}"}} {s["sum"]:.6f}')
+            lines.append(f'{latency}_count{{stage="{stage}"}} {s["count"]}')
+
+        lines += [f"# HELP {errors} Stage calls that raised.", f"# TYPE {errors} counter"]
+        lines += [
+            f'{errors}{{stage="{stage}"}} {s["errors"]}' for stage, s in stats["stages"].items()
+        ]
+
+        lines += [f"# HELP {in_flight} Stage calls in progress.", f"# TYPE {in_flight} gauge"]
+        lines += [
+            f'{in_flight}{{stage="{stage}"}} {s["in_flight"]}'
+            for stage, s in stats["stages"].items()
+        ]
+
+        for name in self._collectors:
+            values = stats.get(name, {})
+            for key, value in values.items():
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    continue
+                metric = f"{self.prefix}_{name}_{key}"
+                lines.append(f"# TYPE {metric} gauge")
+                lines.append(f"{metric} {value}")
+
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: str):
+        """Prometheus textfile 기록 (임시 파일 후 교체)"""
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(target.name + ".tmp")
+        tmp.write_text(self.render_prometheus(), encoding="utf-8")
+        os.replace(tmp, target)
+
+    def start_textfile_writer(self, path: str, interval: float = 15.0):
+        """백그라운드 스레드로 textfile 주기적 기록"""
+        if self._writer is not None:
+            return
+
+        def loop():
+            while True:
+                try:
+                    self.write_textfile(path)
+                except Exception as e:
+                    print(f"Metrics write error: {e}", file=sys.stderr)
+                time.sleep(interval)
+
+        self._writer = threading.Thread(target=loop, name="socratic-metrics", daemon=True)
+        self._writer.start()
+
+
+# 싱글톤 인스턴스
+metrics = Metrics()
@@ -3,15 +3,46 @@ Question Generation Engine
 한 번에 하나의 질문만 생성 (토큰 최소화)
 """
 
-from typing import Optional, Dict, Any
-from .methods.templates import ALL_METHODS
+from functools import cached_property
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping, Tuple
 
 
 class QuestionEngine:
     """단일 질문 생성 엔진"""
 
     def __init__(self):
-        self.methods = ALL_METHODS
+        # (method_id, step) → 포맷된 질문 텍스트
+        self._render_cache: Dict[Tuple[str, int], str] = {}
+
+    @cached_property
+    def methods(self) -> Dict[str, Dict[str, Any]]:
+        """방법론 템플릿 (첫 사용 시 로드)"""
+        from .methods.templates import ALL_METHODS
+        return ALL_METHODS
+
+    @cached_property
+    def _method_entries(self) -> Mapping[str, Mapping[str, Any]]:
+        """방법론 ID → 요약 정보 (최초 1회 생성, 읽기 전용)"""
+        return MappingProxyType({
+            method_id: MappingProxyType({
+                "id": method_id,
+                "name": method["name"],
+                "category": method["category"],
+                "steps": method["steps"],
+                "best_for": method["best_for"]
+            })
+            for method_id, method in self.methods.items()
+        })
+
+    @cached_property
+    def _catalog(self) -> Mapping[Optional[str], Tuple[Mapping[str, Any], ...]]:
+        """카테고리별 방법론 목록 (None = 전체)"""
+        entries = tuple(self._method_entries.values())
+        by_category: Dict[Optional[str], Tuple[Mapping[str, Any], ...]] = {None: entries}
+        for entry in entries:
+            by_category[entry["category"]] = by_category.get(entry["category"], ()) + (entry,)
+        return MappingProxyType(by_category)
 
     def generate_question(
         self,
@@ -56,6 +87,19 @@ class QuestionEngine:
             "is_last": (step == total_steps - 1)
         }
 
+    def render_question(self, method_id: str, step: int) -> str:
+        """
+        질문 생성 + 포맷팅 결과 캐시 (문맥 없는 질문은 방법론/단계로만 결정됨)
+        """
+        key = (method_id, step)
+        text = self._render_cache.get(key)
+        if text is None:
+            question_data = self.generate_question(method_id, step)
+            text = self.format_question_output(question_data)
+            if "error" not in question_data:
+                self._render_cache[key] = text
+        return text
+
     def _contextualize_question(
         self,
         question: str,
@@ -65,37 +109,15 @@ class QuestionEngine:
         return question
 
     def get_method_info(self, method_id: str) -> Optional[Dict[str, Any]]:
-        if method_id not in self.methods:
-            return None
-
-        method = self.methods[method_id]
-        return {
-            "id": method_id,
-            "name": method["name"],
-            "category": method["category"],
-            "steps": method["steps"],
-            "best_for": method["best_for"]
-        }
+        entry = self._method_entries.get(method_id)
+        return dict(entry) if entry is not None else None
 
     def list_methods(
         self,
         category: Optional[str] = None
     ) -> list[Dict[str, Any]]:
-        methods_list = []
-
-        for method_id, method in self.methods.items():
-            if category and method["category"] != category:
-                continue
-
-            methods_list.append({
-                "id": method_id,
-                "name": method["name"],
-                "category": method["category"],
-                "steps": method["steps"],
-                "best_for": method["best_for"]
-            })
-
-        return methods_list
+        """방법론 목록 (미리 만들어 둔 요약에서 복사한 dict 목록)"""
+        return [dict(entry) for entry in self._catalog.get(category or None, ())]
 
     def format_question_output(self, question_data: Dict[str, Any]) -> str:
         """
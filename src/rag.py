@@ -3,21 +3,31 @@ RAG (Retrieval-Augmented Generation) Integration
 ChromaDB 기반 벡터 검색으로 사고 방법론 추천
 
 NOTE: Lazy initialization is used to prevent slow server startup.
-ChromaDB and SentenceTransformer models are loaded only when first needed.
+ChromaDB, SentenceTransformer and yaml are imported only when first needed;
+at module load we only check whether chromadb is installed.
+
+Optional background warmup (start_warmup) loads the model, the collection and
+runs a dummy query off the request path. Searches that arrive while warmup is
+running either wait for it or use keyword fallback:
+    INNOVATION_SOCRATIC_WARMUP_POLICY: wait | fallback (default wait)
+    INNOVATION_SOCRATIC_WARMUP_WAIT: max seconds to wait (default 30)
 """
 
+import importlib.util
 import os
 import sys
-import yaml
+import threading
+import time
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
 try:
-    import chromadb
-    from chromadb.utils import embedding_functions
-    CHROMADB_AVAILABLE = True
+    from .metrics import metrics
 except ImportError:
-    CHROMADB_AVAILABLE = False
+    from metrics import metrics
+
+# 설치 여부만 확인 (chromadb import 자체는 수 초가 걸릴 수 있음)
+CHROMADB_AVAILABLE = importlib.util.find_spec("chromadb") is not None
 
 
 class RAGEngine:
@@ -29,6 +39,14 @@ class RAGEngine:
         self.indexed = False
         self.documents: Dict[str, str] = {}
         self._initialized = False
+        self._init_lock = threading.RLock()
+
+        # Background warmup
+        self.warmup_policy = os.environ.get("INNOVATION_SOCRATIC_WARMUP_POLICY", "wait")
+        self.warmup_wait = float(os.environ.get("INNOVATION_SOCRATIC_WARMUP_WAIT", "30"))
+        self._warmup_thread: Optional[threading.Thread] = None
+        self._warmup_done = threading.Event()
+        self._warmup_status: Dict[str, Any] = {"state": "idle", "step": None, "progress": 0.0}
 
         # Only initialize immediately if not lazy (for CLI usage)
         if not lazy_init and CHROMADB_AVAILABLE:
@@ -37,10 +55,62 @@ class RAGEngine:
 
     def _ensure_initialized(self):
         """Lazy initialization - only initialize ChromaDB when first needed"""
-        if not self._initialized and CHROMADB_AVAILABLE:
-            print("Initializing ChromaDB (lazy)...", file=sys.stderr)
-            self._initialize_chromadb()
-            self._initialized = True
+        if self._initialized or not CHROMADB_AVAILABLE:
+            return
+        with self._init_lock:
+            if not self._initialized:
+                print("Initializing ChromaDB (lazy)...", file=sys.stderr)
+                self._initialize_chromadb()
+                self._initialized = True
+
+    def warmup(self) -> Dict[str, Any]:
+        """모델/컬렉션 로드 및 더미 쿼리 실행 (첫 검색 지연 제거)"""
+        started = time.perf_counter()
+        steps = [
+            ("load_model", self._ensure_initialized),
+            ("index", self._ensure_indexed),
+            ("dummy_query", lambda: self._search("warmup", n_results=1)),
+        ]
+        self._warmup_status.update(state="running", started_at=time.time())
+        try:
+            for i, (step, run) in enumerate(steps):
+                self._warmup_status.update(step=step, progress=round(i / len(steps), 2))
+                run()
+            self._warmup_status.update(state="ready", step=None, progress=1.0)
+        except Exception as e:
+            print(f"RAG warmup error: {e}", file=sys.stderr)
+            self._warmup_status.update(state="failed", error=str(e))
+        finally:
+            self._warmup_status["seconds"] = round(time.perf_counter() - started, 3)
+            self._warmup_done.set()
+        return self.get_warmup_status()
+
+    def _ensure_indexed(self):
+        if self.collection is not None and not self.indexed:
+            self.index_knowledge()
+
+    def start_warmup(self) -> bool:
+        """백그라운드 스레드로 워밍업 시작 (이미 시작했으면 False)"""
+        with self._init_lock:
+            if self._warmup_thread is not None or self._warmup_done.is_set():
+                return False
+            self._warmup_status.update(state="pending")
+            self._warmup_thread = threading.Thread(
+                target=self.warmup, name="socratic-rag-warmup", daemon=True
+            )
+            self._warmup_thread.start()
+        return True
+
+    def get_warmup_status(self) -> Dict[str, Any]:
+        """워밍업 진행 상태"""
+        return dict(self._warmup_status, policy=self.warmup_policy)
+
+    def _warming_up(self) -> bool:
+        return (
+            self._warmup_thread is not None
+            and not self._warmup_done.is_set()
+            and threading.current_thread() is not self._warmup_thread
+        )
 
     def _find_knowledge_path(self) -> str:
         current_dir = Path(__file__).parent.parent
@@ -54,6 +124,9 @@ class RAGEngine:
 
     def _initialize_chromadb(self):
         try:
+            import chromadb
+            from chromadb.utils import embedding_functions
+
             persist_dir = Path(self.knowledge_path).parent / ".chromadb"
             persist_dir.mkdir(exist_ok=True)
             self.client = chromadb.PersistentClient(path=str(persist_dir))
@@ -71,6 +144,8 @@ class RAGEngine:
             self.collection = None
 
     def _parse_markdown_file(self, file_path: Path) -> Dict[str, Any]:
+        import yaml
+
         content = file_path.read_text(encoding='utf-8')
         metadata = {}
         body = content
@@ -132,6 +207,14 @@ class RAGEngine:
         return {"success": True, "indexed": indexed, "total": len(md_files)}
 
     def search(self, query: str, n_results: int = 5) -> List[Dict[str, Any]]:
+        with metrics.track("rag_engine.search"):
+            if self._warming_up():
+                if self.warmup_policy == "fallback":
+                    return self._fallback_search(query, n_results)
+                self._warmup_done.wait(self.warmup_wait)
+            return self._search(query, n_results)
+
+    def _search(self, query: str, n_results: int = 5) -> List[Dict[str, Any]]:
         self._ensure_initialized()
 
         if not CHROMADB_AVAILABLE or not self.collection:
@@ -179,8 +262,10 @@ class RAGEngine:
         return results[:n_results]
 
     def get_stats(self) -> Dict[str, Any]:
-        self._ensure_initialized()
-        stats = {"chromadb": CHROMADB_AVAILABLE, "indexed": self.indexed}
+        if not self._warming_up():
+            self._ensure_initialized()
+        stats = {"chromadb": CHROMADB_AVAILABLE, "indexed": self.indexed,
+                 "warmup": self.get_warmup_status()}
         if self.collection:
             stats["docs"] = self.collection.count()
         return stats
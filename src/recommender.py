@@ -0,0 +1,285 @@
+"""
+Method Recommender
+문제 텍스트와 방법론 설명의 임베딩 유사도로 방법론 추천 (선택 기능)
+
+- 방법론마다 name, best_for, 질문들을 한 번만 임베딩해 행렬로 저장
+  (<vectors_dir>/methods.<embedder>.npy, float16) 하고 메모리 매핑으로 로드
+- 추천은 행렬 × 질의 벡터 곱 한 번 + argpartition top-k
+- 기본 임베더(hashing)는 한글 음절 1-2gram, 영문 단어/문자 3-gram을 고정 차원에
+  해싱한 TF-IDF 벡터 - 모델 파일이나 네트워크 없이 동작
+- sentence-transformers 임베더는 로컬 캐시에 있는 모델만 사용 (다운로드하지 않음)
+- 카탈로그 내용이 바뀌면(해시 불일치) 처음 사용할 때 다시 만들어 저장
+
+환경변수:
+    INNOVATION_SOCRATIC_RECOMMENDER: keyword, embedding (기본 keyword = 키워드 규칙만 사용)
+    INNOVATION_SOCRATIC_RECOMMENDER_EMBEDDER: hashing, sentence-transformers (기본 hashing)
+    INNOVATION_SOCRATIC_METHOD_VECTORS: 벡터 디렉토리 (기본 <프로젝트>/data/method_vectors)
+
+미리 만들기:
+    python scripts/build_method_vectors.py
+"""
+
+import hashlib
+import importlib.util
+import json
+import os
+import re
+import sys
+import threading
+import time
+import zlib
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
+SENTENCE_TRANSFORMERS_AVAILABLE = importlib.util.find_spec("sentence_transformers") is not None
+
+SENTENCE_MODEL = "paraphrase-multilingual-MiniLM-L12-v2"  # RAG와 같은 모델
+
+_TOKEN = re.compile(r"[0-9a-z]+|[가-힣]+")
+
+
+class HashingEmbedder:
+    """
+    특징 해싱 임베더 (학습 없음, 결정적)
+
+    - 영문/숫자 토큰: 단어 + 경계 표시한 문자 3-gram ("<users>" → "<us", "use", ...)
+      → 복수형/활용형도 가깝게
+    - 한글 토큰: 음절 1-gram, 2-gram → 조사가 붙은 형태("팀이", "팀은")도 가깝게
+    - 특징은 crc32로 dim개 구간에 해싱 (프로세스와 무관하게 같은 값)
+    """
+
+    uses_idf = True
+
+    def __init__(self, dim: int = 4096):
+        if dim & (dim - 1):
+            raise ValueError("dim must be a power of two")
+        self.dim = dim
+        self.name = f"hashing{dim}"
+
+    @staticmethod
+    def features(text: str) -> List[str]:
+        features = []
+        for token in _TOKEN.findall(text.lower()):
+            if token[0] <= "z":
+                features.append(f"w:{token}")
+                padded = f"<{token}>"
+                features.extend(f"c:{padded[i:i + 3]}" for i in range(len(padded) - 2))
+            else:
+                features.extend(f"h:{syllable}" for syllable in token)
+                features.extend(f"h:{token[i:i + 2]}" for i in range(len(token) - 1))
+        return features
+
+    def embed(self, texts: Sequence[str]) -> Any:
+        """텍스트별 로그 TF 벡터 (n × dim, 정규화 전)"""
+        import numpy as np
+
+        mask = self.dim - 1
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            counts = Counter(zlib.crc32(f.encode("utf-8")) & mask for f in self.features(text))
+            if counts:
+                weights = np.fromiter(counts.values(), dtype=np.float32)
+                vectors[row, list(counts)] = 1.0 + np.log(weights)
+        return vectors
+
+
+class SentenceTransformerEmbedder:
+    """로컬 캐시의 sentence-transformers 모델 (네트워크 사용 안 함)"""
+
+    uses_idf = False
+
+    def __init__(self, model_name: str = SENTENCE_MODEL):
+        from sentence_transformers import SentenceTransformer
+
+        self.model = SentenceTransformer(model_name, local_files_only=True)
+        self.dim = self.model.get_sentence_embedding_dimension()
+        self.name = "st-" + re.sub(r"[^0-9A-Za-z]+", "-", model_name).strip("-").lower()
+
+    def embed(self, texts: Sequence[str]) -> Any:
+        return self.model.encode(list(texts), convert_to_numpy=True).astype("float32")
+
+
+def method_text(method: Dict[str, Any]) -> str:
+    """방법론 임베딩에 쓰는 텍스트 (이름, 용도, 질문)"""
+    return "\n".join([
+        method["name"],
+        method["best_for"].replace("_", " "),
+        *method.get("questions", []),
+    ])
+
+
+class MethodRecommender:
+    """방법론 벡터 행렬 기반 추천기 (처음 사용할 때 로드, 이후 읽기 전용)"""
+
+    def __init__(self, vectors_dir: Optional[str] = None, embedder: Optional[Any] = None):
+        self.vectors_dir = Path(vectors_dir or os.environ.get(
+            "INNOVATION_SOCRATIC_METHOD_VECTORS",
+            str(Path(__file__).parent.parent / "data" / "method_vectors")
+        ))
+        self.embedder = embedder
+        self.method_ids: Tuple[str, ...] = ()
+        self.matrix = None  # (방법론 수 × dim) float16, 메모리 매핑
+        self.idf = None
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._built = False
+        self._load_seconds = 0.0
+
+    def _paths(self) -> Tuple[Path, Path, Path]:
+        stem = f"methods.{self.embedder.name}"
+        return (
+            self.vectors_dir / f"{stem}.npy",
+            self.vectors_dir / f"{stem}.idf.npy",
+            self.vectors_dir / f"{stem}.json",
+        )
+
+    def _catalog(self) -> Tuple[Tuple[str, ...], List[str], str]:
+        from .methods.templates import ALL_METHODS
+
+        method_ids = tuple(ALL_METHODS)
+        texts = [method_text(ALL_METHODS[m]) for m in method_ids]
+        digest = hashlib.sha256(
+            json.dumps([self.embedder.name, method_ids, texts], ensure_ascii=False).encode("utf-8")
+        ).hexdigest()[:16]
+        return method_ids, texts, digest
+
+    def load(self):
+        """저장된 벡터 로드 (없거나 카탈로그가 바뀌었으면 만들어 저장)"""
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            import numpy as np
+
+            start = time.perf_counter()
+            if self.embedder is None:
+                self.embedder = create_embedder()
+            method_ids, texts, digest = self._catalog()
+            matrix_file, idf_file, meta_file = self._paths()
+
+            meta = None
+            if meta_file.exists():
+                with open(meta_file, 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+            if meta is None or meta.get("digest") != digest or not matrix_file.exists():
+                self.build(method_ids, texts, digest)
+                self._built = True
+
+            self.method_ids = method_ids
+            self.matrix = np.load(matrix_file, mmap_mode="r")
+            self.idf = np.load(idf_file) if self.embedder.uses_idf else None
+            self._load_seconds = time.perf_counter() - start
+            self._loaded = True
+
+    def build(self, method_ids: Sequence[str], texts: Sequence[str], digest: str):
+        """방법론 벡터 행렬 생성 후 저장 (임시 파일에 쓴 뒤 교체)"""
+        import numpy as np
+
+        vectors = self.embedder.embed(texts)
+        if self.embedder.uses_idf:
+            document_frequency = (vectors > 0).sum(axis=0)
+            idf = (np.log((1 + len(texts)) / (1 + document_frequency)) + 1).astype(np.float32)
+            vectors = vectors * idf
+        else:
+            idf = np.ones(vectors.shape[1], dtype=np.float32)
+        vectors = _normalize(vectors).astype(np.float16)
+
+        self.vectors_dir.mkdir(parents=True, exist_ok=True)
+        matrix_file, idf_file, meta_file = self._paths()
+        for path, array in ((matrix_file, vectors), (idf_file, idf)):
+            tmp_file = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            with open(tmp_file, 'wb') as f:
+                np.save(f, array)
+            os.replace(tmp_file, path)
+        tmp_file = meta_file.with_name(f"{meta_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                "embedder": self.embedder.name,
+                "digest": digest,
+                "methods": list(method_ids),
+                "dim": int(vectors.shape[1]),
+                "dtype": "float16",
+            }, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_file, meta_file)
+
+    def recommend(
+        self,
+        problem: str,
+        k: int = 5,
+        exclude: Sequence[str] = ("question_storming",)
+    ) -> List[Tuple[str, float]]:
+        """
+        문제와 가장 가까운 방법론 k개
+
+        Returns:
+            (method_id, 코사인 유사도) 목록 (유사도 내림차순)
+        """
+        import numpy as np
+
+        self.load()
+        query = self.embedder.embed([problem])[0]
+        if self.idf is not None:
+            query = query * self.idf
+        norm = float(np.linalg.norm(query))
+        if norm == 0.0:
+            return []
+
+        scores = self.matrix @ (query / norm)
+        for method_id in exclude:
+            if method_id in self.method_ids:
+                scores[self.method_ids.index(method_id)] = -np.inf
+        k = min(k, len(scores))
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(self.method_ids[i], float(scores[i])) for i in top if np.isfinite(scores[i])]
+
+    def recommend_ids(self, problem: str, k: int = 5) -> List[str]:
+        return [method_id for method_id, _ in self.recommend(problem, k)]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """통계"""
+        return {
+            "embedder": getattr(self.embedder, "name", None),
+            "loaded": self._loaded,
+            "built": self._built,
+            "methods": len(self.method_ids),
+            "load_seconds": round(self._load_seconds, 3),
+        }
+
+
+def _normalize(vectors: Any) -> Any:
+    import numpy as np
+
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms == 0, 1.0, norms)
+
+
+def create_embedder() -> Any:
+    """환경변수 설정에 따라 임베더 생성 (sentence-transformers를 쓸 수 없으면 hashing)"""
+    name = os.environ.get("INNOVATION_SOCRATIC_RECOMMENDER_EMBEDDER", "hashing")
+    if name == "sentence-transformers":
+        if SENTENCE_TRANSFORMERS_AVAILABLE:
+            try:
+                return SentenceTransformerEmbedder()
+            except Exception as e:
+                print(f"sentence-transformers 모델 로드 실패 (hashing 사용): {e}", file=sys.stderr)
+        else:
+            print("sentence-transformers가 설치되지 않음 (hashing 사용)", file=sys.stderr)
+    elif name != "hashing":
+        print(f"알 수 없는 임베더 '{name}', hashing 사용", file=sys.stderr)
+    return HashingEmbedder()
+
+
+def create_recommender() -> Optional[MethodRecommender]:
+    """INNOVATION_SOCRATIC_RECOMMENDER=embedding일 때만 추천기 생성"""
+    if os.environ.get("INNOVATION_SOCRATIC_RECOMMENDER", "keyword") != "embedding":
+        return None
+    if not NUMPY_AVAILABLE:
+        print("임베딩 추천에는 numpy가 필요합니다 (키워드 추천 사용)", file=sys.stderr)
+        return None
+    return MethodRecommender()
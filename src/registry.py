@@ -0,0 +1,157 @@
+"""
+Client Session Registry
+클라이언트별 세션 상태 관리 (락 스트라이핑)
+
+하나의 서버 프로세스가 여러 MCP 클라이언트를 동시에 처리할 수 있도록
+클라이언트 ID별로 트리거 상태와 진행 중인 세션을 분리하여 보관합니다.
+"""
+
+import asyncio
+import threading
+import time
+import uuid
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from .session import SessionState
+from .trigger import TriggerDetector
+
+# user_id 없이 호출한 클라이언트의 세션 소유자 (연결이 바뀌어도 같은 값)
+DEFAULT_USER_ID = "default"
+
+
+@dataclass
+class ClientState:
+    """클라이언트 한 명의 상태"""
+    client_id: str
+    user_id: str
+    detector: TriggerDetector = field(default_factory=TriggerDetector)
+    session: Optional[SessionState] = None
+    last_seen: float = field(default_factory=time.monotonic)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    def touch(self):
+        """마지막 사용 시각 갱신"""
+        self.last_seen = time.monotonic()
+
+    def reset(self):
+        """세션 종료 후 잠수함 모드로 복귀"""
+        self.detector.deactivate()
+        self.session = None
+
+
+class SessionRegistry:
+    """
+    클라이언트 ID → ClientState 레지스트리
+
+    스트라이프 락은 딕셔너리 조회/삽입에만 잠깐 사용하고,
+    도구 호출 전체는 ClientState.lock으로 클라이언트 단위로 직렬화합니다.
+    따라서 서로 다른 클라이언트는 서로를 기다리지 않습니다.
+    """
+
+    SWEEP_EVERY = 1024  # 생성 N회마다 유휴 클라이언트 정리
+
+    def __init__(self, stripes: int = 64, idle_ttl: float = 6 * 3600):
+        self._stripes: List[Tuple[threading.Lock, Dict[str, ClientState]]] = [
+            (threading.Lock(), {}) for _ in range(stripes)
+        ]
+        self.idle_ttl = idle_ttl
+        self._connection_ids: "weakref.WeakKeyDictionary[Any, str]" = weakref.WeakKeyDictionary()
+        self._connection_lock = threading.Lock()
+        self._created = 0
+
+    def _stripe(self, client_id: str) -> Tuple[threading.Lock, Dict[str, ClientState]]:
+        return self._stripes[hash(client_id) % len(self._stripes)]
+
+    def client_id_for(self, connection: Any) -> str:
+        """전송 계층 연결 객체에 안정적인 클라이언트 ID 부여"""
+        with self._connection_lock:
+            client_id = self._connection_ids.get(connection)
+            if client_id is None:
+                client_id = uuid.uuid4().hex[:16]
+                self._connection_ids[connection] = client_id
+            return client_id
+
+    def get_or_create(self, client_id: str, user_id: Optional[str] = None) -> ClientState:
+        """
+        클라이언트 상태 조회 (없으면 생성)
+
+        user_id가 없으면 "default" - 연결 ID는 재연결마다 바뀌므로
+        저장된 세션 조회/재개에 쓸 수 없음
+        """
+        lock, clients = self._stripe(client_id)
+        with lock:
+            client = clients.get(client_id)
+            if client is None:
+                client = ClientState(client_id=client_id, user_id=user_id or DEFAULT_USER_ID)
+                clients[client_id] = client
+                created = True
+            else:
+                created = False
+                if user_id:
+                    client.user_id = user_id
+            client.touch()
+
+        if created:
+            self._created += 1
+            if self._created % self.SWEEP_EVERY == 0:
+                self.evict_idle()
+
+        return client
+
+    def get(self, client_id: str) -> Optional[ClientState]:
+        """클라이언트 상태 조회"""
+        lock, clients = self._stripe(client_id)
+        with lock:
+            return clients.get(client_id)
+
+    def discard(self, client_id: str) -> Optional[ClientState]:
+        """클라이언트 상태 제거"""
+        lock, clients = self._stripe(client_id)
+        with lock:
+            return clients.pop(client_id, None)
+
+    def evict_idle(self, idle_ttl: Optional[float] = None) -> int:
+        """유휴 시간이 지난 클라이언트 정리 (진행 중인 호출이 있으면 유지)"""
+        ttl = self.idle_ttl if idle_ttl is None else idle_ttl
+        deadline = time.monotonic() - ttl
+        evicted = 0
+        for lock, clients in self._stripes:
+            with lock:
+                stale = [
+                    cid for cid, client in clients.items()
+                    if client.last_seen < deadline and not client.lock.locked()
+                ]
+                for cid in stale:
+                    del clients[cid]
+                evicted += len(stale)
+        return evicted
+
+    def clients(self) -> List[ClientState]:
+        """모든 클라이언트 상태 스냅샷"""
+        snapshot: List[ClientState] = []
+        for lock, clients in self._stripes:
+            with lock:
+                snapshot.extend(clients.values())
+        return snapshot
+
+    def __len__(self) -> int:
+        total = 0
+        for lock, clients in self._stripes:
+            with lock:
+                total += len(clients)
+        return total
+
+    def get_stats(self) -> Dict[str, Any]:
+        """통계"""
+        clients = self.clients()
+        return {
+            "clients": len(clients),
+            "active_sessions": sum(1 for c in clients if c.session is not None),
+            "stripes": len(self._stripes),
+        }
+
+
+# 싱글톤 인스턴스
+registry = SessionRegistry()
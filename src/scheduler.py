@@ -0,0 +1,241 @@
+"""
+Admission Control
+도구 호출 동시 실행 제한 및 우선순위 대기열
+
+- 도구별/클라이언트별/전체 동시 실행 상한
+- 상한 초과 시 제한된 길이의 대기열에서 마감 시간까지 대기
+- 가벼운 호출(답변 제출)이 무거운 호출(분류, 검색)보다 먼저 실행
+- 대기열이 가득 차거나 마감 시간이 지나면 즉시 Overloaded 오류
+
+환경변수:
+    INNOVATION_SOCRATIC_MAX_CONCURRENT: 전체 동시 실행 상한 (기본 64)
+    INNOVATION_SOCRATIC_MAX_PER_CLIENT: 클라이언트당 동시 실행 상한 (기본 2)
+    INNOVATION_SOCRATIC_MAX_WAITING: 대기열 길이 (기본 128)
+    INNOVATION_SOCRATIC_ADMISSION_DEADLINE: 대기 마감 시간 초 (기본 5)
+    INNOVATION_SOCRATIC_TOOL_LIMITS: 도구별 상한 (예: "innovation_socratic=8")
+"""
+
+import asyncio
+import itertools
+import os
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+
+class Overloaded(RuntimeError):
+    """서버 과부하로 요청 거절"""
+
+
+# 우선순위 (작을수록 먼저 실행)
+PRIORITY_CHEAP = 0
+PRIORITY_EXPENSIVE = 1
+
+TOOL_PRIORITIES = {
+    "continue_thinking_session": PRIORITY_CHEAP,
+    "submit_thinking_answers": PRIORITY_CHEAP,
+    "end_thinking_session": PRIORITY_CHEAP,
+    "select_thinking_method": PRIORITY_CHEAP,
+    "innovation_socratic": PRIORITY_EXPENSIVE,
+    "resume_thinking_session": PRIORITY_EXPENSIVE,
+}
+
+DEFAULT_TOOL_LIMITS = {
+    "innovation_socratic": 8,
+}
+
+
+def _parse_tool_limits(spec: str) -> Dict[str, int]:
+    """"tool=N,tool2=M" 형식 파싱"""
+    limits: Dict[str, int] = {}
+    for item in spec.split(","):
+        if "=" not in item:
+            continue
+        name, _, value = item.partition("=")
+        try:
+            limits[name.strip()] = int(value)
+        except ValueError:
+            continue
+    return limits
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    seq: int
+    tool: str = field(compare=False)
+    client_id: str = field(compare=False)
+    future: "asyncio.Future[None]" = field(compare=False)
+
+
+class AdmissionController:
+    """도구 호출 입장 제어"""
+
+    def __init__(
+        self,
+        max_concurrent: Optional[int] = None,
+        max_per_client: Optional[int] = None,
+        max_waiting: Optional[int] = None,
+        deadline: Optional[float] = None,
+        tool_limits: Optional[Dict[str, int]] = None
+    ):
+        self.max_concurrent = max_concurrent or int(
+            os.environ.get("INNOVATION_SOCRATIC_MAX_CONCURRENT", "64")
+        )
+        self.max_per_client = max_per_client or int(
+            os.environ.get("INNOVATION_SOCRATIC_MAX_PER_CLIENT", "2")
+        )
+        self.max_waiting = max_waiting if max_waiting is not None else int(
+            os.environ.get("INNOVATION_SOCRATIC_MAX_WAITING", "128")
+        )
+        self.deadline = deadline or float(
+            os.environ.get("INNOVATION_SOCRATIC_ADMISSION_DEADLINE", "5")
+        )
+        self.tool_limits = dict(DEFAULT_TOOL_LIMITS)
+        self.tool_limits.update(
+            _parse_tool_limits(os.environ.get("INNOVATION_SOCRATIC_TOOL_LIMITS", ""))
+        )
+        if tool_limits:
+            self.tool_limits.update(tool_limits)
+
+        self._running = 0
+        self._running_by_tool: Dict[str, int] = {}
+        self._running_by_client: Dict[str, int] = {}
+        self._waiters: List[_Waiter] = []
+        self._seq = itertools.count()
+        self._closed = False
+
+        self._admitted = 0
+        self._rejected_full = 0
+        self._rejected_deadline = 0
+        self._rejected_closed = 0
+
+    def _fits(self, tool: str, client_id: str) -> bool:
+        if self._running >= self.max_concurrent:
+            return False
+        if self._running_by_client.get(client_id, 0) >= self.max_per_client:
+            return False
+        limit = self.tool_limits.get(tool)
+        if limit is not None and self._running_by_tool.get(tool, 0) >= limit:
+            return False
+        return True
+
+    def _acquire(self, tool: str, client_id: str):
+        self._running += 1
+        self._running_by_tool[tool] = self._running_by_tool.get(tool, 0) + 1
+        self._running_by_client[client_id] = self._running_by_client.get(client_id, 0) + 1
+        self._admitted += 1
+
+    def _release(self, tool: str, client_id: str):
+        self._running -= 1
+        self._running_by_tool[tool] -= 1
+        remaining = self._running_by_client[client_id] - 1
+        if remaining:
+            self._running_by_client[client_id] = remaining
+        else:
+            del self._running_by_client[client_id]
+        self._wake()
+
+    def _wake(self):
+        """우선순위 순으로 실행 가능한 대기자에게 슬롯 할당"""
+        for waiter in list(self._waiters):
+            if self._fits(waiter.tool, waiter.client_id):
+                self._waiters.remove(waiter)
+                self._acquire(waiter.tool, waiter.client_id)
+                waiter.future.set_result(None)
+
+    @asynccontextmanager
+    async def admit(
+        self,
+        tool: str,
+        client_id: str,
+        deadline: Optional[float] = None
+    ) -> AsyncIterator[None]:
+        """슬롯을 얻을 때까지 대기 (실패 시 Overloaded)"""
+        if self._closed:
+            self._rejected_closed += 1
+            raise Overloaded("서버가 종료 중입니다. 잠시 후 다시 시도하세요.")
+
+        priority = TOOL_PRIORITIES.get(tool, PRIORITY_EXPENSIVE)
+        ahead = any(w.priority <= priority for w in self._waiters)
+
+        if not ahead and self._fits(tool, client_id):
+            self._acquire(tool, client_id)
+        else:
+            await self._wait(tool, client_id, priority, deadline or self.deadline)
+
+        try:
+            yield
+        finally:
+            self._release(tool, client_id)
+
+    async def _wait(self, tool: str, client_id: str, priority: int, deadline: float):
+        if len(self._waiters) >= self.max_waiting:
+            self._rejected_full += 1
+            raise Overloaded(
+                f"서버가 혼잡합니다 (대기 {len(self._waiters)}건). 잠시 후 다시 시도하세요."
+            )
+
+        waiter = _Waiter(
+            priority=priority,
+            seq=next(self._seq),
+            tool=tool,
+            client_id=client_id,
+            future=asyncio.get_running_loop().create_future()
+        )
+        self._waiters.append(waiter)
+        self._waiters.sort()
+        self._wake()
+
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), deadline)
+        except asyncio.TimeoutError:
+            if self._abandon(waiter):
+                self._rejected_deadline += 1
+                raise Overloaded(
+                    f"서버가 혼잡하여 {deadline:g}초 안에 '{tool}'을 시작하지 못했습니다. "
+                    "잠시 후 다시 시도하세요."
+                ) from None
+            # 마감 직전에 슬롯을 받은 경우 그대로 실행
+        except asyncio.CancelledError:
+            if not self._abandon(waiter):
+                self._release(tool, client_id)
+            raise
+
+    def _abandon(self, waiter: _Waiter) -> bool:
+        """대기 포기 (이미 슬롯을 받았으면 False)"""
+        if waiter.future.done():
+            return False
+        waiter.future.cancel()
+        self._waiters.remove(waiter)
+        return True
+
+    def close(self):
+        """새 요청 거절 (종료 준비)"""
+        self._closed = True
+
+    @property
+    def running(self) -> int:
+        """실행 중인 호출 수"""
+        return self._running
+
+    def get_stats(self) -> Dict[str, Any]:
+        """통계"""
+        stats: Dict[str, Any] = {
+            "running": self._running,
+            "waiting": len(self._waiters),
+            "max_concurrent": self.max_concurrent,
+            "max_per_client": self.max_per_client,
+            "max_waiting": self.max_waiting,
+            "admitted": self._admitted,
+            "rejected_queue_full": self._rejected_full,
+            "rejected_deadline": self._rejected_deadline,
+            "rejected_closed": self._rejected_closed,
+        }
+        for tool, count in self._running_by_tool.items():
+            stats[f"running_{tool}"] = count
+        return stats
+
+
+# 싱글톤 인스턴스
+scheduler = AdmissionController()
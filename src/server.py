@@ -3,7 +3,13 @@ Innovation Socratic MCP Server
 AI that asks, not answers - Socratic questioning with 58 methodologies
 """
 
+import argparse
 import asyncio
+import json
+import os
+import signal
+import sys
+import time
 from typing import Any, Dict, Optional
 from mcp.server.models import InitializationOptions
 from mcp.server import NotificationOptions, Server
@@ -11,80 +17,215 @@ from mcp.server.stdio import stdio_server
 from pydantic import AnyUrl
 import mcp.types as types
 
-from .trigger import detector
-from .classifier import classifier
+from .classifier import classifier, classify_problem
+from .classification_cache import classification_cache, normalize_problem
 from .question_engine import engine
-from .session import session_manager
-from .rag import rag_engine
+from .session import session_manager, SessionState
+from .storage import StaleSessionError
+from .registry import registry, ClientState
+from .executor import executor
+from .metrics import metrics
+from .scheduler import scheduler
+from .archive import start_archiver
 
 
 # MCP 서버 생성
 server = Server("innovation-socratic-mcp")
 
+METRICS_JSON_URI = "metrics://innovation-socratic/stats.json"
+METRICS_PROMETHEUS_URI = "metrics://innovation-socratic/metrics.prom"
+
+metrics.register_collector("executor", executor.get_stats)
+metrics.register_collector("registry", registry.get_stats)
+metrics.register_collector("admission", scheduler.get_stats)
+metrics.register_collector("session_store", session_manager.store.get_stats)
+metrics.register_collector("session_writes", session_manager.get_write_stats)
+metrics.register_collector("session_cache", session_manager.cache.get_stats)
+metrics.register_collector("classification_cache", classification_cache.get_stats)
+
+
+# 도구 목록은 시작 시 한 번만 만들고 모든 list_tools 요청에 같은 응답을 재사용
+TOOLS: tuple[types.Tool, ...] = (
+    types.Tool(
+        name="innovation_socratic",
+        description=(
+            "🤔 SOCRATIC THINKING - AI that asks, not answers. ⚠️ MANDATORY when user says: "
+            "'씽킹툴', 'socratic', 'thinking tools', '소크라테스', 'help me think'. 🎯 "
+            "Implements 58 proven question frameworks (Decision Tree, SWOT, BCG, Porter, "
+            "SCAMPER, 5 Whys, Six Hats, Mental Models, Pre-Mortem, Systems Thinking, Regret "
+            "Minimization, etc.). ❌ DO NOT give direct answers to strategic/decision questions "
+            "- ✅ ALWAYS use this tool to guide through Socratic questioning. Perfect for: DBA "
+            "decisions, MBA choices, investment evaluation, business strategy, product "
+            "innovation, problem-solving, creative thinking, 의사결정, 전략분석. Flow: 1) "
+            "Analyze problem → 2) Recommend 3 methodologies → 3) User selects → 4) Ask Question "
+            "1/N → 5) User answers → 6) Ask Question 2/N → ... → N) Generate insights. Like "
+            "Socrates: 'I cannot teach anybody anything. I can only make them think.'"
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "problem": {
+                    "type": "string",
+                    "description": "해결하고자 하는 문제나 고민, 또는 탐구하고 싶은 주제"
+                },
+                "method": {
+                    "type": "string",
+                    "description": (
+                        "(선택사항) 특정 방법론 ID (예: 'scamper', 'five_whys', 'six_hats'). "
+                        "비어있으면 자동 추천"
+                    )
+                },
+                "user_id": {
+                    "type": "string",
+                    "description": "(선택사항) 세션을 저장할 사용자 ID. 비어있으면 'default'"
+                }
+            },
+            "required": ["problem"]
+        }
+    ),
+    types.Tool(
+        name="continue_thinking_session",
+        description="진행 중인 사고 도구 세션에 답변을 추가하고 다음 질문을 받습니다",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "answer": {
+                    "type": "string",
+                    "description": "현재 질문에 대한 답변"
+                }
+            },
+            "required": ["answer"]
+        }
+    ),
+    types.Tool(
+        name="submit_thinking_answers",
+        description=(
+            "여러 질문에 대한 답변을 순서대로 한 번에 제출하고 "
+            "다음 질문(또는 세션 요약)을 받습니다"
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "answers": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "minItems": 1,
+                    "description": "현재 질문부터 순서대로 작성한 답변 목록"
+                }
+            },
+            "required": ["answers"]
+        }
+    ),
+    types.Tool(
+        name="select_thinking_method",
+        description="추천된 방법론 중 하나를 선택하여 세션 시작",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "method_number": {
+                    "type": "integer",
+                    "description": "선택할 방법론 번호 (1, 2, 3 중 하나)"
+                }
+            },
+            "required": ["method_number"]
+        }
+    ),
+    types.Tool(
+        name="resume_thinking_session",
+        description=(
+            "이전에 진행하던 사고 도구 세션을 이어서 진행합니다. "
+            "session_id 없이 호출하면 최근 세션 목록을 보여줍니다"
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "session_id": {
+                    "type": "string",
+                    "description": "(선택사항) 이어서 진행할 세션 ID. 비어있으면 최근 세션 목록"
+                },
+                "user_id": {
+                    "type": "string",
+                    "description": "(선택사항) 세션을 시작할 때 사용한 사용자 ID"
+                }
+            }
+        }
+    ),
+    types.Tool(
+        name="end_thinking_session",
+        description="현재 사고 도구 세션을 종료하고 요약 받기",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    )
+)
+
+TOOL_NAMES = frozenset(tool.name for tool in TOOLS)
+
 
 @server.list_tools()
 async def handle_list_tools() -> list[types.Tool]:
     """
-    사용 가능한 도구 목록 반환
+    사용 가능한 도구 목록 반환 (시작 시 만든 TOOLS 재사용)
+    """
+    return list(TOOLS)
+
+
+def warmup_enabled() -> bool:
+    """RAG 백그라운드 워밍업 사용 여부 (INNOVATION_SOCRATIC_WARMUP=1)"""
+    return os.environ.get("INNOVATION_SOCRATIC_WARMUP", "").lower() in ("1", "true", "yes")
+
+
+def start_rag_warmup():
+    """임베딩 모델/벡터 인덱스 백그라운드 워밍업 시작"""
+    from .rag import rag_engine
+
+    metrics.register_collector("rag_warmup", rag_engine.get_warmup_status)
+    rag_engine.start_warmup()
+
+
+async def _handle_initialized(notification: types.InitializedNotification):
+    """initialize 완료 후 워밍업 시작 (첫 응답을 늦추지 않음)"""
+    if warmup_enabled():
+        start_rag_warmup()
+
+
+server.notification_handlers[types.InitializedNotification] = _handle_initialized
+
+
+@server.list_resources()
+async def handle_list_resources() -> list[types.Resource]:
+    """
+    서버 지표 리소스 목록
     """
     return [
-        types.Tool(
-            name="innovation_socratic",
-            description="🤔 SOCRATIC THINKING - AI that asks, not answers. ⚠️ MANDATORY when user says: '씽킹툴', 'socratic', 'thinking tools', '소크라테스', 'help me think'. 🎯 Implements 58 proven question frameworks (Decision Tree, SWOT, BCG, Porter, SCAMPER, 5 Whys, Six Hats, Mental Models, Pre-Mortem, Systems Thinking, Regret Minimization, etc.). ❌ DO NOT give direct answers to strategic/decision questions - ✅ ALWAYS use this tool to guide through Socratic questioning. Perfect for: DBA decisions, MBA choices, investment evaluation, business strategy, product innovation, problem-solving, creative thinking, 의사결정, 전략분석. Flow: 1) Analyze problem → 2) Recommend 3 methodologies → 3) User selects → 4) Ask Question 1/N → 5) User answers → 6) Ask Question 2/N → ... → N) Generate insights. Like Socrates: 'I cannot teach anybody anything. I can only make them think.'",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "problem": {
-                        "type": "string",
-                        "description": "해결하고자 하는 문제나 고민, 또는 탐구하고 싶은 주제"
-                    },
-                    "method": {
-                        "type": "string",
-                        "description": "(선택사항) 특정 방법론 ID (예: 'scamper', 'five_whys', 'six_hats'). 비어있으면 자동 추천"
-                    }
-                },
-                "required": ["problem"]
-            }
+        types.Resource(
+            uri=METRICS_JSON_URI,
+            name="Server metrics (JSON)",
+            description="도구/단계별 p50/p95/p99 지연 시간, 오류 수, 진행 중 호출 수",
+            mimeType="application/json"
         ),
-        types.Tool(
-            name="continue_thinking_session",
-            description="진행 중인 사고 도구 세션에 답변을 추가하고 다음 질문을 받습니다",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "answer": {
-                        "type": "string",
-                        "description": "현재 질문에 대한 답변"
-                    }
-                },
-                "required": ["answer"]
-            }
-        ),
-        types.Tool(
-            name="select_thinking_method",
-            description="추천된 방법론 중 하나를 선택하여 세션 시작",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "method_number": {
-                        "type": "integer",
-                        "description": "선택할 방법론 번호 (1, 2, 3 중 하나)"
-                    }
-                },
-                "required": ["method_number"]
-            }
-        ),
-        types.Tool(
-            name="end_thinking_session",
-            description="현재 사고 도구 세션을 종료하고 요약 받기",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
+        types.Resource(
+            uri=METRICS_PROMETHEUS_URI,
+            name="Server metrics (Prometheus)",
+            description="Prometheus 텍스트 형식 지표",
+            mimeType="text/plain"
         )
     ]
 
 
+@server.read_resource()
+async def handle_read_resource(uri: AnyUrl) -> str:
+    """
+    서버 지표 리소스 읽기
+    """
+    if str(uri) == METRICS_JSON_URI:
+        return json.dumps(metrics.get_stats(), ensure_ascii=False, indent=2)
+    if str(uri) == METRICS_PROMETHEUS_URI:
+        return metrics.render_prometheus()
+    raise ValueError(f"Unknown resource: {uri}")
+
+
 @server.call_tool()
 async def handle_call_tool(
     name: str,
@@ -93,34 +234,88 @@ async def handle_call_tool(
     """
     도구 실행 핸들러
     """
+    if name not in TOOL_NAMES:
+        raise ValueError(f"Unknown tool: {name}")
+
+    # 알 수 없는 도구 호출은 클라이언트 상태를 만들지 않음 (축출 대상 수에 안 들어감)
+    arguments = arguments or {}
+    client = registry.get_or_create(_current_client_id(), arguments.get("user_id"))
+
+    # 입장 제어 (과부하 시 Overloaded) 후 같은 클라이언트의 호출만 직렬화
+    with metrics.track(f"tool.{name}"):
+        async with scheduler.admit(name, client.client_id):
+            async with client.lock:
+                client.touch()
+                return await _dispatch_tool(client, name, arguments)
+
+
+async def _dispatch_tool(
+    client: ClientState,
+    name: str,
+    arguments: Dict[str, Any]
+) -> list[types.TextContent]:
+    """도구 이름별 분기"""
     if name == "innovation_socratic":
         problem = arguments.get("problem", "")
         method = arguments.get("method", "")
-        return await start_thinking_session(problem, method)
+        return await start_thinking_session(client, problem, method)
 
     elif name == "continue_thinking_session":
         answer = arguments.get("answer", "")
-        return await continue_session(answer)
+        return await continue_session(client, answer)
+
+    elif name == "submit_thinking_answers":
+        answers = [str(answer) for answer in arguments.get("answers", [])]
+        return await submit_answers(client, answers)
 
     elif name == "select_thinking_method":
         method_number = arguments.get("method_number", 1)
-        return await select_method(method_number)
+        return await select_method(client, method_number)
+
+    elif name == "resume_thinking_session":
+        session_id = arguments.get("session_id", "")
+        return await resume_session(client, session_id)
 
     elif name == "end_thinking_session":
-        return await end_session()
+        return await end_session(client)
 
     else:
         raise ValueError(f"Unknown tool: {name}")
 
 
-async def start_thinking_session(problem: str, method: str = "") -> list[types.TextContent]:
+def _current_client_id() -> str:
+    """현재 요청을 보낸 클라이언트(연결)의 ID"""
+    try:
+        ctx = server.request_context
+    except LookupError:
+        return "default"
+    return registry.client_id_for(ctx.session)
+
+
+async def _classify(problem: str):
+    """문제 분류 (정규화한 텍스트 기준 캐시, 없으면 같은 텍스트를 프로세스 풀에서 분류)"""
+    text = normalize_problem(problem)
+    key = classification_cache.key(text)
+    classification = classification_cache.get(key)
+    if classification is None:
+        with metrics.track("classifier.classify"):
+            result = await executor.run(classify_problem, text, pool="process")
+        classification = classification_cache.put(key, result)
+    return classification
+
+
+async def start_thinking_session(
+    client: ClientState,
+    problem: str,
+    method: str = ""
+) -> list[types.TextContent]:
     """
     새로운 사고 도구 세션 시작
     """
-    detector.activate()
+    client.detector.activate()
 
     # 문제 분류
-    classification = classifier.classify(problem)
+    classification = await _classify(problem)
 
     # 특정 방법론 지정된 경우
     if method:
@@ -128,21 +323,25 @@ async def start_thinking_session(problem: str, method: str = "") -> list[types.T
         from .methods.templates import ALL_METHODS
         if method in ALL_METHODS:
             method_data = ALL_METHODS[method]
-            session = session_manager.create_session(
-                user_id="default",
+            session = await executor.run_mutation(
+                session_manager.create_session,
+                user_id=client.user_id,
                 problem=problem,
                 category=classification["category"],
                 method_id=method,
                 method_name=method_data["name"],
                 total_steps=method_data["steps"]
             )
+            client.session = session
 
             # 첫 번째 질문 생성
-            question_data = engine.generate_question(method, 0)
+            with metrics.track("engine.render_question"):
+                question_text = engine.render_question(method, 0)
             response_text = f"🤖 방법론: {method_data['name']}\n\n"
-            response_text += engine.format_question_output(question_data)
+            response_text += question_text
+            response_text += _session_footer(session)
 
-            detector.current_session = {
+            client.detector.current_session = {
                 "problem": problem,
                 "classification": classification,
                 "state": "questioning"
@@ -150,7 +349,7 @@ async def start_thinking_session(problem: str, method: str = "") -> list[types.T
         else:
             response_text = f"❌ 알 수 없는 방법론: {method}\n\n"
             response_text = classifier.format_recommendations(classification)
-            detector.current_session = {
+            client.detector.current_session = {
                 "problem": problem,
                 "classification": classification,
                 "state": "method_selection"
@@ -158,7 +357,7 @@ async def start_thinking_session(problem: str, method: str = "") -> list[types.T
     else:
         # 방법론 추천
         response_text = classifier.format_recommendations(classification)
-        detector.current_session = {
+        client.detector.current_session = {
             "problem": problem,
             "classification": classification,
             "state": "method_selection"
@@ -167,17 +366,22 @@ async def start_thinking_session(problem: str, method: str = "") -> list[types.T
     return [types.TextContent(type="text", text=response_text)]
 
 
-async def select_method(method_number: int) -> list[types.TextContent]:
+def _session_footer(session) -> str:
+    """새 세션 응답 끝에 붙이는 재개 정보 (재연결 후 resume_thinking_session에 사용)"""
+    return f"\n\n🗂️ 세션 ID: {session.session_id} (user_id: {session.user_id})"
+
+
+async def select_method(client: ClientState, method_number: int) -> list[types.TextContent]:
     """
     추천된 방법론 중 하나 선택
     """
-    if not detector.current_session:
+    if not client.detector.current_session:
         return [types.TextContent(
             type="text",
             text="❌ 활성화된 세션이 없습니다. 먼저 innovation_socratic을 사용하세요."
         )]
 
-    classification = detector.current_session["classification"]
+    classification = client.detector.current_session["classification"]
 
     if method_number < 1 or method_number > len(classification["recommended_methods"]):
         return [types.TextContent(
@@ -190,30 +394,33 @@ async def select_method(method_number: int) -> list[types.TextContent]:
     method_id = selected_method["id"]
 
     # 세션 생성
-    session = session_manager.create_session(
-        user_id="default",
-        problem=detector.current_session["problem"],
+    session = await executor.run_mutation(
+        session_manager.create_session,
+        user_id=client.user_id,
+        problem=client.detector.current_session["problem"],
         category=classification["category"],
         method_id=method_id,
         method_name=selected_method["name"],
         total_steps=selected_method["steps"]
     )
+    client.session = session
 
     # 첫 번째 질문 생성
-    question_data = engine.generate_question(method_id, 0)
-    response_text = engine.format_question_output(question_data)
+    with metrics.track("engine.render_question"):
+        response_text = engine.render_question(method_id, 0)
+    response_text += _session_footer(session)
 
     # 상태 업데이트
-    detector.current_session["state"] = "questioning"
+    client.detector.current_session["state"] = "questioning"
 
     return [types.TextContent(type="text", text=response_text)]
 
 
-async def continue_session(answer: str) -> list[types.TextContent]:
+async def continue_session(client: ClientState, answer: str) -> list[types.TextContent]:
     """
     현재 질문에 답변하고 다음 질문 받기
     """
-    session = session_manager.get_current_session()
+    session = client.session
 
     if not session:
         return [types.TextContent(
@@ -222,41 +429,241 @@ async def continue_session(answer: str) -> list[types.TextContent]:
         )]
 
     # 답변 저장 및 다음 단계로
-    session_manager.add_answer(answer)
+    try:
+        await executor.run_mutation(session_manager.add_answer, answer, session)
+        response_text = await _next_step_text(client, session)
+    except StaleSessionError:
+        response_text = await _conflict_text(client, session)
+
+    return [types.TextContent(type="text", text=response_text)]
+
+
+async def submit_answers(client: ClientState, answers: list[str]) -> list[types.TextContent]:
+    """
+    여러 답변을 한 번에 제출하고 다음 질문(또는 요약) 받기
+    """
+    session = client.session
+
+    if not session:
+        return [types.TextContent(
+            type="text",
+            text="❌ 활성화된 세션이 없습니다."
+        )]
+
+    if not answers:
+        return [types.TextContent(
+            type="text",
+            text="❌ 제출할 답변이 없습니다."
+        )]
+
+    # 답변 일괄 저장 (파일 쓰기 1회)
+    try:
+        accepted = await executor.run_mutation(session_manager.add_answers, answers, session)
+    except StaleSessionError:
+        return [types.TextContent(type="text", text=await _conflict_text(client, session))]
 
+    response_text = f"📝 답변 {accepted}개 저장"
+    if accepted < len(answers):
+        response_text += f" (남은 질문보다 많은 {len(answers) - accepted}개는 무시됨)"
+    response_text += "\n\n"
+    response_text += await _next_step_text(client, session)
+
+    return [types.TextContent(type="text", text=response_text)]
+
+
+async def _next_step_text(client: ClientState, session: SessionState) -> str:
+    """답변 저장 후 다음 질문 또는 완료 요약"""
     # 세션 완료 확인
     if session.is_completed:
-        summary = session_manager.end_session()
-        response_text = session_manager.format_session_summary(summary)
-        detector.deactivate()
-    else:
-        # 다음 질문
-        question_data = engine.generate_question(
-            session.method_id,
-            session.current_step
-        )
-        response_text = engine.format_question_output(question_data)
+        summary = await executor.run_mutation(session_manager.end_session, session)
+        client.reset()
+        return session_manager.format_session_summary(summary)
+
+    # 다음 질문
+    with metrics.track("engine.render_question"):
+        return engine.render_question(session.method_id, session.current_step)
+
+
+async def _conflict_text(client: ClientState, session: SessionState) -> str:
+    """다른 작업자가 먼저 기록한 세션 - 최신 상태를 다시 불러와 안내"""
+    latest = await executor.run(session_manager.load_session, session.session_id, True)
+    client.session = latest
+    text = (
+        "⚠️ 다른 곳에서 이 세션이 먼저 수정되어 방금 답변은 저장되지 않았습니다.\n"
+        "최신 상태를 다시 불러왔습니다.\n\n"
+    )
+    if latest is None:
+        client.reset()
+        return text + "세션을 다시 불러오지 못했습니다. resume_thinking_session으로 확인하세요."
+    if latest.is_completed:
+        client.reset()
+        return text + f"✅ 이미 완료된 세션입니다 ({latest.method_name})."
+
+    text += f"🔄 {latest.method_name} ({latest.current_step}/{latest.total_steps} 답변 완료)\n\n"
+    with metrics.track("engine.render_question"):
+        text += engine.render_question(latest.method_id, latest.current_step)
+    return text
+
+
+async def resume_session(client: ClientState, session_id: str = "") -> list[types.TextContent]:
+    """
+    이전 세션 재개 (session_id 없으면 최근 세션 목록)
+    """
+    if not session_id:
+        recent = await executor.run(session_manager.recent_sessions, client.user_id, 10)
+        return [types.TextContent(type="text", text=_format_recent_sessions(client, recent))]
+
+    session = await executor.run(session_manager.load_session, session_id, True)
+    if session is None or session.user_id != client.user_id:
+        return [types.TextContent(
+            type="text",
+            text=f"❌ 세션을 찾을 수 없습니다: {session_id}\n"
+                 "세션을 시작할 때 사용한 user_id와 함께 호출하세요."
+        )]
+
+    if session.is_completed:
+        return [types.TextContent(
+            type="text",
+            text=f"✅ 이미 완료된 세션입니다 ({session.method_name}, "
+                 f"{session.current_step}/{session.total_steps}). "
+                 "새 문제는 innovation_socratic으로 시작하세요."
+        )]
+
+    # 트리거/분류 상태 복원 (분류 결과는 세션에 저장하지 않으므로 다시 분류)
+    classification = await _classify(session.problem)
+    client.detector.activate()
+    client.detector.current_session = {
+        "problem": session.problem,
+        "classification": classification,
+        "state": "questioning"
+    }
+    client.session = session
+
+    response_text = (
+        f"🔄 세션 재개: {session.method_name} "
+        f"({session.current_step}/{session.total_steps} 답변 완료)\n"
+        f"📌 문제: {session.problem}\n\n"
+    )
+    with metrics.track("engine.render_question"):
+        response_text += engine.render_question(session.method_id, session.current_step)
 
     return [types.TextContent(type="text", text=response_text)]
 
 
-async def end_session() -> list[types.TextContent]:
+def _format_recent_sessions(client: ClientState, recent: list[Dict[str, Any]]) -> str:
+    """최근 세션 목록 포맷팅"""
+    if not recent:
+        return (
+            f"📭 '{client.user_id}'의 저장된 세션이 없습니다.\n"
+            "세션을 시작할 때 사용한 user_id를 함께 전달하세요."
+        )
+
+    output = f"🗂️ 최근 세션 ({client.user_id})\n\n"
+    for i, summary in enumerate(recent, 1):
+        status = "✅ 완료" if summary["is_completed"] else "⏸️ 진행 중"
+        problem = summary["problem"]
+        if len(problem) > 40:
+            problem = problem[:40] + "…"
+        output += (
+            f"{i}. {summary['method_name']} - {summary['current_step']}/{summary['total_steps']} "
+            f"{status}\n"
+            f"   📌 {problem}\n"
+            f"   🆔 {summary['session_id']} ({summary['updated_at'][:16].replace('T', ' ')})\n"
+        )
+    output += "\n이어서 진행하려면 resume_thinking_session에 session_id를 전달하세요."
+    return output
+
+
+async def end_session(client: ClientState) -> list[types.TextContent]:
     """
     현재 세션 종료
     """
-    if session_manager.current_session:
-        summary = session_manager.end_session()
-        response_text = session_manager.format_session_summary(summary)
+    if client.session:
+        try:
+            summary = await executor.run_mutation(session_manager.end_session, client.session)
+            response_text = session_manager.format_session_summary(summary)
+        except StaleSessionError:
+            response_text = (
+                "⚠️ 다른 곳에서 이 세션이 먼저 수정되어 종료 상태를 저장하지 못했습니다.\n"
+                "resume_thinking_session으로 최신 상태를 확인하세요."
+            )
     else:
         response_text = "세션이 종료되었습니다."
 
-    detector.deactivate()
+    client.reset()
 
     return [types.TextContent(type="text", text=response_text)]
 
 
-async def main():
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    """명령줄 옵션 (기본값은 환경변수)"""
+    parser = argparse.ArgumentParser(description="Innovation Socratic MCP server")
+    parser.add_argument(
+        "--transport",
+        choices=["stdio", "http"],
+        default=os.environ.get("INNOVATION_SOCRATIC_TRANSPORT", "stdio"),
+        help="stdio: 클라이언트당 프로세스 1개, http: 여러 클라이언트를 하나의 프로세스에서 처리"
+    )
+    parser.add_argument("--host", default=os.environ.get("INNOVATION_SOCRATIC_HOST", "127.0.0.1"))
+    parser.add_argument(
+        "--port", type=int, default=int(os.environ.get("INNOVATION_SOCRATIC_PORT", "8000"))
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("INNOVATION_SOCRATIC_WORKERS", "0")),
+        help="CPU 작업용 워커 프로세스 수 (http 모드, 0 = 스레드 풀만 사용)"
+    )
+    parser.add_argument(
+        "--json-response", action="store_true", help="SSE 스트림 대신 JSON 응답 사용 (http 모드)"
+    )
+    return parser.parse_args(argv)
+
+
+async def main(argv: Optional[list[str]] = None):
     """서버 실행"""
+    args = parse_args(argv)
+
+    metrics_file = os.environ.get("INNOVATION_SOCRATIC_METRICS_FILE")
+    if metrics_file:
+        interval = float(os.environ.get("INNOVATION_SOCRATIC_METRICS_INTERVAL", "15"))
+        metrics.start_textfile_writer(metrics_file, interval)
+
+    # 이전 프로세스가 남긴 답변 저널을 스냅샷으로 압축
+    recovered = session_manager.recover()
+    if recovered:
+        print(f"Recovered {recovered} session journals", file=sys.stderr)
+
+    # 완료된 오래된 세션을 압축 세그먼트로 보관
+    start_archiver(
+        session_manager.store,
+        after_days=float(os.environ.get("INNOVATION_SOCRATIC_ARCHIVE_AFTER_DAYS", "0")),
+        interval=float(os.environ.get("INNOVATION_SOCRATIC_ARCHIVE_INTERVAL", "3600"))
+    )
+
+    try:
+        if args.transport == "http":
+            from .http_transport import serve_http
+            await serve_http(
+                server,
+                host=args.host,
+                port=args.port,
+                workers=args.workers,
+                json_response=args.json_response,
+                warm_rag=warmup_enabled()
+            )
+        else:
+            _install_signal_handlers(asyncio.current_task())
+            await _run_stdio()
+    except asyncio.CancelledError:
+        # 종료 시그널 (_graceful_stop)
+        pass
+    finally:
+        await shutdown()
+
+
+async def _run_stdio():
+    """stdio 전송으로 서버 실행"""
     async with stdio_server() as (read_stream, write_stream):
         await server.run(
             read_stream,
@@ -272,5 +679,58 @@ async def main():
         )
 
 
+def _install_signal_handlers(task: Optional[asyncio.Task]):
+    """SIGTERM/SIGINT 수신 시 진행 중인 호출을 마친 뒤 종료"""
+    if task is None:
+        return
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        try:
+            loop.add_signal_handler(sig, lambda: asyncio.ensure_future(_graceful_stop(task)))
+        except (NotImplementedError, RuntimeError):
+            # Windows 등 시그널 핸들러를 지원하지 않는 환경
+            pass
+
+
+async def _graceful_stop(task: asyncio.Task):
+    """새 호출을 거절하고 진행 중인 호출이 끝나면 서버 태스크 취소"""
+    scheduler.close()
+    await _drain()
+    task.cancel()
+
+
+async def _drain(timeout: Optional[float] = None) -> bool:
+    """진행 중인 도구 호출이 끝날 때까지 대기 (timeout 초과 시 False)"""
+    if timeout is None:
+        timeout = float(os.environ.get("INNOVATION_SOCRATIC_DRAIN_TIMEOUT", "10"))
+    deadline = time.monotonic() + timeout
+    while scheduler.running:
+        if time.monotonic() >= deadline:
+            return False
+        await asyncio.sleep(0.05)
+    return True
+
+
+async def shutdown() -> int:
+    """
+    종료 처리: 새 호출 거절 → 진행 중인 호출 대기 → 저장되지 않은 세션 기록
+
+    Returns:
+        기록한 세션 수
+    """
+    scheduler.close()
+    drained = await _drain()
+    flushed = session_manager.flush()
+    executor.shutdown(wait=drained)
+    session_manager.close()
+
+    print(
+        f"Innovation Socratic MCP stopped: flushed {flushed} session(s)"
+        + ("" if drained else " (drain timed out)"),
+        file=sys.stderr
+    )
+    return flushed
+
+
 if __name__ == "__main__":
     asyncio.run(main())
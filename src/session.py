@@ -1,49 +1,223 @@
 """
 Session Management
 세션 상태를 압축하여 저장 (토큰 절약)
+
+저장은 storage 모듈의 백엔드(파일/SQLite)에 위임합니다.
+답변 제출은 추가 기록만 하며, 파일 백엔드의 저널이
+INNOVATION_SOCRATIC_JOURNAL_COMPACT_EVERY 줄(기본 16)에 도달하거나
+세션이 끝나면 스냅샷으로 압축합니다.
+
+쓰기 정책 (INNOVATION_SOCRATIC_FLUSH_POLICY):
+    always    변경마다 즉시 기록 (기본) - 기록이 실패하면 (충돌 제외) 쓰기 대기열에
+              넣고 백그라운드 스레드가 FLUSH_INTERVAL_MS마다 다시 시도
+    interval  INNOVATION_SOCRATIC_FLUSH_INTERVAL_MS(기본 200)마다 모아서 기록
+    end       end_session 또는 종료 시에만 기록
+interval/end 정책에서는 같은 세션의 연속 변경이 한 번의 기록으로 합쳐지며,
+대기 중인 데이터가 INNOVATION_SOCRATIC_MAX_DIRTY_BYTES(기본 4MiB)를 넘으면
+즉시 기록합니다.
+
+여러 서버 프로세스가 같은 저장소를 쓸 때, 다른 프로세스가 먼저 기록한 세션을
+기록하려 하면 저장소가 StaleSessionError로 거부합니다 (version 비교).
+답변 제출 중이면 변경을 되돌린 뒤 예외를 호출자에게 전달하고 (서버는 최신 상태를
+다시 불러와 안내), 알릴 호출자가 없는 백그라운드 기록이면 거부된 상태를
+<storage_dir>/conflicts/에 남깁니다.
 """
 
+import itertools
 import json
-import hashlib
+import os
+import sys
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any, List
-from dataclasses import dataclass, asdict
+from typing import Optional, Dict, Any, List, Sequence, Tuple
+
+from .metrics import metrics
+from .storage import SessionStore, StaleSessionError, create_store, new_session_id
+from .session_cache import SessionCache
+
+
+def _epoch_us(dt: datetime) -> int:
+    return int(dt.timestamp()) * 1_000_000 + dt.microsecond
+
+
+def _to_epoch_us(timestamp: str) -> int:
+    """ISO 시각 문자열 → epoch 마이크로초"""
+    return _epoch_us(datetime.fromisoformat(timestamp))
+
+
+def _to_iso(epoch_us: int) -> str:
+    """epoch 마이크로초 → ISO 시각 문자열 (로컬 시각, 기존 저장 형식과 동일)"""
+    seconds, micros = divmod(epoch_us, 1_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=micros).isoformat()
 
 
-@dataclass
 class SessionState:
-    """세션 상태 (압축 형식)"""
-    session_id: str
-    user_id: str
-    problem: str  # 원본 문제
-    category: str  # 분류된 카테고리
-    method_id: str  # 선택된 방법론 ID
-    method_name: str  # 방법론 이름
-    current_step: int  # 현재 단계 (0-based)
-    total_steps: int  # 총 단계 수
-    answers: List[str]  # 사용자 답변들
-    created_at: str
-    updated_at: str
-    is_completed: bool = False
+    """
+    세션 상태 (압축 형식)
+
+    활성 세션을 대량으로 메모리에 유지하기 위한 표현:
+    - __slots__ (인스턴스 __dict__ 없음)
+    - user_id/category/method_id/method_name은 intern하여 세션 간 공유
+    - 시각은 epoch 마이크로초 정수로 보관 (created_at/updated_at은 ISO 문자열 속성)
+    - 답변은 튜플로 보관 (add_answers로만 추가)
+    - version은 저장소에서 읽은(또는 마지막으로 기록한) 버전 (충돌 감지용)
+    """
+
+    __slots__ = (
+        "session_id", "user_id", "problem", "category", "method_id", "method_name",
+        "current_step", "total_steps", "answers", "created_ts", "updated_ts", "is_completed",
+        "version"
+    )
+
+    def __init__(
+        self,
+        session_id: str,
+        user_id: str,
+        problem: str,  # 원본 문제
+        category: str,  # 분류된 카테고리
+        method_id: str,  # 선택된 방법론 ID
+        method_name: str,  # 방법론 이름
+        current_step: int,  # 현재 단계 (0-based)
+        total_steps: int,  # 총 단계 수
+        answers: Sequence[str],  # 사용자 답변들
+        created_at: str,
+        updated_at: str,
+        is_completed: bool = False,
+        version: int = 0
+    ):
+        self.session_id = session_id
+        self.user_id = sys.intern(user_id)
+        self.problem = problem
+        self.category = sys.intern(category)
+        self.method_id = sys.intern(method_id)
+        self.method_name = sys.intern(method_name)
+        self.current_step = current_step
+        self.total_steps = total_steps
+        self.answers: Tuple[str, ...] = tuple(answers)
+        self.created_ts = _to_epoch_us(created_at)
+        self.updated_ts = _to_epoch_us(updated_at)
+        self.is_completed = is_completed
+        self.version = version
+
+    @property
+    def created_at(self) -> str:
+        return _to_iso(self.created_ts)
+
+    @property
+    def updated_at(self) -> str:
+        return _to_iso(self.updated_ts)
+
+    @updated_at.setter
+    def updated_at(self, value: str):
+        self.updated_ts = _to_epoch_us(value)
+
+    def add_answers(self, answers: Sequence[str]):
+        """답변 추가 (단계 진행은 호출자가 처리)"""
+        self.answers += tuple(answers)
+
+    def touch(self):
+        """수정 시각 갱신"""
+        self.updated_ts = _epoch_us(datetime.now())
 
     def to_dict(self) -> Dict[str, Any]:
-        """딕셔너리로 변환"""
-        return asdict(self)
+        """딕셔너리로 변환 (저장 형식, asdict 깊은 복사 없이 직접 생성)"""
+        return {
+            "session_id": self.session_id,
+            "user_id": self.user_id,
+            "problem": self.problem,
+            "category": self.category,
+            "method_id": self.method_id,
+            "method_name": self.method_name,
+            "current_step": self.current_step,
+            "total_steps": self.total_steps,
+            "answers": list(self.answers),
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "is_completed": self.is_completed,
+            "version": self.version
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'SessionState':
         """딕셔너리에서 생성"""
         return cls(**data)
 
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SessionState):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    __hash__ = None  # 가변 객체
+
+    def __repr__(self) -> str:
+        return (
+            f"SessionState(session_id={self.session_id!r}, method_id={self.method_id!r}, "
+            f"step={self.current_step}/{self.total_steps}, completed={self.is_completed})"
+        )
+
+
+FLUSH_POLICIES = ("always", "interval", "end")
+
 
 class SessionManager:
     """세션 관리자"""
 
-    def __init__(self, storage_dir: str = "data/user_sessions"):
+    def __init__(
+        self,
+        storage_dir: str = "data/user_sessions",
+        store: Optional[SessionStore] = None,
+        flush_policy: Optional[str] = None,
+        cache: Optional[SessionCache] = None
+    ):
         self.storage_dir = Path(storage_dir)
-        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self.store = store or create_store(storage_dir)
+        # 최근 세션 메모리 캐시 (진행 중인 세션은 고정)
+        self.cache = cache if cache is not None else SessionCache()
         self.current_session: Optional[SessionState] = None
+        # 메모리에는 반영됐지만 아직 디스크에 기록되지 않은 세션
+        self._dirty: Dict[str, SessionState] = {}
+        self._dirty_lock = threading.Lock()
+        self.compact_every = max(1, int(
+            os.environ.get("INNOVATION_SOCRATIC_JOURNAL_COMPACT_EVERY", "16")
+        ))
+
+        # 쓰기 지연 설정
+        self.flush_policy = flush_policy or os.environ.get(
+            "INNOVATION_SOCRATIC_FLUSH_POLICY", "always"
+        )
+        if self.flush_policy not in FLUSH_POLICIES:
+            print(f"알 수 없는 쓰기 정책 '{self.flush_policy}', always 사용", file=sys.stderr)
+            self.flush_policy = "always"
+        self.flush_interval = int(
+            os.environ.get("INNOVATION_SOCRATIC_FLUSH_INTERVAL_MS", "200")
+        ) / 1000
+        self.max_dirty_bytes = int(
+            os.environ.get("INNOVATION_SOCRATIC_MAX_DIRTY_BYTES", str(4 * 1024 * 1024))
+        )
+
+        # 세션별 변경 세대/크기 (기록 중 다시 변경된 세션은 대기열에 유지)
+        self._generation: Dict[str, int] = {}
+        self._dirty_sizes: Dict[str, int] = {}
+        self._dirty_bytes = 0
+        self._seq = itertools.count(1)
+        self._coalesced = 0
+        self._writes = 0
+        self._write_failures = 0
+        self._flushes = 0
+        self._conflicts = 0
+
+        # 같은 세션의 변경/기록 직렬화 (스레드 간 - 프로세스 간은 저장소가 version으로 검사)
+        # 변경하는 쪽이 잡은 채로 기록까지 하므로 재진입 가능
+        self._write_locks = tuple(threading.RLock() for _ in range(64))
+        # 백그라운드 기록에서 거부된 세션 (다음 호출에서 호출자에게 알림)
+        self._stale: Dict[str, Tuple[SessionState, StaleSessionError]] = {}
+        self.conflicts_dir = self.storage_dir / "conflicts"
+
+        self._flush_event = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        self._flusher_lock = threading.Lock()
+        self._closed = False
 
     def create_session(
         self,
@@ -55,7 +229,7 @@ class SessionManager:
         total_steps: int
     ) -> SessionState:
         """새 세션 생성"""
-        # 세션 ID 생성 (해시)
+        # 세션 ID 생성 (시간순 정렬 가능)
         session_id = self._generate_session_id(user_id, problem)
 
         now = datetime.now().isoformat()
@@ -69,86 +243,401 @@ class SessionManager:
             method_name=method_name,
             current_step=0,
             total_steps=total_steps,
-            answers=[],
+            answers=(),
             created_at=now,
             updated_at=now,
             is_completed=False
         )
 
         self.current_session = session
+        self.cache.put(session, pin=True)
         self._save_session(session)
 
         return session
 
-    def add_answer(self, answer: str) -> bool:
-        """답변 추가 및 단계 진행"""
-        if not self.current_session:
-            return False
-
-        self.current_session.answers.append(answer)
-        self.current_session.current_step += 1
-        self.current_session.updated_at = datetime.now().isoformat()
+    def add_answer(self, answer: str, session: Optional[SessionState] = None) -> bool:
+        """답변 추가 및 단계 진행 (session 미지정 시 current_session)"""
+        return self.add_answers([answer], session) > 0
+
+    def add_answers(self, answers: List[str], session: Optional[SessionState] = None) -> int:
+        """
+        여러 답변을 한 번에 추가하고 한 번만 저장
+
+        Returns:
+            반영된 답변 수 (남은 단계 수를 넘는 답변은 무시)
+
+        Raises:
+            StaleSessionError: 다른 작업자가 먼저 기록함 (이전 백그라운드 기록의 충돌 포함)
+        """
+        session = session or self.current_session
+        if not session:
+            return 0
+        # 변경과 스냅샷(to_dict)이 섞이지 않도록 세션 잠금 안에서 변경
+        with self._write_lock(session.session_id):
+            self._raise_if_stale(session)
+            if session.is_completed:
+                return 0
+            return self._add_answers_locked(session, answers)
+
+    def _add_answers_locked(self, session: SessionState, answers: List[str]) -> int:
+        remaining = max(session.total_steps - session.current_step, 0)
+        accepted = list(answers[:remaining])
+        if not accepted:
+            return 0
+
+        previous = (session.answers, session.current_step, session.updated_ts, session.is_completed)
+        session.add_answers(accepted)
+        session.current_step += len(accepted)
+        session.touch()
 
         # 마지막 단계면 완료 표시
-        if self.current_session.current_step >= self.current_session.total_steps:
-            self.current_session.is_completed = True
+        if session.current_step >= session.total_steps:
+            session.is_completed = True
 
-        self._save_session(self.current_session)
+        if self.flush_policy != "always":
+            # 쓰기 지연 대기열에 추가 (연속 답변은 한 번의 기록으로 합쳐짐)
+            self._mark_dirty(session)
+            return len(accepted)
 
-        return True
+        # 답변만 저널에 추가 (실패하거나 저널이 길어지면 스냅샷으로 기록)
+        try:
+            entries = self._append_answers(session, accepted)
+            if entries is None or entries >= self.compact_every:
+                try:
+                    self._save_session(session)
+                except StaleSessionError:
+                    # 저널에 이미 기록됐으면 압축만 다른 작업자에게 맡김
+                    if entries is None:
+                        raise
+        except StaleSessionError:
+            # 다른 작업자가 먼저 기록함 - 메모리 변경을 되돌리고 호출자에게 알림
+            (
+                session.answers, session.current_step, session.updated_ts, session.is_completed
+            ) = previous
+            raise
+
+        return len(accepted)
 
     def get_current_session(self) -> Optional[SessionState]:
         """현재 세션 조회"""
         return self.current_session
 
-    def load_session(self, session_id: str) -> Optional[SessionState]:
-        """세션 로드"""
-        session_file = self.storage_dir / f"{session_id}.json"
-
-        if not session_file.exists():
-            return None
+    def load_session(self, session_id: str, pin: bool = False) -> Optional[SessionState]:
+        """
+        세션 로드 (쓰기 대기열 → 캐시 → 저장소 순)
+
+        current_session은 바꾸지 않습니다. pin=True면 캐시에 고정합니다.
+        """
+        # 아직 기록되지 않은 변경이 있으면 메모리 상태가 최신
+        with self._dirty_lock:
+            pending = self._dirty.get(session_id)
+        session = pending or self.cache.get(session_id)
+        if session is not None:
+            if pending is not None or pin:
+                self.cache.put(session, pin=pin)
+            return session
 
         try:
-            with open(session_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                session = SessionState.from_dict(data)
-                self.current_session = session
-                return session
+            with metrics.track("session_manager.load_session"):
+                data = self.store.load(session_id)
         except Exception as e:
-            print(f"세션 로드 실패: {e}")
+            print(f"세션 로드 실패: {e}", file=sys.stderr)
             return None
 
-    def end_session(self) -> Optional[Dict[str, Any]]:
-        """세션 종료 및 요약 반환"""
-        if not self.current_session:
+        if data is None:
             return None
 
-        summary = self._generate_summary(self.current_session)
+        session = SessionState.from_dict(data)
+        self.cache.put(session, pin=pin)
+        return session
 
-        # 세션 완료 표시
-        self.current_session.is_completed = True
-        self._save_session(self.current_session)
+    def recent_sessions(self, user_id: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        사용자의 최근 세션 요약 (저장소 인덱스 + 아직 기록되지 않은 세션)
+
+        Returns:
+            최근 수정 순 요약 목록 (answers 대신 answer_count)
+        """
+        with metrics.track("session_manager.recent_sessions"):
+            try:
+                summaries = self.store.recent_for_user(user_id, limit)
+            except Exception as e:
+                print(f"최근 세션 조회 실패: {e}", file=sys.stderr)
+                summaries = []
+
+        with self._dirty_lock:
+            pending = [s for s in self._dirty.values() if s.user_id == user_id]
+        if pending:
+            by_id = {summary["session_id"]: summary for summary in summaries}
+            for session in pending:
+                summary = session.to_dict()
+                summary["answer_count"] = len(summary.pop("answers"))
+                by_id[session.session_id] = summary
+            summaries = sorted(by_id.values(), key=lambda d: d["updated_at"], reverse=True)[:limit]
+        return summaries
+
+    def recover(self) -> int:
+        """
+        시작 시 압축되지 않은 기록(저널)을 스냅샷으로 압축
+
+        Returns:
+            복구한 세션 수
+        """
+        recovered = 0
+        for session_id in self.store.recover():
+            session = self.load_session(session_id)
+            try:
+                if session is not None and self._write_session(session):
+                    recovered += 1
+            except StaleSessionError:
+                pass  # 다른 프로세스가 먼저 압축함
+        return recovered
+
+    def end_session(self, session: Optional[SessionState] = None) -> Optional[Dict[str, Any]]:
+        """
+        세션 종료 및 요약 반환 (session 미지정 시 current_session)
+
+        Raises:
+            StaleSessionError: 다른 작업자가 먼저 기록한 세션
+        """
+        session = session or self.current_session
+        if not session:
+            return None
+        with self._write_lock(session.session_id):
+            self._raise_if_stale(session)
+            summary = self._end_session_locked(session)
 
         # 현재 세션 초기화
-        self.current_session = None
+        if session is self.current_session:
+            self.current_session = None
 
         return summary
 
-    def _save_session(self, session: SessionState):
-        """세션을 파일로 저장 (JSON 압축)"""
-        session_file = self.storage_dir / f"{session.session_id}.json"
+    def _end_session_locked(self, session: SessionState) -> Dict[str, Any]:
+        summary = self._generate_summary(session)
+
+        # 세션 완료 표시 후 저널/쓰기 대기열을 스냅샷으로 기록 (쓰기 정책과 무관하게 즉시)
+        # (마지막 답변에서 이미 완료 상태로 기록된 경우 생략)
+        with self._dirty_lock:
+            dirty = session.session_id in self._dirty
+        if not session.is_completed or dirty or self.store.pending(session.session_id):
+            session.is_completed = True
+            self._write_session(session)
+        self.cache.unpin(session.session_id)
+        return summary
 
+    def _raise_if_stale(self, session: SessionState):
+        """백그라운드 기록에서 거부된 세션이면 한 번 알림 (호출자가 저장소에서 다시 불러옴)"""
+        with self._dirty_lock:
+            stale, error = self._stale.get(session.session_id, (None, None))
+            if stale is not session:
+                return
+            del self._stale[session.session_id]
+        raise error
+
+    def _save_session(self, session: SessionState) -> bool:
+        """세션 저장 (always 정책이면 즉시 기록, 그 외에는 쓰기 대기열에 추가)"""
+        if self.flush_policy == "always":
+            return self._write_session(session)
+        self._mark_dirty(session)
+        return True
+
+    def _write_lock(self, session_id: str) -> threading.Lock:
+        return self._write_locks[hash(session_id) % len(self._write_locks)]
+
+    def _write_session(self, session: SessionState) -> bool:
+        """
+        세션 전체를 저장소에 즉시 기록
+
+        Raises:
+            StaleSessionError: 다른 작업자가 먼저 기록함
+        """
+        session_id = session.session_id
+        with self._dirty_lock:
+            generation = self._generation.get(session_id)
+
+        with metrics.track("session_manager._save_session"), self._write_lock(session_id):
+            try:
+                self.store.save(session.to_dict())
+                session.version += 1
+            except StaleSessionError as e:
+                self._record_conflict(session, e)
+                raise
+            except Exception as e:
+                print(f"세션 저장 실패: {e}", file=sys.stderr)
+                with self._dirty_lock:
+                    self._write_failures += 1
+                # 다음 flush에서 다시 시도 (always 정책도 기록 스레드가 재시도)
+                self._mark_dirty(session)
+                return False
+
+        with self._dirty_lock:
+            self._writes += 1
+            # 기록하는 동안 다시 변경되지 않았을 때만 대기열에서 제거
+            if session_id in self._dirty and self._generation.get(session_id) == generation:
+                del self._dirty[session_id]
+                del self._generation[session_id]
+                self._dirty_bytes -= self._dirty_sizes.pop(session_id, 0)
+        return True
+
+    def _record_conflict(self, session: SessionState, error: StaleSessionError):
+        """기록 충돌 처리 (재시도해도 성공할 수 없으므로 쓰기 대기열과 캐시에서 제거)"""
+        session_id = session.session_id
+        print(f"세션 저장 거부: {error}", file=sys.stderr)
+        with self._dirty_lock:
+            self._conflicts += 1
+            if session_id in self._dirty:
+                del self._dirty[session_id]
+                self._generation.pop(session_id, None)
+                self._dirty_bytes -= self._dirty_sizes.pop(session_id, 0)
+        self.cache.discard(session_id)
+
+    def _keep_conflict(self, session: SessionState):
+        """거부된 상태를 conflicts/<id>.v<version>.<pid>.json으로 보관 (답변 유실 방지)"""
         try:
-            with open(session_file, 'w', encoding='utf-8') as f:
-                json.dump(session.to_dict(), f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            print(f"세션 저장 실패: {e}")
+            with self._write_lock(session.session_id):
+                data = session.to_dict()
+            self.conflicts_dir.mkdir(parents=True, exist_ok=True)
+            conflict_file = (
+                self.conflicts_dir / f"{session.session_id}.v{session.version}.{os.getpid()}.json"
+            )
+            with open(conflict_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            print(f"충돌 세션 보관 실패: {e}", file=sys.stderr)
+
+    def _mark_dirty(self, session: SessionState):
+        """쓰기 대기열에 추가 (이미 있으면 합침)"""
+        session_id = session.session_id
+        # 대략적인 크기 (문자 수 기준)
+        size = 256 + len(session.problem) + sum(len(a) for a in session.answers)
+
+        with self._dirty_lock:
+            if session_id in self._dirty:
+                self._coalesced += 1
+            self._dirty[session_id] = session
+            self._generation[session_id] = next(self._seq)
+            self._dirty_bytes += size - self._dirty_sizes.get(session_id, 0)
+            self._dirty_sizes[session_id] = size
+            over_limit = self._dirty_bytes > self.max_dirty_bytes
+
+        self._ensure_flusher()
+        if over_limit:
+            self._flush_event.set()
+
+    def _ensure_flusher(self):
+        """백그라운드 기록 스레드 지연 시작"""
+        if self._flusher is not None or self._closed:
+            return
+        with self._flusher_lock:
+            if self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._flush_loop,
+                    name="socratic-session-flush",
+                    daemon=True
+                )
+                self._flusher.start()
+
+    def _flush_loop(self):
+        # end 정책은 용량 초과 신호가 올 때만 기록
+        # (always 정책은 실패한 기록이 있을 때만 시작되며 interval처럼 재시도)
+        timeout = None if self.flush_policy == "end" else self.flush_interval
+        while not self._closed:
+            self._flush_event.wait(timeout)
+            self._flush_event.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"세션 flush 실패: {e}", file=sys.stderr)
+
+    def _append_answers(self, session: SessionState, answers: List[str]) -> Optional[int]:
+        """
+        답변만 추가 기록
+
+        Returns:
+            압축되지 않은 기록 수 (실패 시 None)
+
+        Raises:
+            StaleSessionError: 다른 작업자가 먼저 기록함
+        """
+        with metrics.track("session_manager._append_answers"), self._write_lock(session.session_id):
+            try:
+                entries = self.store.append_answers(
+                    session.session_id,
+                    session.current_step,
+                    answers,
+                    session.updated_at,
+                    session.is_completed,
+                    session.version
+                )
+                session.version += 1
+                return entries
+            except StaleSessionError as e:
+                self._record_conflict(session, e)
+                raise
+            except Exception as e:
+                print(f"답변 기록 실패: {e}", file=sys.stderr)
+                return None
+
+    def flush(self) -> int:
+        """
+        저장되지 않은 세션을 모두 기록
+
+        Returns:
+            기록에 성공한 세션 수
+        """
+        with self._dirty_lock:
+            pending = list(self._dirty.values())
+        if not pending:
+            return 0
+
+        written = 0
+        with metrics.track("session_manager.flush"):
+            for session in pending:
+                try:
+                    written += self._write_session(session)
+                except StaleSessionError as e:
+                    # 거부된 상태를 파일로 남기고 다음 호출에서 알림
+                    self._keep_conflict(session)
+                    with self._dirty_lock:
+                        self._stale[session.session_id] = (session, e)
+        with self._dirty_lock:
+            self._flushes += 1
+        return written
+
+    def close(self):
+        """기록 스레드 종료, 남은 변경 기록 후 저장소 연결 정리"""
+        self._closed = True
+        self._flush_event.set()
+        if self._flusher is not None:
+            self._flusher.join(timeout=5)
+        self.flush()
+        self.store.close()
+
+    def get_write_stats(self) -> Dict[str, Any]:
+        """쓰기 지연 통계"""
+        with self._dirty_lock:
+            return {
+                "policy": self.flush_policy,
+                "dirty": len(self._dirty),
+                "dirty_bytes": self._dirty_bytes,
+                "max_dirty_bytes": self.max_dirty_bytes,
+                "coalesced": self._coalesced,
+                "writes": self._writes,
+                "write_failures": self._write_failures,
+                "conflicts": self._conflicts,
+                "flushes": self._flushes,
+            }
+
+    @property
+    def dirty_count(self) -> int:
+        """저장 대기 중인 세션 수"""
+        with self._dirty_lock:
+            return len(self._dirty)
 
     def _generate_session_id(self, user_id: str, problem: str) -> str:
-        """세션 ID 생성 (해시)"""
-        timestamp = datetime.now().isoformat()
-        content = f"{user_id}:{problem}:{timestamp}"
-        return hashlib.sha256(content.encode()).hexdigest()[:16]
+        """세션 ID 생성 (생성 시각 접두사 + 난수, storage.new_session_id)"""
+        return new_session_id()
 
     def _generate_summary(self, session: SessionState) -> Dict[str, Any]:
         """세션 요약 생성"""
@@ -194,7 +683,7 @@ class SessionManager:
             "method_id": self.current_session.method_id,
             "current_step": self.current_session.current_step,
             "problem": self.current_session.problem,
-            "previous_answers": self.current_session.answers
+            "previous_answers": list(self.current_session.answers)
         }
 
     def format_session_summary(self, summary: Dict[str, Any]) -> str:
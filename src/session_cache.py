@@ -0,0 +1,156 @@
+"""
+Session Cache
+SessionManager.load_session 앞단의 LRU + 유휴 TTL 메모리 캐시
+
+- 최근 사용 순서 유지 (OrderedDict), 용량 초과 시 가장 오래된 세션부터 제거
+- 마지막 사용 후 TTL이 지난 세션은 조회 시/정리 시 제거
+- 진행 중인 세션은 고정(pin)하여 용량 초과로 제거되지 않음
+  (고정된 세션은 별도 dict에 보관 - 고정 세션이 많아도 제거는 O(1))
+  (고정된 세션도 TTL은 적용 - 종료하지 않고 떠난 클라이언트의 세션이 쌓이지 않도록)
+
+캐시는 조회 가속용일 뿐이며, 아직 기록되지 않은 변경은 SessionManager의
+쓰기 대기열이 별도로 보관하므로 캐시에서 제거되어도 유실되지 않습니다.
+
+환경변수:
+    INNOVATION_SOCRATIC_SESSION_CACHE_SIZE: 최대 세션 수 (기본 10000, 0 = 사용 안 함)
+    INNOVATION_SOCRATIC_SESSION_CACHE_TTL: 유휴 TTL 초 (기본 3600)
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .session import SessionState
+
+
+class SessionCache:
+    """LRU + TTL 세션 캐시"""
+
+    SWEEP_EVERY = 1024  # 추가 N회마다 TTL이 지난 세션 정리
+
+    def __init__(self, max_size: Optional[int] = None, ttl: Optional[float] = None):
+        self.max_size = max_size if max_size is not None else int(
+            os.environ.get("INNOVATION_SOCRATIC_SESSION_CACHE_SIZE", "10000")
+        )
+        self.ttl = ttl if ttl is not None else float(
+            os.environ.get("INNOVATION_SOCRATIC_SESSION_CACHE_TTL", "3600")
+        )
+        # session_id → (세션, 마지막 사용 시각) - 고정되지 않은 세션(LRU 순)과 고정된 세션
+        self._entries: "OrderedDict[str, Tuple[SessionState, float]]" = OrderedDict()
+        self._pinned: Dict[str, Tuple["SessionState", float]] = {}
+        self._lock = threading.Lock()
+        self._puts = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, session_id: str) -> Optional["SessionState"]:
+        """캐시 조회 (TTL이 지났으면 제거 후 None)"""
+        now = time.monotonic()
+        with self._lock:
+            pinned = session_id in self._pinned
+            entry = self._pinned.get(session_id) if pinned else self._entries.get(session_id)
+            if entry is None:
+                self._misses += 1
+                return None
+            session, last_used = entry
+            if now - last_used > self.ttl:
+                self._remove(session_id)
+                self._expirations += 1
+                self._misses += 1
+                return None
+            if pinned:
+                self._pinned[session_id] = (session, now)
+            else:
+                self._entries[session_id] = (session, now)
+                self._entries.move_to_end(session_id)
+            self._hits += 1
+            return session
+
+    def put(self, session: "SessionState", pin: bool = False):
+        """캐시에 추가 (용량 초과 시 고정되지 않은 가장 오래된 세션 제거)"""
+        if self.max_size <= 0:
+            return
+        session_id = session.session_id
+        with self._lock:
+            entry = (session, time.monotonic())
+            if pin or session_id in self._pinned:
+                self._entries.pop(session_id, None)
+                self._pinned[session_id] = entry
+            else:
+                self._entries[session_id] = entry
+                self._entries.move_to_end(session_id)
+            self._evict_over_capacity()
+            self._puts += 1
+            sweep = self._puts % self.SWEEP_EVERY == 0
+        if sweep:
+            self.evict_expired()
+
+    def pin(self, session_id: str):
+        """용량 초과 제거 대상에서 제외"""
+        with self._lock:
+            if session_id in self._entries:
+                self._pinned[session_id] = self._entries.pop(session_id)
+
+    def unpin(self, session_id: str):
+        """고정 해제"""
+        with self._lock:
+            entry = self._pinned.pop(session_id, None)
+            if entry is not None:
+                # 방금까지 쓰던 세션이므로 가장 최근 사용으로
+                self._entries[session_id] = entry
+                self._entries.move_to_end(session_id)
+            self._evict_over_capacity()
+
+    def discard(self, session_id: str):
+        """캐시에서 제거"""
+        with self._lock:
+            self._remove(session_id)
+
+    def evict_expired(self) -> int:
+        """TTL이 지난 세션 정리"""
+        cutoff = time.monotonic() - self.ttl
+        with self._lock:
+            expired = [
+                sid
+                for entries in (self._entries, self._pinned)
+                for sid, (_, last_used) in entries.items()
+                if last_used < cutoff
+            ]
+            for session_id in expired:
+                self._remove(session_id)
+            self._expirations += len(expired)
+        return len(expired)
+
+    def _remove(self, session_id: str):
+        self._entries.pop(session_id, None)
+        self._pinned.pop(session_id, None)
+
+    def _evict_over_capacity(self):
+        # 오래된 순으로 고정되지 않은 세션 제거 (고정 세션만 남으면 중단)
+        while self._entries and len(self._entries) + len(self._pinned) > self.max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._entries) + len(self._pinned)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """통계"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries) + len(self._pinned),
+                "pinned": len(self._pinned),
+                "max_size": self.max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+            }
@@ -0,0 +1,1004 @@
+"""
+Session Storage Backends
+세션 저장소 인터페이스와 구현 (파일 / SQLite)
+
+- FileSessionStore: <id>.json 스냅샷 + <id>.journal.jsonl 답변 저널
+- SQLiteSessionStore: WAL 모드 SQLite, 조회용 보조 인덱스
+
+여러 프로세스가 같은 저장소를 공유할 수 있습니다. 세션마다 version을 두고
+기록할 때 호출자가 읽었던 version과 저장된 version을 비교합니다 (compare-and-swap).
+다르면 다른 작업자가 먼저 기록한 것이므로 덮어쓰지 않고 StaleSessionError를 발생시킵니다.
+파일 저장소는 비교와 기록 사이를 세션별 권고 잠금(locks/<shard>.lock, flock)으로 보호합니다.
+
+세션 ID는 시간순 정렬 가능한 형식입니다 (new_session_id):
+    <생성 시각 epoch ms, 16진수 12자리><난수 16진수 12자리>
+파일 저장소는 ID의 날짜(UTC)와 마지막 두 글자로 디렉토리를 나눕니다:
+    <storage_dir>/<YYYY-MM-DD>/<shard>/<id>.json
+이전 형식(SHA-256 16자리) ID는 기존처럼 <storage_dir>/<id>.json에서 읽습니다.
+완료 후 오래된 세션은 <storage_dir>/archive/의 압축 세그먼트로 옮겨집니다 (archive 모듈).
+
+환경변수:
+    INNOVATION_SOCRATIC_SESSION_BACKEND: file, sqlite (기본 file)
+    INNOVATION_SOCRATIC_SESSION_DB: SQLite 파일 경로 (기본 <storage_dir>/sessions.db)
+    INNOVATION_SOCRATIC_ARCHIVE_AFTER_DAYS: 완료 후 보관까지 일수 (기본 0 = 보관 안 함)
+    INNOVATION_SOCRATIC_ARCHIVE_INTERVAL: 보관 작업 주기 초 (기본 3600)
+"""
+
+import hashlib
+import json
+import os
+import re
+import secrets
+import sqlite3
+import sys
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from .archive import SessionArchive
+from .locks import locked_file
+
+# SessionState.to_dict()와 같은 필드 순서
+SESSION_FIELDS = (
+    "session_id", "user_id", "problem", "category", "method_id", "method_name",
+    "current_step", "total_steps", "answers", "created_at", "updated_at", "is_completed", "version"
+)
+
+# find() 결과에 포함하는 필드 (답변 제외)
+SUMMARY_FIELDS = tuple(f for f in SESSION_FIELDS if f != "answers")
+
+
+SORTABLE_ID = re.compile(r"^[0-9a-f]{24}$")
+PARTITION_DIR = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+# 파일 저장소가 기억하는 세션 version 수 (넘으면 비움)
+VERSION_CACHE_SIZE = 65536
+
+
+class StaleSessionError(RuntimeError):
+    """다른 작업자가 먼저 기록해 저장된 version이 기대한 값과 다름"""
+
+    def __init__(self, session_id: str, expected: int, actual: Optional[int]):
+        super().__init__(
+            f"세션 {session_id} 기록 충돌 (기대 version {expected}, 저장된 version {actual})"
+        )
+        self.session_id = session_id
+        self.expected = expected
+        self.actual = actual
+
+
+def new_session_id() -> str:
+    """시간순 정렬 가능한 세션 ID (생성 시각 ms 12자리 + 난수 12자리)"""
+    return f"{int(time.time() * 1000):012x}{secrets.token_hex(6)}"
+
+
+def session_id_time(session_id: str) -> Optional[datetime]:
+    """세션 ID에 담긴 생성 시각 (UTC, 이전 형식 ID는 None)"""
+    if not SORTABLE_ID.match(session_id):
+        return None
+    return datetime.fromtimestamp(int(session_id[:12], 16) / 1000, tz=timezone.utc)
+
+
+class SessionStore:
+    """세션 저장소 인터페이스 (세션은 SessionState.to_dict() 형식의 딕셔너리)"""
+
+    name = "base"
+
+    def load(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """세션 로드 (없으면 None)"""
+        raise NotImplementedError
+
+    def save(self, data: Dict[str, Any]):
+        """
+        세션 전체 기록 (data["version"]은 호출자가 읽었던 version, 저장 후 +1)
+
+        Raises:
+            StaleSessionError: 저장된 version이 data["version"]과 다름
+        """
+        raise NotImplementedError
+
+    def append_answers(
+        self,
+        session_id: str,
+        step: int,
+        answers: List[str],
+        updated_at: str,
+        is_completed: bool,
+        version: int
+    ) -> int:
+        """
+        답변 추가 기록 (step은 추가 후 단계, version은 추가 전 version)
+
+        Returns:
+            스냅샷으로 압축되지 않은 기록 수 (0이면 압축 불필요)
+
+        Raises:
+            StaleSessionError: 저장된 version이 version과 다름
+            LookupError: 세션이 저장되어 있지 않음 (SQLite)
+        """
+        raise NotImplementedError
+
+    def pending(self, session_id: str) -> int:
+        """압축되지 않은 기록 수"""
+        return 0
+
+    def recover(self) -> List[str]:
+        """압축이 필요한 세션 ID 목록 (시작 시 복구용)"""
+        return []
+
+    def find(
+        self,
+        user_id: Optional[str] = None,
+        method_id: Optional[str] = None,
+        category: Optional[str] = None,
+        is_completed: Optional[bool] = None,
+        limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        """조건에 맞는 세션 요약 (최근 수정 순, 답변 제외)"""
+        raise NotImplementedError
+
+    def iter_sessions(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        세션 순회 (정리/내보내기/분석/마이그레이션용)
+
+        since/until을 주면 생성 시각이 [since, until) 범위인 세션만 순회합니다.
+        """
+        raise NotImplementedError
+
+    def recent_for_user(self, user_id: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """사용자의 최근 세션 요약 (최근 수정 순, 인덱스 사용)"""
+        return self.find(user_id=user_id, limit=limit)
+
+    def iter_summaries(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """세션 요약 순회 (답변 대신 answer_count, 분석용)"""
+        for data in self.iter_sessions(since, until):
+            summary = {f: data[f] for f in SUMMARY_FIELDS}
+            summary["answer_count"] = len(data["answers"])
+            yield summary
+
+    def archive_completed(self, after_days: float) -> int:
+        """완료 후 after_days일이 지난 세션을 보관 (지원하지 않는 저장소는 0)"""
+        return 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """통계"""
+        return {"backend": self.name}
+
+    def close(self):
+        """리소스 정리"""
+
+
+class FileSessionStore(SessionStore):
+    """
+    세션당 JSON 파일 저장소
+
+    저장 형식:
+        <id>.json           스냅샷 (세션 생성/압축 시 전체 기록)
+        <id>.journal.jsonl  답변 저널 (답변 제출마다 한 줄 추가)
+
+    파일은 <YYYY-MM-DD>/<shard>/ 아래에 두어 기간 조회 시 해당 날짜 디렉토리만 읽습니다.
+    완료된 오래된 세션은 archive/ 아래 날짜별 압축 세그먼트로 옮기며,
+    로드/순회 시 개별 파일이 없으면 보관본을 읽습니다.
+
+    사용자별 세션 ID 목록은 users/<user_id 해시>.idx에 세션을 기록할 때마다 한 줄씩 추가합니다
+    (마지막에 나온 ID일수록 최근 수정). 추가/조회는 locks/user-<shard>.lock 공유 잠금,
+    재생성/압축은 배타 잠금 안에서 합니다. 인덱스 도입 전 저장소는 시작 시 recover()에서
+    (또는 scripts/migrate_sessions.py --upgrade-only로) 한 번 재생성합니다.
+
+    기록(save/append_answers)은 세션 ID 마지막 두 글자별 잠금 파일(locks/<shard>.lock)을
+    배타적으로, 로드는 공유로 잡습니다 (세션마다 잠금 파일을 만들지 않도록 256개로 나눔).
+    """
+
+    name = "file"
+
+    def __init__(self, storage_dir: str = "data/user_sessions"):
+        self.storage_dir = Path(storage_dir)
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        # 세션별 저널 줄 수 (압축 시점 판단)
+        self._journal_entries: Dict[str, int] = {}
+        # 세션별 (스냅샷/저널 파일 상태, version, user_id) - 파일이 그대로면 다시 읽지 않음
+        self._versions: Dict[str, Tuple[Tuple[int, int, int, int], int, str]] = {}
+        self.archive = SessionArchive(str(self.storage_dir / "archive"))
+        self.users_dir = self.storage_dir / "users"
+        self.locks_dir = self.storage_dir / "locks"
+        self.locks_dir.mkdir(exist_ok=True)
+        self._conflicts = 0
+
+    def _locked(self, session_id: str, shared: bool = False):
+        """세션 잠금 (다른 프로세스/스레드와 배타, shared=True면 읽기끼리 공유)"""
+        return self._lock_file(f"{session_id[-2:]}.lock", shared)
+
+    def _lock_file(self, name: str, shared: bool):
+        return locked_file(self.locks_dir / name, shared)
+
+    def _check_version(self, session_id: str, expected: int) -> Optional[str]:
+        """
+        저장된 version 확인 (잠금을 잡은 상태에서 호출)
+
+        마지막으로 확인/기록한 뒤 스냅샷과 저널 파일이 그대로면 기억해 둔 version을 쓰고,
+        바뀌었을 때만 (다른 프로세스가 기록) 세션 전체를 읽습니다.
+
+        Returns:
+            저장된 세션의 user_id (없으면 None)
+        """
+        stamp = self._file_stamp(session_id)
+        cached = self._versions.get(session_id)
+        if stamp is not None and cached is not None and cached[0] == stamp:
+            _, version, user_id = cached
+        else:
+            current = self._load_unlocked(session_id)
+            if current is None:
+                return None
+            version, user_id = current["version"], current["user_id"]
+            self._remember_version(session_id, version, user_id, stamp)
+        if version != expected:
+            self._conflicts += 1
+            raise StaleSessionError(session_id, expected, version)
+        return user_id
+
+    def _file_stamp(self, session_id: str) -> Optional[Tuple[int, int, int, int]]:
+        """스냅샷 (inode, mtime, 크기)과 저널 크기 - 스냅샷이 없으면 None (보관본)"""
+        try:
+            snapshot = os.stat(self._snapshot_path(session_id))
+        except FileNotFoundError:
+            return None
+        try:
+            journal_size = os.stat(self._journal_path(session_id)).st_size
+        except FileNotFoundError:
+            journal_size = -1
+        return (snapshot.st_ino, snapshot.st_mtime_ns, snapshot.st_size, journal_size)
+
+    def _remember_version(
+        self,
+        session_id: str,
+        version: int,
+        user_id: str,
+        stamp: Optional[Tuple[int, int, int, int]] = None
+    ):
+        """기록/확인한 version을 현재 파일 상태와 함께 기억 (잠금을 잡은 상태에서 호출)"""
+        stamp = stamp or self._file_stamp(session_id)
+        if stamp is None:
+            self._versions.pop(session_id, None)
+            return
+        if len(self._versions) >= VERSION_CACHE_SIZE:
+            self._versions.clear()
+        self._versions[session_id] = (stamp, version, user_id)
+
+    def _session_dir(self, session_id: str) -> Path:
+        """ID에 해당하는 디렉토리 (이전 형식 ID는 최상위)"""
+        created = session_id_time(session_id)
+        if created is None:
+            return self.storage_dir
+        return self.storage_dir / created.strftime("%Y-%m-%d") / session_id[-2:]
+
+    def _snapshot_path(self, session_id: str) -> Path:
+        return self._session_dir(session_id) / f"{session_id}.json"
+
+    @staticmethod
+    def _archive_partition(session_id: str) -> str:
+        created = session_id_time(session_id)
+        return created.strftime("%Y-%m-%d") if created else "legacy"
+
+    def _journal_path(self, session_id: str) -> Path:
+        return self._session_dir(session_id) / f"{session_id}.journal.jsonl"
+
+    def partitions(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
+    ) -> List[Path]:
+        """범위에 걸치는 날짜 디렉토리 목록 (오래된 순)"""
+        first = since.astimezone(timezone.utc).date() if since else date.min
+        last = until.astimezone(timezone.utc).date() if until else date.max
+        days = []
+        for path in self.storage_dir.iterdir():
+            if not (path.is_dir() and PARTITION_DIR.match(path.name)):
+                continue
+            day = date.fromisoformat(path.name)
+            if first <= day <= last:
+                days.append(path)
+        return sorted(days)
+
+    def load(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """스냅샷 로드 후 저널 재적용 (없으면 보관본)"""
+        with self._locked(session_id, shared=True):
+            return self._load_unlocked(session_id)
+
+    def _load_unlocked(self, session_id: str) -> Optional[Dict[str, Any]]:
+        session_file = self._snapshot_path(session_id)
+        if not session_file.exists():
+            data = self.archive.lookup(self._archive_partition(session_id), session_id)
+        else:
+            with open(session_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self._replay_journal(data)
+        if data is not None:
+            # version 도입 전에 기록된 세션
+            data.setdefault("version", 0)
+        return data
+
+    def save(self, data: Dict[str, Any]):
+        """
+        스냅샷 기록 (임시 파일에 쓴 뒤 교체 - 중간에 죽어도 기존 파일 유지)
+
+        잠금 안에서 저장된 version을 확인한 뒤 version + 1로 기록합니다.
+        """
+        session_id = data["session_id"]
+        session_file = self._snapshot_path(session_id)
+        with self._locked(session_id):
+            # 빈 디렉토리 정리(_remove_empty_dirs)와 겹치지 않도록 잠금 안에서 생성
+            session_file.parent.mkdir(parents=True, exist_ok=True)
+            expected = data.get("version", 0)
+            self._check_version(session_id, expected)
+            self._atomic_write(session_file, {**data, "version": expected + 1})
+            # 스냅샷이 저널 내용을 모두 포함하므로 저널 삭제
+            self._journal_path(session_id).unlink(missing_ok=True)
+            self._journal_entries.pop(session_id, None)
+            self._remember_version(session_id, expected + 1, data["user_id"])
+        self._index_user_session(data["user_id"], session_id)
+
+    def _user_index_path(self, user_id: str) -> Path:
+        digest = hashlib.sha256(user_id.encode("utf-8")).hexdigest()[:16]
+        return self.users_dir / f"{digest}.idx"
+
+    def _user_locked(self, index_file: Path, shared: bool = False):
+        """사용자 인덱스 잠금 (추가/조회는 공유, 다시 쓰기는 배타)"""
+        return self._lock_file(f"user-{index_file.stem[-2:]}.lock", shared)
+
+    @staticmethod
+    def _latest_unique(session_ids: List[str]) -> List[str]:
+        """중복 제거 (마지막에 나온 위치 기준, 순서 유지)"""
+        return list(reversed(dict.fromkeys(reversed(session_ids))))
+
+    def _index_user_session(self, user_id: str, session_id: str):
+        """사용자 인덱스 끝에 ID 추가 (기록할 때마다 - 마지막 위치가 최근 수정 순서)"""
+        self.users_dir.mkdir(parents=True, exist_ok=True)
+        index_file = self._user_index_path(user_id)
+        with self._user_locked(index_file, shared=True):
+            with open(index_file, 'a', encoding='utf-8') as f:
+                f.write(session_id + "\n")
+
+    def rebuild_user_index(self) -> int:
+        """기존 세션 전체를 스캔해 사용자 인덱스 재생성 (인덱스 도입 전 세션 포함)"""
+        by_user: Dict[str, List[Dict[str, Any]]] = {}
+        for data in self.iter_summaries():
+            by_user.setdefault(data["user_id"], []).append(data)
+
+        self.users_dir.mkdir(parents=True, exist_ok=True)
+        for user_id, summaries in by_user.items():
+            summaries.sort(key=lambda d: d["updated_at"])
+            index_file = self._user_index_path(user_id)
+            with self._user_locked(index_file):
+                existing = (
+                    index_file.read_text(encoding="utf-8").split() if index_file.exists() else []
+                )
+                # 스캔 이후 추가된 ID가 뒤에 오도록 기존 인덱스를 나중에 병합
+                merged = self._latest_unique([d["session_id"] for d in summaries] + existing)
+                self._atomic_write_text(index_file, "".join(sid + "\n" for sid in merged))
+        (self.users_dir / ".complete").touch()
+        return sum(len(summaries) for summaries in by_user.values())
+
+    def recent_for_user(self, user_id: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """사용자 인덱스의 최근 수정 ID만 로드 (디렉토리 스캔 없음)"""
+        index_file = self._user_index_path(user_id)
+        if not index_file.exists():
+            return []
+        with self._user_locked(index_file, shared=True):
+            lines = index_file.read_text(encoding="utf-8").split()
+        session_ids = self._latest_unique(lines)
+        if len(lines) > 4 * len(session_ids) + 64:
+            self._compact_user_index(index_file)
+        # 마지막에 기록된 ID일수록 최근 수정
+        candidates = session_ids[-limit * 2:]
+
+        summaries = []
+        for session_id in candidates:
+            data = self.load(session_id)
+            if data is None or data["user_id"] != user_id:
+                continue
+            summary = {f: data[f] for f in SUMMARY_FIELDS}
+            summary["answer_count"] = len(data["answers"])
+            summaries.append(summary)
+        summaries.sort(key=lambda d: d["updated_at"], reverse=True)
+        return summaries[:limit]
+
+    def _compact_user_index(self, index_file: Path):
+        """중복 ID가 쌓인 사용자 인덱스를 마지막 위치만 남겨 다시 쓰기"""
+        with self._user_locked(index_file):
+            session_ids = self._latest_unique(index_file.read_text(encoding="utf-8").split())
+            self._atomic_write_text(index_file, "".join(sid + "\n" for sid in session_ids))
+
+    def append_answers(
+        self,
+        session_id: str,
+        step: int,
+        answers: List[str],
+        updated_at: str,
+        is_completed: bool,
+        version: int
+    ) -> int:
+        """답변 저널에 한 줄 추가 (잠금 안에서 version 확인)"""
+        entry = {
+            "step": step,
+            "answers": answers,
+            "updated_at": updated_at,
+            "is_completed": is_completed,
+            "version": version + 1
+        }
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        journal_file = self._journal_path(session_id)
+        with self._locked(session_id):
+            journal_file.parent.mkdir(parents=True, exist_ok=True)
+            # 다른 프로세스가 기록했으면 다시 로드하면서 그 줄까지 포함해 저널 줄 수 갱신
+            user_id = self._check_version(session_id, version)
+            with open(journal_file, 'a', encoding='utf-8') as f:
+                f.write(line)
+            entries = self._journal_entries.get(session_id, 0) + 1
+            self._journal_entries[session_id] = entries
+            if user_id is not None:
+                self._remember_version(session_id, version + 1, user_id)
+        if user_id is not None:
+            self._index_user_session(user_id, session_id)
+        return entries
+
+    def pending(self, session_id: str) -> int:
+        return self._journal_entries.get(session_id, 0)
+
+    def recover(self) -> List[str]:
+        """압축이 필요한 세션 ID 목록 (사용자 인덱스가 없으면 여기서 한 번 재생성)"""
+        if not (self.users_dir / ".complete").exists():
+            self.rebuild_user_index()
+
+        suffix = ".journal.jsonl"
+        journals = list(self.storage_dir.glob(f"*{suffix}"))
+        for partition in self.partitions():
+            journals.extend(partition.glob(f"*/*{suffix}"))
+        return [p.name[:-len(suffix)] for p in journals]
+
+    def _replay_journal(self, data: Dict[str, Any]):
+        """스냅샷 이후의 저널 항목 재적용 (잘린 마지막 줄은 무시)"""
+        session_id = data["session_id"]
+        journal_file = self._journal_path(session_id)
+        if not journal_file.exists():
+            return
+
+        entries = 0
+        with open(journal_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    break
+                entries += 1
+                # 스냅샷에 이미 반영된 항목은 건너뜀 (압축 중 종료된 경우)
+                if entry["step"] <= data["current_step"]:
+                    continue
+                data["answers"].extend(entry["answers"])
+                data["current_step"] = entry["step"]
+                data["updated_at"] = entry["updated_at"]
+                data["is_completed"] = entry["is_completed"]
+                data["version"] = entry.get("version", data.get("version", 0) + 1)
+        self._journal_entries[session_id] = entries
+
+    @staticmethod
+    def _atomic_write_text(path: Path, text: str):
+        tmp_file = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_file.write_text(text, encoding="utf-8")
+        os.replace(tmp_file, path)
+
+    @staticmethod
+    def _atomic_write(path: Path, data: Dict[str, Any]):
+        """write-then-rename (fsync 후 os.replace)"""
+        tmp_file = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, path)
+        finally:
+            if tmp_file.exists():
+                tmp_file.unlink()
+
+    def iter_sessions(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        범위에 걸치는 날짜 디렉토리와 보관 세그먼트만 읽음
+        (이전 형식 세션은 created_at으로 거름)
+        """
+        files = []
+        for partition in self.partitions(since, until):
+            # 샤드와 무관하게 ID(생성 시각)순
+            files.extend(sorted(partition.glob("*/*.json"), key=lambda p: p.name))
+        files.extend(self.storage_dir.glob("*.json"))
+
+        seen: Set[str] = set()
+        for session_file in files:
+            try:
+                data = self.load(session_file.stem)
+            except Exception as e:
+                print(f"세션 파일 읽기 실패 ({session_file.name}): {e}", file=sys.stderr)
+                continue
+            if data is not None and _in_range(data, since, until):
+                seen.add(data["session_id"])
+                yield data
+
+        first = since.astimezone(timezone.utc).strftime("%Y-%m-%d") if since else ""
+        last = until.astimezone(timezone.utc).strftime("%Y-%m-%d") if until else "9999-12-31"
+        for partition in self.archive.partitions():
+            if partition != "legacy" and not first <= partition <= last:
+                continue
+            for data in self.archive.iter_partition(partition):
+                # 보관 직후 개별 파일 삭제 전에 종료된 경우 중복 방지
+                if data["session_id"] not in seen and _in_range(data, since, until):
+                    yield data
+
+    def archive_completed(self, after_days: float) -> int:
+        """
+        완료 후 after_days일이 지난 세션을 날짜별 세그먼트로 옮김
+
+        세그먼트/인덱스가 디스크에 기록된 뒤에만 개별 파일을 삭제합니다.
+        """
+        cutoff = datetime.now() - timedelta(days=after_days)
+        candidates: Dict[str, List[Dict[str, Any]]] = {}
+
+        # 생성 시각이 cutoff 이후인 세션은 cutoff 전에 완료될 수 없으므로 이전 날짜만 확인
+        for data in self.iter_sessions(until=cutoff.astimezone(timezone.utc)):
+            if not data["is_completed"]:
+                continue
+            if datetime.fromisoformat(data["updated_at"]) > cutoff:
+                continue
+            session_id = data["session_id"]
+            if not self._snapshot_path(session_id).exists():
+                continue  # 이미 보관됨
+            candidates.setdefault(self._archive_partition(session_id), []).append(data)
+
+        archived = 0
+        for partition, sessions in candidates.items():
+            for session_id in self.archive.append(partition, sessions):
+                with self._locked(session_id):
+                    self._snapshot_path(session_id).unlink(missing_ok=True)
+                    self._journal_path(session_id).unlink(missing_ok=True)
+                self._journal_entries.pop(session_id, None)
+                self._versions.pop(session_id, None)
+                archived += 1
+
+        # 보관으로 비워질 수 있는 것은 cutoff 이전 날짜뿐 (cutoff 당일에는 이후 생성 세션도 있음)
+        self._remove_empty_dirs(until=cutoff.astimezone(timezone.utc) - timedelta(days=1))
+        return archived
+
+    def _remove_empty_dirs(self, until: Optional[datetime] = None):
+        """until 날짜까지의 빈 샤드/날짜 디렉토리 삭제 (샤드는 기록과 같은 잠금 안에서)"""
+        for partition in self.partitions(until=until):
+            for shard in partition.iterdir():
+                if not shard.is_dir():
+                    continue
+                with self._lock_file(f"{shard.name}.lock", shared=False):
+                    try:
+                        shard.rmdir()
+                    except OSError:
+                        pass  # 비어 있지 않음
+            try:
+                partition.rmdir()
+            except OSError:
+                pass
+
+    def find(
+        self,
+        user_id: Optional[str] = None,
+        method_id: Optional[str] = None,
+        category: Optional[str] = None,
+        is_completed: Optional[bool] = None,
+        limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        """전체 파일 스캔 (세션이 많으면 SQLite 백엔드 사용)"""
+        matches = []
+        for data in self.iter_sessions():
+            if user_id is not None and data["user_id"] != user_id:
+                continue
+            if method_id is not None and data["method_id"] != method_id:
+                continue
+            if category is not None and data["category"] != category:
+                continue
+            if is_completed is not None and data["is_completed"] != is_completed:
+                continue
+            matches.append({f: data[f] for f in SUMMARY_FIELDS})
+        matches.sort(key=lambda d: d["updated_at"], reverse=True)
+        return matches[:limit]
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats: Dict[str, Any] = {
+            "backend": self.name,
+            "pending_journals": len(self._journal_entries),
+            "conflicts": self._conflicts,
+        }
+        for key, value in self.archive.get_stats().items():
+            stats[f"archive_{key}"] = value
+        return stats
+
+
+class SQLiteSessionStore(SessionStore):
+    """
+    SQLite 저장소 (WAL 모드)
+
+    - sessions: 세션 메타데이터 ((user_id, updated_at), method_id, category, is_completed,
+      updated_at 인덱스)
+    - answers: (session_id, position) 답변 행 - 답변 제출은 INSERT 한 번
+    - 스레드별 연결 사용, 쓰기는 SQLite가 직렬화 (busy_timeout 대기)
+    - version 비교는 쓰기 트랜잭션(BEGIN IMMEDIATE) 안에서 수행 (프로세스 간에도 원자적)
+    - 핫 패스 SQL은 상수 문자열로 두어 연결별 statement 캐시에서 재사용
+    """
+
+    name = "sqlite"
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS sessions (
+        session_id   TEXT PRIMARY KEY,
+        user_id      TEXT NOT NULL,
+        problem      TEXT NOT NULL,
+        category     TEXT NOT NULL,
+        method_id    TEXT NOT NULL,
+        method_name  TEXT NOT NULL,
+        current_step INTEGER NOT NULL,
+        total_steps  INTEGER NOT NULL,
+        created_at   TEXT NOT NULL,
+        updated_at   TEXT NOT NULL,
+        is_completed INTEGER NOT NULL DEFAULT 0,
+        version      INTEGER NOT NULL DEFAULT 0
+    );
+    CREATE TABLE IF NOT EXISTS answers (
+        session_id TEXT NOT NULL,
+        position   INTEGER NOT NULL,
+        answer     TEXT NOT NULL,
+        PRIMARY KEY (session_id, position)
+    ) WITHOUT ROWID;
+    CREATE INDEX IF NOT EXISTS idx_sessions_user_updated ON sessions (user_id, updated_at);
+    CREATE INDEX IF NOT EXISTS idx_sessions_method_id ON sessions (method_id);
+    CREATE INDEX IF NOT EXISTS idx_sessions_category ON sessions (category);
+    CREATE INDEX IF NOT EXISTS idx_sessions_is_completed ON sessions (is_completed);
+    CREATE INDEX IF NOT EXISTS idx_sessions_updated_at ON sessions (updated_at);
+    """
+
+    ITER_BATCH = 500  # iter_sessions 배치 크기 (SQLite 변수 한도 999 이하)
+
+    SQL_UPSERT_SESSION = (
+        "INSERT INTO sessions (session_id, user_id, problem, category, method_id, method_name, "
+        "current_step, total_steps, created_at, updated_at, is_completed, version) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+        "ON CONFLICT (session_id) DO UPDATE SET "
+        "user_id = excluded.user_id, current_step = excluded.current_step, "
+        "updated_at = excluded.updated_at, is_completed = excluded.is_completed, "
+        "version = excluded.version"
+    )
+    SQL_UPSERT_ANSWER = (
+        "INSERT OR REPLACE INTO answers (session_id, position, answer) VALUES (?, ?, ?)"
+    )
+    SQL_UPDATE_PROGRESS = (
+        "UPDATE sessions SET current_step = ?, updated_at = ?, is_completed = ?, "
+        "version = version + 1 WHERE session_id = ? AND version = ?"
+    )
+    SQL_SELECT_VERSION = "SELECT version FROM sessions WHERE session_id = ?"
+    SQL_SELECT_SESSION = f"SELECT {', '.join(SUMMARY_FIELDS)} FROM sessions WHERE session_id = ?"
+    SQL_SELECT_ANSWERS = "SELECT answer FROM answers WHERE session_id = ? ORDER BY position"
+    SQL_COUNT_ANSWERS = "SELECT COUNT(*) FROM answers WHERE session_id = ?"
+    SQL_RECENT_FOR_USER = (
+        f"SELECT {', '.join('s.' + f for f in SUMMARY_FIELDS)}, "
+        "(SELECT COUNT(*) FROM answers a WHERE a.session_id = s.session_id) "
+        "FROM sessions s WHERE s.user_id = ? ORDER BY s.updated_at DESC LIMIT ?"
+    )
+
+    def __init__(self, db_path: str = "data/user_sessions/sessions.db"):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+        conn = self._conn()
+        conn.executescript(self.SCHEMA)
+        self._conflicts = 0
+        self._add_version_column(conn)
+
+    @staticmethod
+    def _add_version_column(conn: sqlite3.Connection):
+        """version 도입 전에 만든 DB에 컬럼 추가"""
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(sessions)")}
+        if "version" in columns:
+            return
+        try:
+            conn.execute("ALTER TABLE sessions ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+        except sqlite3.OperationalError as e:
+            # 다른 프로세스가 먼저 추가한 경우
+            if "duplicate column" not in str(e):
+                raise
+
+    def _conn(self) -> sqlite3.Connection:
+        """현재 스레드의 연결 (없으면 생성)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=30.0,
+                isolation_level=None,
+                check_same_thread=False,
+                cached_statements=64
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            # WAL에서는 NORMAL로도 커밋 단위 원자성 유지 (전원 장애 시 마지막 커밋만 유실 가능)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=OFF")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def load(self, session_id: str) -> Optional[Dict[str, Any]]:
+        conn = self._conn()
+        row = conn.execute(self.SQL_SELECT_SESSION, (session_id,)).fetchone()
+        if row is None:
+            return None
+
+        data = dict(zip(SUMMARY_FIELDS, row))
+        data["is_completed"] = bool(data["is_completed"])
+        data["answers"] = [a for (a,) in conn.execute(self.SQL_SELECT_ANSWERS, (session_id,))]
+        # SessionState 필드 순서 유지
+        return {f: data[f] for f in SESSION_FIELDS}
+
+    def save(self, data: Dict[str, Any]):
+        conn = self._conn()
+        expected = data.get("version", 0)
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            self._check_version(conn, data["session_id"], expected)
+            self._write(conn, {**data, "version": expected + 1})
+
+    def _check_version(self, conn: sqlite3.Connection, session_id: str, expected: int):
+        """쓰기 트랜잭션 안에서 저장된 version 확인 (없는 세션은 통과)"""
+        row = conn.execute(self.SQL_SELECT_VERSION, (session_id,)).fetchone()
+        if row is not None and row[0] != expected:
+            self._conflicts += 1
+            raise StaleSessionError(session_id, expected, row[0])
+
+    def save_many(self, sessions: Iterator[Dict[str, Any]], batch_size: int = 500) -> int:
+        """여러 세션을 배치 트랜잭션으로 기록 (마이그레이션용)"""
+        conn = self._conn()
+        written = 0
+        batch: List[Dict[str, Any]] = []
+        for data in sessions:
+            batch.append(data)
+            if len(batch) >= batch_size:
+                written += self._write_batch(conn, batch)
+                batch = []
+        if batch:
+            written += self._write_batch(conn, batch)
+        return written
+
+    def _write_batch(self, conn: sqlite3.Connection, batch: List[Dict[str, Any]]) -> int:
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            for data in batch:
+                self._write(conn, data)
+        return len(batch)
+
+    def _write(self, conn: sqlite3.Connection, data: Dict[str, Any]):
+        session_id = data["session_id"]
+        conn.execute(self.SQL_UPSERT_SESSION, (
+            session_id, data["user_id"], data["problem"], data["category"],
+            data["method_id"], data["method_name"], data["current_step"],
+            data["total_steps"], data["created_at"], data["updated_at"],
+            int(data["is_completed"]), data.get("version", 0)
+        ))
+        conn.executemany(
+            self.SQL_UPSERT_ANSWER,
+            [(session_id, i, answer) for i, answer in enumerate(data["answers"])]
+        )
+
+    def append_answers(
+        self,
+        session_id: str,
+        step: int,
+        answers: List[str],
+        updated_at: str,
+        is_completed: bool,
+        version: int
+    ) -> int:
+        """답변 행 추가 + 진행 상태 갱신 (한 트랜잭션, 압축 불필요)"""
+        conn = self._conn()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            # version이 같을 때만 갱신 (0행이면 충돌 - 예외로 트랜잭션 롤백)
+            cursor = conn.execute(
+                self.SQL_UPDATE_PROGRESS,
+                (step, updated_at, int(is_completed), session_id, version)
+            )
+            if cursor.rowcount == 0:
+                self._check_version(conn, session_id, version)
+                # version이 맞는데 갱신된 행이 없으면 세션 행이 없음 (답변 행만 남기지 않음)
+                raise LookupError(f"세션 {session_id} 없음 - 답변을 추가할 수 없습니다")
+            (start,) = conn.execute(self.SQL_COUNT_ANSWERS, (session_id,)).fetchone()
+            conn.executemany(
+                self.SQL_UPSERT_ANSWER,
+                [(session_id, start + i, answer) for i, answer in enumerate(answers)]
+            )
+        return 0
+
+    def find(
+        self,
+        user_id: Optional[str] = None,
+        method_id: Optional[str] = None,
+        category: Optional[str] = None,
+        is_completed: Optional[bool] = None,
+        limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        clauses = []
+        params: List[Any] = []
+        for column, value in (
+            ("user_id", user_id),
+            ("method_id", method_id),
+            ("category", category),
+            ("is_completed", None if is_completed is None else int(is_completed)),
+        ):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+
+        sql = f"SELECT {', '.join(SUMMARY_FIELDS)} FROM sessions"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY updated_at DESC LIMIT ?"
+        params.append(limit)
+
+        results = []
+        for row in self._conn().execute(sql, params):
+            data = dict(zip(SUMMARY_FIELDS, row))
+            data["is_completed"] = bool(data["is_completed"])
+            results.append(data)
+        return results
+
+    def recent_for_user(self, user_id: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """(user_id, updated_at) 인덱스로 최근 세션 조회"""
+        fields = SUMMARY_FIELDS + ("answer_count",)
+        results = []
+        for row in self._conn().execute(self.SQL_RECENT_FOR_USER, (user_id, limit)):
+            data = dict(zip(fields, row))
+            data["is_completed"] = bool(data["is_completed"])
+            results.append(data)
+        return results
+
+    def iter_sessions(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        세션 행을 커서에서 배치로 읽고 배치마다 답변을 한 쿼리로 읽음
+        (ID 전체를 메모리에 올리지 않음)
+        """
+        # 정렬 가능한 ID는 생성 시각순이므로 ID 순으로 읽어 B-tree 지역성 확보
+        sql = f"SELECT {', '.join(SUMMARY_FIELDS)} FROM sessions ORDER BY session_id"
+        # 별도 연결 사용 (긴 읽기 트랜잭션이 스레드 연결의 쓰기를 막지 않도록)
+        conn = sqlite3.connect(self.db_path, timeout=30.0)
+        try:
+            cursor = conn.execute(sql)
+            while True:
+                rows = cursor.fetchmany(self.ITER_BATCH)
+                if not rows:
+                    break
+                batch = []
+                for row in rows:
+                    data = dict(zip(SUMMARY_FIELDS, row))
+                    data["is_completed"] = bool(data["is_completed"])
+                    if _in_range(data, since, until):
+                        data["answers"] = []
+                        batch.append(data)
+                if not batch:
+                    continue
+
+                by_id = {data["session_id"]: data for data in batch}
+                placeholders = ", ".join("?" * len(by_id))
+                for session_id, answer in conn.execute(
+                    "SELECT session_id, answer FROM answers "
+                    f"WHERE session_id IN ({placeholders}) ORDER BY session_id, position",
+                    list(by_id)
+                ):
+                    by_id[session_id]["answers"].append(answer)
+                for data in batch:
+                    # SessionState 필드 순서 유지
+                    yield {f: data[f] for f in SESSION_FIELDS}
+        finally:
+            conn.close()
+
+    def iter_summaries(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """답변 수를 한 쿼리로 함께 읽음 (세션별 로드 없이 커서 스트리밍)"""
+        sql = (
+            f"SELECT {', '.join('s.' + f for f in SUMMARY_FIELDS)}, "
+            "(SELECT COUNT(*) FROM answers a WHERE a.session_id = s.session_id) "
+            "FROM sessions s"
+        )
+        fields = SUMMARY_FIELDS + ("answer_count",)
+        # 별도 연결 사용 (긴 읽기 트랜잭션이 스레드 연결의 쓰기를 막지 않도록)
+        conn = sqlite3.connect(self.db_path, timeout=30.0)
+        try:
+            cursor = conn.execute(sql)
+            while True:
+                rows = cursor.fetchmany(10_000)
+                if not rows:
+                    break
+                for row in rows:
+                    data = dict(zip(fields, row))
+                    data["is_completed"] = bool(data["is_completed"])
+                    if _in_range(data, since, until):
+                        yield data
+        finally:
+            conn.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        (sessions,) = self._conn().execute("SELECT COUNT(*) FROM sessions").fetchone()
+        with self._connections_lock:
+            connections = len(self._connections)
+        return {
+            "backend": self.name,
+            "sessions": sessions,
+            "connections": connections,
+            "conflicts": self._conflicts,
+        }
+
+    def close(self):
+        """WAL 체크포인트 후 모든 연결 종료"""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                conn.close()
+            except sqlite3.Error as e:
+                print(f"SQLite 종료 실패: {e}", file=sys.stderr)
+        self._local = threading.local()
+
+
+def _in_range(data: Dict[str, Any], since: Optional[datetime], until: Optional[datetime]) -> bool:
+    """세션 생성 시각이 [since, until) 범위인지 (ID 시각 우선, 이전 형식은 created_at)"""
+    if since is None and until is None:
+        return True
+    created = session_id_time(data["session_id"])
+    if created is None:
+        created = datetime.fromisoformat(data["created_at"]).astimezone(timezone.utc)
+    if since is not None and created < since.astimezone(timezone.utc):
+        return False
+    if until is not None and created >= until.astimezone(timezone.utc):
+        return False
+    return True
+
+
+def create_store(
+    storage_dir: str = "data/user_sessions",
+    backend: Optional[str] = None
+) -> SessionStore:
+    """환경변수 설정에 따라 저장소 생성"""
+    backend = backend or os.environ.get("INNOVATION_SOCRATIC_SESSION_BACKEND", "file")
+    if backend == "sqlite":
+        db_path = os.environ.get(
+            "INNOVATION_SOCRATIC_SESSION_DB",
+            str(Path(storage_dir) / "sessions.db")
+        )
+        return SQLiteSessionStore(db_path)
+    if backend != "file":
+        print(f"알 수 없는 세션 저장소 '{backend}', file 사용", file=sys.stderr)
+    return FileSessionStore(storage_dir)
@@ -0,0 +1,55 @@
+"""
+분류 캐시 테스트 - 같은 캐시 키는 추천기 설정과 무관하게 항상 같은 분류 결과
+"""
+
+import asyncio
+
+import pytest
+
+import src.classifier as classifier_module
+import src.server as server
+from src.classification_cache import classification_cache, normalize_problem
+from src.classifier import ProblemClassifier
+
+# 같은 키로 정규화되는 문제 묶음 (트리거/대소문자/공백만 다름)
+SAME_KEY_GROUPS = [
+    ["/think 팀 생산성 개선", "팀 생산성 개선", "팀   생산성\n개선 /help"],
+    ["/THINK Market Analysis plan", "market\nanalysis   plan", "/rag market analysis plan"],
+    ["/innovate 고객 이탈 원인", "고객 이탈 원인 /done"],
+]
+
+
+def _classifier(mode: str, tmp_path) -> ProblemClassifier:
+    if mode == "keyword":
+        return ProblemClassifier()
+    pytest.importorskip("numpy")
+    from src.recommender import MethodRecommender
+    return ProblemClassifier(recommender=MethodRecommender(vectors_dir=str(tmp_path)))
+
+
+@pytest.mark.parametrize("mode", ["keyword", "embedding"])
+def test_same_key_same_result(mode, tmp_path, monkeypatch):
+    """키가 같으면 어느 문제가 먼저 분류되어도 결과가 같음"""
+    monkeypatch.setattr(classifier_module, "classifier", _classifier(mode, tmp_path))
+
+    for group in SAME_KEY_GROUPS:
+        assert len({normalize_problem(problem) for problem in group}) == 1
+        results = []
+        for problem in group:
+            # 캐시를 비우고 각 문제를 먼저 분류한 경우의 결과
+            classification_cache.clear()
+            results.append(asyncio.run(server._classify(problem)))
+        assert all(result == results[0] for result in results), group
+    classification_cache.clear()
+
+
+def test_keyword_triggers_stay_in_key():
+    """분류 키워드가 들어 있는 트리거는 지우지 않고, 단어 일부는 트리거가 아님"""
+    assert normalize_problem("/창의적 팀 운영") == "/창의적 팀 운영"
+    assert normalize_problem("/questions about team") == "/questions about team"
+    assert normalize_problem("/think 팀 운영") == "팀 운영"
+
+    classification_cache.clear()
+    assert asyncio.run(server._classify("/창의적 팀 운영"))["category"] == "creative"
+    assert asyncio.run(server._classify("/문제해결 우리 제품"))["category"] == "analytical"
+    classification_cache.clear()
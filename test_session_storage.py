@@ -0,0 +1,191 @@
+"""
+세션 저장소 테스트 - 답변 저널/압축, version 충돌 감지 (파일, SQLite 백엔드)
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from src.session import SessionManager
+from src.storage import (
+    FileSessionStore,
+    SessionStore,
+    SQLiteSessionStore,
+    StaleSessionError,
+    new_session_id,
+)
+
+BACKENDS = ["file", "sqlite"]
+
+
+def _open_store(backend: str, storage_dir) -> SessionStore:
+    if backend == "sqlite":
+        return SQLiteSessionStore(str(storage_dir / "sessions.db"))
+    return FileSessionStore(str(storage_dir))
+
+
+def _new_session(total_steps: int = 10) -> dict:
+    now = datetime.now().isoformat()
+    return {
+        "session_id": new_session_id(),
+        "user_id": "tester",
+        "problem": "팀 생산성 개선",
+        "category": "organizational",
+        "method_id": "question_storming",
+        "method_name": "Question Storming",
+        "current_step": 0,
+        "total_steps": total_steps,
+        "answers": [],
+        "created_at": now,
+        "updated_at": now,
+        "is_completed": False,
+        "version": 0,
+    }
+
+
+@pytest.fixture(params=BACKENDS)
+def store(request, tmp_path):
+    store = _open_store(request.param, tmp_path)
+    yield store
+    store.close()
+
+
+def test_append_load_round_trip(store):
+    """저장 → 답변 추가 → 로드하면 답변/단계/version이 모두 반영됨"""
+    data = _new_session(total_steps=3)
+    store.save(data)
+    session_id = data["session_id"]
+
+    store.append_answers(session_id, 2, ["첫 답변", "둘째 답변"], "2026-01-01T10:00:00", False, 1)
+    store.append_answers(session_id, 3, ["셋째 답변"], "2026-01-01T10:05:00", True, 2)
+
+    loaded = store.load(session_id)
+    assert loaded["answers"] == ["첫 답변", "둘째 답변", "셋째 답변"]
+    assert loaded["current_step"] == 3
+    assert loaded["updated_at"] == "2026-01-01T10:05:00"
+    assert loaded["is_completed"] is True
+    assert loaded["version"] == 3
+
+
+def test_journal_replay_after_crash(tmp_path):
+    """압축 전에 종료돼도 다음 프로세스가 저널을 재적용하고, 잘린 마지막 줄은 무시"""
+    store = FileSessionStore(str(tmp_path))
+    data = _new_session()
+    store.save(data)
+    session_id = data["session_id"]
+    store.append_answers(session_id, 1, ["a"], "2026-01-01T10:00:00", False, 1)
+    store.append_answers(session_id, 2, ["b"], "2026-01-01T10:01:00", False, 2)
+    # 기록 도중 종료된 줄
+    with open(store._journal_path(session_id), "a", encoding="utf-8") as f:
+        f.write(json.dumps({"step": 3, "answers": ["c"]})[:12])
+
+    # 재시작한 프로세스
+    restarted = FileSessionStore(str(tmp_path))
+    loaded = restarted.load(session_id)
+    assert loaded["answers"] == ["a", "b"]
+    assert loaded["current_step"] == 2
+    assert loaded["version"] == 3
+    assert session_id in restarted.recover()
+
+    # 시작 시 복구가 저널을 스냅샷으로 압축
+    manager = SessionManager(str(tmp_path), store=restarted, flush_policy="always")
+    assert manager.recover() == 1
+    assert not restarted._journal_path(session_id).exists()
+    assert restarted.load(session_id)["answers"] == ["a", "b"]
+    manager.close()
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_compaction_rollover(backend, tmp_path):
+    """compact_every번째 답변마다 저널을 스냅샷으로 압축하고 남은 줄만 저널에 유지"""
+    store = _open_store(backend, tmp_path)
+    manager = SessionManager(str(tmp_path), store=store, flush_policy="always")
+    manager.compact_every = 3
+    session = manager.create_session(
+        "tester", "팀 생산성 개선", "organizational", "question_storming", "Question Storming", 10
+    )
+
+    for i in range(7):
+        assert manager.add_answer(f"답변 {i}", session)
+
+    if backend == "file":
+        # 3번째, 6번째 답변에서 압축 → 7번째 답변 한 줄만 저널에 남음
+        assert store.pending(session.session_id) == 1
+        journal = store._journal_path(session.session_id).read_text(encoding="utf-8")
+        assert len(journal.splitlines()) == 1
+    else:
+        assert store.pending(session.session_id) == 0
+
+    loaded = store.load(session.session_id)
+    assert loaded["answers"] == [f"답변 {i}" for i in range(7)]
+    assert loaded["current_step"] == 7
+    assert loaded["version"] == session.version
+    manager.close()
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_stale_append_rejected(backend, tmp_path):
+    """다른 작업자가 먼저 기록한 version으로 답변을 추가하면 거부되고 기록되지 않음"""
+    first, second = _open_store(backend, tmp_path), _open_store(backend, tmp_path)
+    data = _new_session()
+    first.save(data)
+    session_id = data["session_id"]
+    assert first.load(session_id)["version"] == 1
+
+    # 두 작업자가 같은 version 1을 읽은 뒤 second가 먼저 기록
+    second.append_answers(session_id, 1, ["second"], "2026-01-01T10:00:00", False, 1)
+    with pytest.raises(StaleSessionError) as excinfo:
+        first.append_answers(session_id, 1, ["first"], "2026-01-01T10:00:01", False, 1)
+    assert (excinfo.value.expected, excinfo.value.actual) == (1, 2)
+
+    loaded = first.load(session_id)
+    assert loaded["answers"] == ["second"]
+    assert loaded["version"] == 2
+    first.close()
+    second.close()
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_stale_save_rejected(backend, tmp_path):
+    """스냅샷 기록도 저장된 version이 다르면 거부 (먼저 기록한 내용 유지)"""
+    first, second = _open_store(backend, tmp_path), _open_store(backend, tmp_path)
+    data = _new_session()
+    first.save(data)
+    stale = {**first.load(data["session_id"]), "updated_at": "2026-01-01T10:00:01"}
+    second.save({**second.load(data["session_id"]), "updated_at": "2026-01-01T10:00:00"})
+
+    with pytest.raises(StaleSessionError) as excinfo:
+        first.save(stale)
+    assert (excinfo.value.expected, excinfo.value.actual) == (1, 2)
+    loaded = first.load(data["session_id"])
+    assert loaded["updated_at"] == "2026-01-01T10:00:00"
+    assert loaded["version"] == 2
+    first.close()
+    second.close()
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_manager_rolls_back_stale_answer(backend, tmp_path):
+    """다른 프로세스가 먼저 답변한 세션에 답변하면 메모리 변경을 되돌리고 예외 전달"""
+    first = SessionManager(str(tmp_path), store=_open_store(backend, tmp_path))
+    second = SessionManager(str(tmp_path), store=_open_store(backend, tmp_path))
+    session = first.create_session(
+        "tester", "팀 생산성 개선", "organizational", "question_storming", "Question Storming", 10
+    )
+    other = second.load_session(session.session_id)
+    assert second.add_answer("second", other)
+
+    with pytest.raises(StaleSessionError):
+        first.add_answer("first", session)
+    assert session.answers == ()
+    assert session.current_step == 0
+
+    # 다시 불러온 상태로는 이어서 답변 가능
+    first.cache.discard(session.session_id)
+    reloaded = first.load_session(session.session_id)
+    assert reloaded.answers == ("second",)
+    assert first.add_answer("first", reloaded)
+    assert second.store.load(session.session_id)["answers"] == ["second", "first"]
+    first.close()
+    second.close()